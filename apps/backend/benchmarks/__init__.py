@@ -0,0 +1 @@
+"""Standalone performance benchmarks (run from apps/backend)."""
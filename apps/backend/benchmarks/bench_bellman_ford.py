@@ -0,0 +1,91 @@
+"""
+Bellman-Ford rounds vs queue (SPFA) mode on scenario graphs.
+
+Each scenario runs as generated (no arbitrage, so both modes must converge)
+and with an injected profitable USD -> EUR -> GBP -> USD loop, where the
+queue mode can stop at the first cycle.
+
+Usage (from apps/backend):
+    python -m benchmarks.bench_bellman_ford --scale 1 4 16
+"""
+
+import argparse
+
+from src.algorithms import shortest_path
+from src.algorithms.graph import Graph
+from src.generation.scenarios import get_scenario
+from src.graph.builder import GraphBuilder
+from src.models import CostModel
+
+from .common import best_of
+
+ARBITRAGE_LOOP = [("USD", "EUR"), ("EUR", "GBP"), ("GBP", "USD")]
+
+
+def scenario_edges(scenario_id: str, scale: int):
+    """Scenario edges, copied ``scale`` times into linked layers."""
+    values, info = get_scenario(scenario_id)
+    payload = GraphBuilder(CostModel(base_cost=10, extra_cost=5)).build_graph(
+        values, info.nodes, info.pairs
+    )
+
+    nodes = []
+    edges = []
+    for layer in range(scale):
+        suffix = f"#{layer}" if layer else ""
+        nodes.extend(node.id + suffix for node in payload.nodes)
+        edges.extend(
+            (e.source + suffix, e.target + suffix, e.weight_cost, e.weight_neglog)
+            for e in payload.edges
+        )
+        if layer:
+            previous = f"#{layer - 1}" if layer > 1 else ""
+            edges.append(("USD" + previous, "USD" + suffix, 0.0, 0.0))
+            edges.append(("USD" + suffix, "USD" + previous, 0.0, 0.0))
+    return nodes, edges
+
+
+def with_arbitrage(edges):
+    loop = set(ARBITRAGE_LOOP)
+    return [
+        (u, v, w_cost, w_neglog - 0.05 if (u, v) in loop else w_neglog)
+        for u, v, w_cost, w_neglog in edges
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", nargs="+", default=["negative_cycle", "dense_graph"])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    header = f"{'scenario':>15} {'scale':>5} {'nodes':>6} {'variant':>10} {'rounds ms':>10} {'queue ms':>9} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for scenario_id in args.scenarios:
+        for scale in args.scale:
+            nodes, edges = scenario_edges(scenario_id, scale)
+            for variant, variant_edges in (
+                ("plain", edges),
+                ("arbitrage", with_arbitrage(edges)),
+            ):
+                graph = Graph(nodes, variant_edges, directed=True)
+                timings = []
+                for mode in ("rounds", "queue"):
+                    timings.append(
+                        best_of(
+                            lambda: shortest_path.bellman_ford(graph, "USD", mode=mode),
+                            args.repeat,
+                        )
+                    )
+                rounds, queue = timings
+                print(
+                    f"{scenario_id:>15} {scale:>5} {len(nodes):>6} {variant:>10} "
+                    f"{rounds * 1e3:>10.2f} {queue * 1e3:>9.2f} {rounds / queue:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
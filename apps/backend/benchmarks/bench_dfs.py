@@ -0,0 +1,94 @@
+"""
+Iterative DFS on deep graphs: chains and binary trees.
+
+The recursive reference (the implementation DFS used before it switched to
+an explicit stack) only runs up to --recursive-max nodes, with the
+recursion limit raised for it; beyond that it would exhaust the C stack.
+
+Usage (from apps/backend):
+    python -m benchmarks.bench_dfs --sizes 10000 100000 1000000
+"""
+
+import argparse
+import sys
+
+from src.algorithms import traversal
+from src.algorithms.csr import CSRGraph
+from src.algorithms.graph import Graph
+
+from .common import best_of
+
+
+def chain_edges(num_nodes: int):
+    nodes = [f"N{i:07d}" for i in range(num_nodes)]
+    edges = [(nodes[i], nodes[i + 1], 1.0, 0.0) for i in range(num_nodes - 1)]
+    return nodes, edges
+
+
+def tree_edges(num_nodes: int):
+    nodes = [f"N{i:07d}" for i in range(num_nodes)]
+    edges = [(nodes[(i - 1) // 2], nodes[i], 1.0, 0.0) for i in range(1, num_nodes)]
+    return nodes, edges
+
+
+def recursive_dfs(graph: Graph, start: str) -> traversal.DFSResult:
+    order = []
+    parent = {start: None}
+    discovery_time = {}
+    finish_time = {}
+    visited = set()
+    time = [0]
+
+    def dfs_visit(u: str) -> None:
+        time[0] += 1
+        discovery_time[u] = time[0]
+        visited.add(u)
+        order.append(u)
+
+        for edge in graph.get_neighbors(u):
+            v = edge.to
+            if v not in visited:
+                parent[v] = u
+                dfs_visit(v)
+
+        time[0] += 1
+        finish_time[u] = time[0]
+
+    dfs_visit(start)
+    return traversal.DFSResult(order, parent, discovery_time, finish_time)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--recursive-max", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = f"{'shape':>6} {'nodes':>8} {'recursive s':>12} {'iterative s':>12} {'csr s':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for shape, build in (("chain", chain_edges), ("tree", tree_edges)):
+        for size in args.sizes:
+            nodes, edges = build(size)
+            graph = Graph(nodes, edges, directed=True)
+            csr = CSRGraph.from_graph(graph)
+            start = nodes[0]
+
+            recursive = "-"
+            if size <= args.recursive_max:
+                limit = sys.getrecursionlimit()
+                sys.setrecursionlimit(size + 1000)
+                try:
+                    recursive = f"{best_of(lambda: recursive_dfs(graph, start), args.repeat):.3f}"
+                finally:
+                    sys.setrecursionlimit(limit)
+
+            iterative = best_of(lambda: traversal.dfs(graph, start), args.repeat)
+            compact = best_of(lambda: traversal.dfs(csr, start), args.repeat)
+            print(f"{shape:>6} {size:>8} {recursive:>12} {iterative:>12.3f} {compact:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Array-backed DisjointSet vs the dict-backed mst.UnionFind.
+
+Runs one union per edge of a random graph, then a find for every node,
+with UnionFind keyed by node names (as Kruskal used it) and DisjointSet by
+node indices. Also times mst_kruskal end to end.
+
+Usage (from apps/backend):
+    python -m benchmarks.bench_disjoint_set --edges 100000 1000000
+"""
+
+import argparse
+
+from src.algorithms import mst
+from src.algorithms.disjoint_set import DisjointSet
+from src.algorithms.graph import Graph
+
+from .common import best_of, random_edges
+
+
+def run_union_find(nodes, named_edges) -> int:
+    uf = mst.UnionFind(nodes)
+    for u, v in named_edges:
+        uf.union(u, v)
+    return len({uf.find(node) for node in nodes})
+
+
+def run_disjoint_set(num_nodes, indexed_edges) -> int:
+    ds = DisjointSet(num_nodes)
+    for u, v in indexed_edges:
+        ds.union(u, v)
+    for x in range(num_nodes):
+        ds.find(x)
+    return ds.num_sets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--edges", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = f"{'nodes':>8} {'edges':>8} {'UnionFind s':>12} {'DisjointSet s':>14} {'speedup':>8} {'kruskal s':>10}"
+    print(header)
+    print("-" * len(header))
+
+    for num_edges in args.edges:
+        nodes, edges = random_edges(num_edges // args.degree, args.degree)
+        index = {node: i for i, node in enumerate(nodes)}
+        named_edges = [(u, v) for u, v, _, _ in edges]
+        indexed_edges = [(index[u], index[v]) for u, v in named_edges]
+
+        assert run_union_find(nodes, named_edges) == run_disjoint_set(
+            len(nodes), indexed_edges
+        )
+        union_find = best_of(lambda: run_union_find(nodes, named_edges), args.repeat)
+        disjoint_set = best_of(
+            lambda: run_disjoint_set(len(nodes), indexed_edges), args.repeat
+        )
+
+        graph = Graph(nodes, edges, directed=False)
+        kruskal = best_of(lambda: mst.mst_kruskal(graph), args.repeat)
+
+        print(
+            f"{len(nodes):>8} {len(edges):>8} {union_find:>12.3f} {disjoint_set:>14.3f} "
+            f"{union_find / disjoint_set:>8.2f} {kruskal:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+All-pairs engine timings and blocked-engine scaling by worker count.
+
+Johnson is timed next to the numpy engine at the same sizes; lower --degree
+to see where it overtakes Floyd-Warshall on sparse graphs.
+
+Usage (from apps/backend):
+    python -m benchmarks.bench_floyd_warshall --sizes 500 1000 2000 --workers 1 2 4 8
+"""
+
+import argparse
+
+from src.algorithms import all_pairs
+from src.algorithms.graph import Graph
+
+from .common import best_of, random_edges
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--block-size", type=int, default=all_pairs.DEFAULT_BLOCK_SIZE)
+    parser.add_argument("--degree", type=int, default=16)
+    parser.add_argument("--python-max", type=int, default=200,
+                        help="Largest size timed with the pure-Python engine")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    header = f"{'nodes':>6} {'engine':>8} {'workers':>8} {'seconds':>9} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for size in args.sizes:
+        nodes, edges = random_edges(size, args.degree)
+        graph = Graph(nodes, edges, directed=True)
+
+        if size <= args.python_max:
+            seconds = best_of(
+                lambda: all_pairs.floyd_warshall(graph, "cost", engine="python"),
+                args.repeat,
+            )
+            print(f"{size:>6} {'python':>8} {'-':>8} {seconds:>9.3f} {'':>8}")
+
+        baseline = best_of(
+            lambda: all_pairs.floyd_warshall(graph, "cost", engine="numpy"),
+            args.repeat,
+        )
+        print(f"{size:>6} {'numpy':>8} {'-':>8} {baseline:>9.3f} {1.0:>8.2f}")
+
+        seconds = best_of(
+            lambda: all_pairs.floyd_warshall(graph, "cost", engine="johnson"),
+            args.repeat,
+        )
+        print(
+            f"{size:>6} {'johnson':>8} {'-':>8} {seconds:>9.3f} "
+            f"{baseline / seconds:>8.2f}"
+        )
+
+        for workers in args.workers:
+            seconds = best_of(
+                lambda: all_pairs.floyd_warshall(
+                    graph,
+                    "cost",
+                    engine="blocked",
+                    block_size=args.block_size,
+                    workers=workers,
+                ),
+                args.repeat,
+            )
+            print(
+                f"{size:>6} {'blocked':>8} {workers:>8} {seconds:>9.3f} "
+                f"{baseline / seconds:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
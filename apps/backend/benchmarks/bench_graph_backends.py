@@ -0,0 +1,63 @@
+"""
+Compare the dict-backed Graph with the CSR backend.
+
+Reports construction memory (tracemalloc) and BFS/Dijkstra/Prim timings on
+random graphs. See bench_dfs for DFS on deep graphs.
+
+Usage (from apps/backend):
+    python -m benchmarks.bench_graph_backends --sizes 1000 10000 50000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from src.algorithms import mst, shortest_path, traversal
+from src.algorithms.csr import CSRGraph
+from src.algorithms.graph import Graph
+
+from .common import best_of, random_edges
+
+
+def measure_memory(factory) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    graph = factory()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return graph, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 50000])
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = f"{'nodes':>7} {'edges':>8} {'backend':>7} {'memory MB':>10} {'bfs s':>8} {'dijkstra s':>11} {'prim s':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for size in args.sizes:
+        nodes, edges = random_edges(size, args.degree)
+        start = nodes[0]
+
+        for name, cls in (("dict", Graph), ("csr", CSRGraph)):
+            graph, memory = measure_memory(lambda: cls(nodes, edges, directed=True))
+            undirected = graph.to_undirected()
+
+            bfs_time = best_of(lambda: traversal.bfs(graph, start), args.repeat)
+            dijkstra_time = best_of(
+                lambda: shortest_path.dijkstra(graph, start), args.repeat
+            )
+            prim_time = best_of(lambda: mst.mst_prim(undirected), args.repeat)
+
+            print(
+                f"{size:>7} {len(edges):>8} {name:>7} {memory / 1e6:>10.1f} "
+                f"{bfs_time:>8.3f} {dijkstra_time:>11.3f} {prim_time:>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Lazy heapq vs indexed decrease-key heap for Dijkstra and Prim.
+
+Graphs are the fully connected currency scenario scaled up: the 27 base
+currencies are repeated with slightly shifted values until there are
+--nodes nodes, and GraphBuilder generates every directed pair. Time is the
+best of --repeat runs; memory is the tracemalloc peak of one run, which is
+dominated by the priority queue (the lazy heap holds one entry per
+relaxation, the indexed heap at most one per node).
+
+Usage (from apps/backend):
+    python -m benchmarks.bench_heaps --nodes 27 500 1000 2000
+"""
+
+import argparse
+import tracemalloc
+
+from src.algorithms import mst, shortest_path
+from src.algorithms.csr import CSRGraph
+from src.generation.scenarios import BASE_VALUES
+from src.graph.builder import GraphBuilder
+from src.models import CostModel
+
+from .common import best_of
+
+
+def scaled_scenario(num_nodes: int) -> CSRGraph:
+    bases = sorted(BASE_VALUES)
+    values = {}
+    for i in range(num_nodes):
+        base = bases[i % len(bases)]
+        copy = i // len(bases)
+        values[f"{base}{copy:03d}"] = BASE_VALUES[base] * (1 + 0.001 * copy)
+
+    columns = GraphBuilder(CostModel(base_cost=10, extra_cost=5)).build_columns(
+        values, list(values)
+    )
+    return CSRGraph(columns.nodes, columns.edge_tuples(), directed=True)
+
+
+def peak_kib(fn) -> float:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[27, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = (
+        f"{'nodes':>6} {'edges':>8} {'algorithm':>9} {'lazy s':>8} {'indexed s':>10} "
+        f"{'lazy KiB':>9} {'indexed KiB':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for num_nodes in args.nodes:
+        graph = scaled_scenario(num_nodes)
+        undirected = graph.to_undirected()
+        source = graph.nodes[0]
+        runs = {
+            "dijkstra": lambda heap: shortest_path.dijkstra(graph, source, heap=heap),
+            "prim": lambda heap: mst.mst_prim(undirected, heap=heap),
+        }
+
+        for name, run in runs.items():
+            lazy = best_of(lambda: run("lazy"), args.repeat)
+            indexed = best_of(lambda: run("indexed"), args.repeat)
+            lazy_kib = peak_kib(lambda: run("lazy"))
+            indexed_kib = peak_kib(lambda: run("indexed"))
+
+            print(
+                f"{num_nodes:>6} {graph.num_edges:>8} {name:>9} {lazy:>8.3f} "
+                f"{indexed:>10.3f} {lazy_kib:>9.0f} {indexed_kib:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
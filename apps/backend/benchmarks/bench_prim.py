@@ -0,0 +1,69 @@
+"""
+Heap-based Prim vs the dense O(V^2) engine across edge densities.
+
+Each graph is a random undirected CSR graph in which every node pair is
+connected with probability --densities. Times are the best of --repeat
+runs on the undirected projection, which is what /algorithms/mst/prim
+receives; they set mst.DENSE_PRIM_MIN_DENSITY.
+
+Usage (from apps/backend):
+    python -m benchmarks.bench_prim --nodes 250 1000 --densities 0.05 0.2 1.0
+"""
+
+import argparse
+import random
+
+from src.algorithms import mst
+from src.algorithms.csr import CSRGraph
+
+from .common import best_of
+
+
+def random_undirected(num_nodes: int, density: float, seed: int = 42) -> CSRGraph:
+    rng = random.Random(seed)
+    nodes = [f"N{i:06d}" for i in range(num_nodes)]
+    edges = [
+        (nodes[u], nodes[v], rng.uniform(1.0, 20.0), 0.0)
+        for u in range(num_nodes)
+        for v in range(u + 1, num_nodes)
+        if rng.random() < density
+    ]
+    return CSRGraph(nodes, edges, directed=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[250, 1000])
+    parser.add_argument(
+        "--densities", type=float, nargs="+", default=[0.02, 0.05, 0.1, 0.2, 0.5, 1.0]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = (
+        f"{'nodes':>6} {'density':>8} {'edges':>8} {'lazy s':>8} {'indexed s':>10} "
+        f"{'dense s':>8} {'auto':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for num_nodes in args.nodes:
+        for density in args.densities:
+            graph = random_undirected(num_nodes, density)
+
+            expected = mst.mst_prim(graph)
+            assert mst.mst_prim_dense(graph).total_cost == expected.total_cost
+
+            lazy = best_of(lambda: mst.mst_prim(graph), args.repeat)
+            indexed = best_of(lambda: mst.mst_prim(graph, heap="indexed"), args.repeat)
+            dense = best_of(lambda: mst.mst_prim_dense(graph), args.repeat)
+            auto = "dense" if mst.prefers_dense_prim(graph) else "heap"
+
+            print(
+                f"{num_nodes:>6} {density:>8.2f} {graph.num_edges // 2:>8} "
+                f"{lazy:>8.3f} {indexed:>10.3f} {dense:>8.3f} {auto:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Shared helpers for benchmark scripts."""
+
+import random
+import time
+from typing import Callable, List, Tuple
+
+
+def random_edges(
+    num_nodes: int, out_degree: int, seed: int = 42
+) -> Tuple[List[str], List[Tuple[str, str, float, float]]]:
+    """Random directed graph with a fixed out-degree and positive weights."""
+    rng = random.Random(seed)
+    nodes = [f"N{i:06d}" for i in range(num_nodes)]
+    edges = []
+    for u in nodes:
+        for v in rng.sample(nodes, out_degree):
+            if u != v:
+                edges.append((u, v, rng.uniform(1.0, 20.0), rng.uniform(0.0, 0.5)))
+    return nodes, edges
+
+
+def best_of(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Best wall-clock time of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
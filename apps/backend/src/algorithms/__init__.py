@@ -1,5 +1,7 @@
 """Graph algorithms."""
 
+from .csr import CSRGraph
+from .disjoint_set import DisjointSet, connected_components
 from .graph import Graph, Edge
 
-__all__ = ["Graph", "Edge"]
+__all__ = ["Graph", "Edge", "CSRGraph", "DisjointSet", "connected_components"]
@@ -1,8 +1,31 @@
-"""All-pairs shortest path algorithms: Floyd-Warshall."""
+"""All-pairs shortest path algorithms: Floyd-Warshall and Johnson."""
 
+import heapq
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
 from typing import Dict, List, Literal, Optional, Tuple
 
+import numpy as np
+
+from .csr import GraphLike
 from .graph import Graph
+from .shortest_path import bellman_ford
+
+FloydWarshallEngine = Literal["numpy", "python", "blocked", "johnson", "auto"]
+
+DEFAULT_BLOCK_SIZE = 256
+
+# auto picks Johnson when V^2 > JOHNSON_MIN_RATIO * E * log2(V). Johnson
+# costs V Dijkstra runs of ~E log V interpreted heap steps; the numpy
+# engine V pivots of V^2 vectorized updates, about 32x cheaper per step
+# (crossover measured with benchmarks/bench_floyd_warshall.py: chains of
+# 400 nodes still favour numpy, 800 favour Johnson).
+JOHNSON_MIN_RATIO = 32
 
 
 class FloydWarshallResult:
@@ -13,18 +36,124 @@ class FloydWarshallResult:
         central_node: Optional[str],
         centrality: Dict[str, Dict[str, float]],
         centrality_note: str,
+        engine: str = "numpy",
+        negative_cycle_found: bool = False,
+        cycle: Optional[List[str]] = None,
     ):
         self.node_order = node_order
         self.distance_matrix = distance_matrix
         self.central_node = central_node
         self.centrality = centrality
         self.centrality_note = centrality_note
+        self.engine = engine
+        self.negative_cycle_found = negative_cycle_found
+        self.cycle = cycle
 
 
 def floyd_warshall(
-    graph: Graph, weight_mode: Literal["cost", "neglog"] = "cost"
+    graph: GraphLike,
+    weight_mode: Literal["cost", "neglog"] = "cost",
+    engine: FloydWarshallEngine = "numpy",
+    block_size: Optional[int] = None,
+    workers: Optional[int] = None,
 ) -> FloydWarshallResult:
+    """
+    All-pairs shortest paths.
+
+    Engines:
+        numpy: vectorized k-loop over a dense float64 matrix (default)
+        python: pure-Python triple loop, kept as the reference implementation
+        blocked: tiled Floyd-Warshall; phase-2/3 tiles run in a process pool
+            over a shared-memory matrix (block_size, workers)
+        johnson: one Bellman-Ford reweighting plus V Dijkstra runs, for
+            sparse graphs (E much smaller than V^2)
+        auto: johnson when prefers_johnson(graph), numpy otherwise
+
+    numpy and python produce identical distances, central node and
+    tie-breaking. The blocked and johnson engines sum paths in a different
+    order, so with non-integral weights distances may differ in the last
+    bits; with negative cycles blocked distances are not comparable.
+
+    If the Johnson reweighting finds a negative cycle, the cycle is reported
+    like BellmanFordResult.cycle and the matrix comes from the numpy engine.
+    """
     nodes = sorted(graph.nodes)
+
+    if engine == "auto":
+        engine = "johnson" if prefers_johnson(graph) else "numpy"
+
+    cycle: Optional[List[str]] = None
+
+    if engine == "johnson":
+        matrix, cycle = _johnson(graph, nodes, weight_mode)
+        if matrix is None:
+            matrix = _floyd_warshall_numpy(_initial_matrix(graph, nodes, weight_mode))
+        central_node, centrality = _calculate_centrality_numpy(nodes, matrix)
+        dist = matrix.tolist()
+    elif engine in ("numpy", "blocked"):
+        matrix = _initial_matrix(graph, nodes, weight_mode)
+        if engine == "numpy":
+            matrix = _floyd_warshall_numpy(matrix)
+        else:
+            matrix = _floyd_warshall_blocked(
+                matrix, block_size or DEFAULT_BLOCK_SIZE, workers
+            )
+        central_node, centrality = _calculate_centrality_numpy(nodes, matrix)
+        dist = matrix.tolist()
+    elif engine == "python":
+        dist = _floyd_warshall_python(graph, nodes, weight_mode)
+        central_node, centrality = _calculate_centrality(nodes, dist)
+    else:
+        raise ValueError(f"Unknown Floyd-Warshall engine: {engine}")
+
+    return _build_result(nodes, dist, central_node, centrality, engine, cycle)
+
+
+def prefers_johnson(graph: GraphLike) -> bool:
+    """True if Johnson should beat the numpy engine on a graph of this size."""
+    n = len(graph.nodes)
+    if n < 2:
+        return False
+    return n * n > JOHNSON_MIN_RATIO * graph.num_edges * math.log2(n)
+
+
+def _build_result(
+    nodes: List[str],
+    dist: List[List[float]],
+    central_node: Optional[str],
+    centrality: Dict[str, Dict[str, float]],
+    engine: str,
+    cycle: Optional[List[str]] = None,
+) -> FloydWarshallResult:
+    INF = float("inf")
+
+    distance_matrix: Dict[str, Dict[str, Optional[float]]] = {}
+    for i, u in enumerate(nodes):
+        distance_matrix[u] = {}
+        for j, v in enumerate(nodes):
+            distance_matrix[u][v] = None if dist[i][j] == INF else dist[i][j]
+
+    centrality_note = (
+        "Central node determined by: "
+        "(1) maximize reachable_count, "
+        "(2) minimize sum_distance (finite only)"
+    )
+
+    return FloydWarshallResult(
+        node_order=nodes,
+        distance_matrix=distance_matrix,
+        central_node=central_node,
+        centrality=centrality,
+        centrality_note=centrality_note,
+        engine=engine,
+        negative_cycle_found=cycle is not None,
+        cycle=cycle,
+    )
+
+
+def _floyd_warshall_python(
+    graph: GraphLike, nodes: List[str], weight_mode: str
+) -> List[List[float]]:
     n = len(nodes)
 
     INF = float("inf")
@@ -47,27 +176,346 @@ def floyd_warshall(
                 if dist[i][k] != INF and dist[k][j] != INF:
                     dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
 
-    distance_matrix: Dict[str, Dict[str, Optional[float]]] = {}
+    return dist
+
+
+def _initial_matrix(
+    graph: GraphLike, nodes: List[str], weight_mode: str
+) -> np.ndarray:
+    """Dense distance matrix with 0 on the diagonal and inf for missing edges."""
+    n = len(nodes)
+    node_to_idx = {node: i for i, node in enumerate(nodes)}
+
+    dist = np.full((n, n), np.inf)
+    np.fill_diagonal(dist, 0.0)
+
     for i, u in enumerate(nodes):
-        distance_matrix[u] = {}
-        for j, v in enumerate(nodes):
-            distance_matrix[u][v] = None if dist[i][j] == INF else dist[i][j]
+        for edge in graph.get_neighbors(u):
+            weight = edge.weight_cost if weight_mode == "cost" else edge.weight_neglog
+            dist[i, node_to_idx[edge.to]] = weight
 
-    central_node, centrality = _calculate_centrality(nodes, dist)
+    return dist
 
-    centrality_note = (
-        "Central node determined by: "
-        "(1) maximize reachable_count, "
-        "(2) minimize sum_distance (finite only)"
-    )
 
-    return FloydWarshallResult(
-        node_order=nodes,
-        distance_matrix=distance_matrix,
-        central_node=central_node,
-        centrality=centrality,
-        centrality_note=centrality_note,
+def _floyd_warshall_numpy(dist: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Floyd-Warshall, updating ``dist`` in place.
+
+    While dist[k, k] >= 0, row k and column k cannot change during pivot k,
+    so one broadcast update equals the reference in-place triple loop. A
+    negative diagonal (negative cycle through k) makes the reference order
+    observable, so those pivots replay it row by row.
+    """
+    n = dist.shape[0]
+
+    for k in range(n):
+        if dist[k, k] >= 0:
+            np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+        else:
+            _relax_pivot_in_order(dist, k)
+
+    return dist
+
+
+def _relax_pivot_in_order(dist: np.ndarray, k: int) -> None:
+    """Apply pivot k exactly as the reference engine's i/j loop order does."""
+    row_k = dist[k]
+
+    for i in range(dist.shape[0]):
+        d_ik = dist[i, k]
+        if d_ik == np.inf:
+            continue
+
+        row = dist[i]
+        # Columns before k see the old dist[i, k]; columns after k the new one
+        np.minimum(row[:k], d_ik + row_k[:k], out=row[:k])
+        d_ik = min(d_ik, d_ik + row_k[k])
+        row[k] = d_ik
+        np.minimum(row[k + 1 :], d_ik + row_k[k + 1 :], out=row[k + 1 :])
+
+
+def _floyd_warshall_blocked(
+    dist: np.ndarray, block_size: int, workers: Optional[int] = None
+) -> np.ndarray:
+    """
+    Blocked Floyd-Warshall over block_size x block_size tiles.
+
+    For each diagonal tile kb: phase 1 closes the diagonal tile, phase 2
+    updates the tiles in row kb and column kb, phase 3 updates all remaining
+    tiles. Tiles within a phase only read tiles finished in earlier phases,
+    so phase-2/3 tiles are independent and are spread over the long-lived
+    pool from _blocked_pool(). The matrix lives in a shared memory segment
+    per call and tasks carry only its name and tile coordinates, so it is
+    never pickled.
+    """
+    n = dist.shape[0]
+    if n == 0:
+        return dist
+
+    num_blocks = -(-n // block_size)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, (num_blocks - 1) ** 2 or 1))
+
+    if workers == 1:
+        for kb in range(num_blocks):
+            for tiles in _blocked_phases(kb, num_blocks):
+                _update_tiles(dist, kb, block_size, tiles)
+        return dist
+
+    executor = _blocked_pool()
+    shm = shared_memory.SharedMemory(create=True, size=dist.nbytes)
+    try:
+        shared = np.ndarray(dist.shape, dtype=dist.dtype, buffer=shm.buf)
+        shared[:] = dist
+
+        for kb in range(num_blocks):
+            phase_1, *parallel_phases = _blocked_phases(kb, num_blocks)
+            _update_tiles(shared, kb, block_size, phase_1)
+
+            for tiles in parallel_phases:
+                chunks = [tiles[w::workers] for w in range(workers)]
+                chunks = [chunk for chunk in chunks if chunk]
+                try:
+                    list(
+                        executor.map(
+                            _update_shared_tiles,
+                            [shm.name] * len(chunks),
+                            [dist.shape] * len(chunks),
+                            [kb] * len(chunks),
+                            [block_size] * len(chunks),
+                            chunks,
+                        )
+                    )
+                except BrokenProcessPool:
+                    _reset_blocked_pool(executor)
+                    raise
+
+        result = np.array(shared)
+        del shared
+        return result
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _blocked_phases(kb: int, num_blocks: int) -> List[List[Tuple[int, int]]]:
+    others = [b for b in range(num_blocks) if b != kb]
+    return [
+        [(kb, kb)],
+        [(kb, j) for j in others] + [(i, kb) for i in others],
+        [(i, j) for i in others for j in others],
+    ]
+
+
+def _update_tiles(
+    dist: np.ndarray, kb: int, block_size: int, tiles: List[Tuple[int, int]]
+) -> None:
+    n = dist.shape[0]
+    k_start = kb * block_size
+    k_stop = min(k_start + block_size, n)
+
+    for bi, bj in tiles:
+        rows = slice(bi * block_size, min((bi + 1) * block_size, n))
+        cols = slice(bj * block_size, min((bj + 1) * block_size, n))
+        tile = dist[rows, cols]
+        for k in range(k_start, k_stop):
+            np.minimum(tile, dist[rows, k, None] + dist[None, k, cols], out=tile)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _blocked_pool() -> ProcessPoolExecutor:
+    """
+    Process pool shared by every blocked Floyd-Warshall call.
+
+    Started on first use and kept for the life of the process, sized to
+    the CPU count; a call's workers argument only limits how many chunks
+    it submits. Workers are spawned rather than forked, because the API
+    process runs threads whose locks fork() would copy mid-state.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _reset_blocked_pool(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is executor:
+            _pool = None
+    executor.shutdown(wait=False)
+
+
+def _update_shared_tiles(
+    name: str,
+    shape: Tuple[int, int],
+    kb: int,
+    block_size: int,
+    tiles: List[Tuple[int, int]],
+) -> None:
+    """Pool task: update tiles of the caller's matrix in shared memory."""
+    # Pool workers share the parent's resource tracker, which unlinks the
+    # segment once when the parent calls unlink(). The mapping is closed
+    # again so an idle worker never pins a finished matrix.
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        matrix = np.ndarray(shape, dtype=np.float64, buffer=segment.buf)
+        _update_tiles(matrix, kb, block_size, tiles)
+        del matrix
+    finally:
+        segment.close()
+
+
+def _johnson(
+    graph: GraphLike, nodes: List[str], weight_mode: str
+) -> Tuple[Optional[np.ndarray], Optional[List[str]]]:
+    """
+    Johnson's algorithm.
+
+    Returns (distance matrix, None), or (None, cycle) when the Bellman-Ford
+    reweighting detects a negative cycle.
+    """
+    n = len(nodes)
+    node_to_idx = {node: i for i, node in enumerate(nodes)}
+
+    # Like the matrix engines, the last of several parallel edges wins
+    adjacency: List[List[Tuple[int, float]]] = []
+    for u in nodes:
+        row: Dict[int, float] = {}
+        for edge in graph.get_neighbors(u):
+            weight = edge.weight_cost if weight_mode == "cost" else edge.weight_neglog
+            row[node_to_idx[edge.to]] = weight
+        adjacency.append(list(row.items()))
+
+    has_negative_weight = any(weight < 0 for row in adjacency for _, weight in row)
+
+    potentials = [0.0] * n
+    if has_negative_weight:
+        potentials, cycle = _johnson_potentials(graph, nodes, weight_mode)
+        if cycle is not None:
+            return None, cycle
+
+    dist = np.full((n, n), np.inf)
+    for source in range(n):
+        dist[source] = _reweighted_dijkstra(adjacency, potentials, source)
+
+    return dist, None
+
+
+def _johnson_potentials(
+    graph: GraphLike, nodes: List[str], weight_mode: str
+) -> Tuple[List[float], Optional[List[str]]]:
+    """
+    Run bellman_ford from a virtual source with zero-weight edges to all nodes.
+
+    bellman_ford relaxes weight_neglog, so the selected weight is placed in
+    that slot of the augmented graph.
+    """
+    virtual_source = "\0johnson"
+    while virtual_source in graph.nodes:
+        virtual_source += "\0"
+
+    edges = [(virtual_source, node, 0.0, 0.0) for node in nodes]
+    for u in nodes:
+        for edge in graph.get_neighbors(u):
+            weight = edge.weight_cost if weight_mode == "cost" else edge.weight_neglog
+            edges.append((u, edge.to, edge.weight_cost, weight))
+
+    augmented = Graph(nodes + [virtual_source], edges, directed=True)
+    result = bellman_ford(augmented, virtual_source, detect_negative_cycle=True)
+
+    if result.negative_cycle_found:
+        return [], result.cycle
+
+    return [result.distances[node] for node in nodes], None
+
+
+def _reweighted_dijkstra(
+    adjacency: List[List[Tuple[int, float]]], potentials: List[float], source: int
+) -> List[float]:
+    """
+    Dijkstra on reduced weights w + h(u) - h(v) >= 0.
+
+    The original weights are summed along the settled path alongside the
+    reduced distance, which avoids the rounding of undoing the potentials.
+    """
+    INF = float("inf")
+    n = len(adjacency)
+    reduced = [INF] * n
+    actual = [INF] * n
+    visited = bytearray(n)
+    reduced[source] = 0.0
+    actual[source] = 0.0
+
+    pq = [(0.0, source)]
+
+    while pq:
+        dist_u, u = heapq.heappop(pq)
+
+        if visited[u]:
+            continue
+
+        visited[u] = 1
+        h_u = potentials[u]
+        actual_u = actual[u]
+
+        for v, weight in adjacency[u]:
+            if visited[v]:
+                continue
+
+            # Clamp rounding noise so reduced weights stay non-negative
+            new_dist = dist_u + max(0.0, weight + h_u - potentials[v])
+
+            if new_dist < reduced[v]:
+                reduced[v] = new_dist
+                actual[v] = actual_u + weight
+                heapq.heappush(pq, (new_dist, v))
+
+    return actual
+
+
+def _calculate_centrality_numpy(
+    nodes: List[str], dist: np.ndarray
+) -> Tuple[Optional[str], Dict[str, Dict[str, float]]]:
+    n = len(nodes)
+    if n == 0:
+        return None, {}
+
+    reachable = dist != np.inf
+    np.fill_diagonal(reachable, False)
+    reachable_counts = reachable.sum(axis=1)
+
+    # cumsum adds left to right like the reference loop, so sums match bit for bit
+    sum_distances = np.cumsum(np.where(reachable, dist, 0.0), axis=1)[:, -1]
+
+    centrality: Dict[str, Dict[str, float]] = {
+        u: {
+            "reachable_count": count,
+            "sum_distance": total if count > 0 else None,
+        }
+        for u, count, total in zip(
+            nodes, reachable_counts.tolist(), sum_distances.tolist()
+        )
+    }
+
+    best_reachable_count = int(reachable_counts.max())
+    if best_reachable_count == 0:
+        return None, centrality
+
+    # First node among the best reachable_count with the smallest sum wins
+    candidate_sums = np.where(
+        reachable_counts == best_reachable_count, sum_distances, np.inf
     )
+    return nodes[int(np.argmin(candidate_sums))], centrality
 
 
 def _calculate_centrality(
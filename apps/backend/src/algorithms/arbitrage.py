@@ -0,0 +1,274 @@
+"""Arbitrage cycle enumeration: every elementary negative cycle on weight_neglog."""
+
+import time
+from typing import Dict, List, Set, Tuple
+
+from .csr import GraphLike
+from .shortest_path import _min_rotation
+
+
+class NegativeCycle:
+    """A profitable loop, stored closed and rotated like _extract_cycle."""
+
+    def __init__(self, nodes: List[str], total_weight: float):
+        self.nodes = nodes
+        self.total_weight = total_weight
+
+    @property
+    def length(self) -> int:
+        return len(self.nodes) - 1
+
+    @property
+    def profit(self) -> float:
+        """Log-profit of one trip around the loop: -sum(weight_neglog)."""
+        return -self.total_weight
+
+    def to_dict(self) -> Dict[str, any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "cycle": self.nodes,
+            "length": self.length,
+            "total_weight": self.total_weight,
+            "profit": self.profit,
+        }
+
+
+class ArbitrageCyclesResult:
+    def __init__(
+        self,
+        cycles: List[NegativeCycle],
+        truncated: bool = False,
+        timed_out: bool = False,
+    ):
+        self.cycles = cycles
+        self.truncated = truncated
+        self.timed_out = timed_out
+
+    @property
+    def complete(self) -> bool:
+        """True when every cycle within max_length was enumerated."""
+        return not (self.truncated or self.timed_out)
+
+
+def find_negative_cycles(
+    graph: GraphLike,
+    max_length: int = 6,
+    max_cycles: int = 100,
+    time_budget: float = 0.5,
+) -> ArbitrageCyclesResult:
+    """
+    Enumerate elementary negative cycles of at most max_length edges.
+
+    Parallel edges collapse to the cheapest one. The search runs in two steps:
+
+    1. Bellman-Ford from a virtual source (every node at distance 0). If it
+       converges there is no negative cycle and we return immediately;
+       otherwise cycles closed in its parent graph are reported first and
+       their nodes seed the search.
+    2. A depth-bounded DFS from each start node that only extends paths whose
+       prefix sum stays negative. Every negative cycle has a rotation with
+       all prefix sums negative, so the pruning never loses a cycle; edges
+       are tried cheapest first, so the first non-negative prefix ends the
+       whole adjacency list.
+
+    Cycles are deduplicated by their _extract_cycle rotation and ranked by
+    profit (-sum(weight_neglog)), ties broken by node sequence. The search
+    stops once more than max_cycles are found (truncated) or time_budget
+    seconds have elapsed (timed_out); both mark the result incomplete.
+    """
+    if max_length < 1:
+        raise ValueError("max_length must be at least 1")
+    if max_cycles < 1:
+        raise ValueError("max_cycles must be at least 1")
+
+    deadline = time.perf_counter() + time_budget
+    nodes = graph.nodes
+    cheapest = _cheapest_edges(graph)
+    adjacency = [
+        sorted(targets.items(), key=lambda item: (item[1], item[0]))
+        for targets in cheapest
+    ]
+
+    found: Dict[Tuple[int, ...], float] = {}
+    parent_cycles, converged = _parent_graph_cycles(adjacency, max_length + 1, deadline)
+    if converged:
+        return ArbitrageCyclesResult([])
+
+    seeds: List[int] = []
+    seeded: Set[int] = set()
+    for cycle in parent_cycles:
+        if len(cycle) <= max_length:
+            total = _cycle_weight(cycle, cheapest)
+            if total < 0:
+                found[cycle] = total
+        for u in cycle:
+            if u not in seeded:
+                seeded.add(u)
+                seeds.append(u)
+    seeds.extend(u for u in range(len(nodes)) if u not in seeded)
+
+    finished = len(found) <= max_cycles
+    if finished:
+        for start in seeds:
+            if not _cycles_from(
+                start, adjacency, cheapest, max_length, found, max_cycles, deadline
+            ):
+                finished = False
+                break
+
+    truncated = len(found) > max_cycles
+    timed_out = not finished and not truncated
+
+    ranked = sorted(found.items(), key=lambda item: (item[1], item[0]))[:max_cycles]
+    cycles = [
+        NegativeCycle([nodes[u] for u in key] + [nodes[key[0]]], total)
+        for key, total in ranked
+    ]
+    return ArbitrageCyclesResult(cycles, truncated=truncated, timed_out=timed_out)
+
+
+def _cheapest_edges(graph: GraphLike) -> List[Dict[int, float]]:
+    """Per node, the smallest weight_neglog towards each target index."""
+    index = {node: i for i, node in enumerate(graph.nodes)}
+    cheapest: List[Dict[int, float]] = []
+
+    for u in graph.nodes:
+        targets: Dict[int, float] = {}
+        for edge in graph.get_neighbors(u):
+            v = index[edge.to]
+            if v not in targets or edge.weight_neglog < targets[v]:
+                targets[v] = edge.weight_neglog
+        cheapest.append(targets)
+
+    return cheapest
+
+
+def _cycle_weight(cycle: Tuple[int, ...], cheapest: List[Dict[int, float]]) -> float:
+    total = 0.0
+    for i, u in enumerate(cycle):
+        total += cheapest[u][cycle[(i + 1) % len(cycle)]]
+    return total
+
+
+def _parent_graph_cycles(
+    adjacency: List[List[Tuple[int, float]]], rounds: int, deadline: float
+) -> Tuple[List[Tuple[int, ...]], bool]:
+    """
+    Bellman-Ford from a virtual source, collecting parent-graph cycles.
+
+    Returns (cycles, converged). Cycles are min-rotated index tuples;
+    converged means a full round made no update, which
+    proves the graph has no negative cycle at all.
+    """
+    n = len(adjacency)
+    dist = [0.0] * n
+    parent = [-1] * n
+    cycles: List[Tuple[int, ...]] = []
+    seen: Set[Tuple[int, ...]] = set()
+
+    for _ in range(rounds):
+        updated = False
+        for u in range(n):
+            for v, w in adjacency[u]:
+                new_dist = dist[u] + w
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    parent[v] = u
+                    updated = True
+
+        if not updated:
+            return cycles, True
+
+        for cycle in _parent_cycles(parent):
+            if cycle not in seen:
+                seen.add(cycle)
+                cycles.append(cycle)
+
+        if time.perf_counter() > deadline:
+            break
+
+    return cycles, False
+
+
+def _parent_cycles(parent: List[int]) -> List[Tuple[int, ...]]:
+    """All cycles of a parent array, in edge direction and min-rotated."""
+    # 1 = on the walk being traced, 2 = done
+    state = [0] * len(parent)
+    cycles = []
+
+    for start in range(len(parent)):
+        walk = []
+        node = start
+        while node != -1 and state[node] == 0:
+            state[node] = 1
+            walk.append(node)
+            node = parent[node]
+
+        if node != -1 and state[node] == 1:
+            # parent[v] = u stands for edge u -> v, so reverse the walk
+            cycle = walk[walk.index(node):]
+            cycle.reverse()
+            cycles.append(tuple(_min_rotation(cycle)))
+
+        for visited in walk:
+            state[visited] = 2
+
+    return cycles
+
+
+def _cycles_from(
+    start: int,
+    adjacency: List[List[Tuple[int, float]]],
+    cheapest: List[Dict[int, float]],
+    max_length: int,
+    found: Dict[Tuple[int, ...], float],
+    max_cycles: int,
+    deadline: float,
+) -> bool:
+    """
+    Add every negative-prefix cycle through start to found.
+
+    Returns False when the search had to stop early (cap or time budget).
+    """
+    path = [start]
+    sums = [0.0]
+    positions = [0]
+    on_path = {start}
+    steps = 0
+
+    while positions:
+        edges = adjacency[path[-1]]
+        pos = positions[-1]
+
+        if pos == len(edges):
+            positions.pop()
+            sums.pop()
+            on_path.discard(path.pop())
+            continue
+
+        v, w = edges[pos]
+        total = sums[-1] + w
+        if total >= 0:
+            # Remaining edges are no cheaper
+            positions[-1] = len(edges)
+            continue
+        positions[-1] = pos + 1
+
+        steps += 1
+        if steps & 1023 == 0 and time.perf_counter() > deadline:
+            return False
+
+        if v == start:
+            key = tuple(_min_rotation(path))
+            if key not in found:
+                # Weigh in canonical order so every rotation sums the same way
+                found[key] = _cycle_weight(key, cheapest)
+                if len(found) > max_cycles:
+                    return False
+        elif v not in on_path and len(path) < max_length:
+            path.append(v)
+            sums.append(total)
+            positions.append(0)
+            on_path.add(v)
+
+    return True
@@ -0,0 +1,257 @@
+"""Compact integer-indexed (CSR) graph representation."""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple, Union
+
+from .graph import Edge, Graph
+
+
+class CSRGraph:
+    """
+    Graph stored as compressed sparse row (CSR) arrays.
+
+    Node ids are interned to ints following the sorted node order, so
+    comparing indices gives the same result as comparing node names and
+    algorithms keep the exact tie-breaking of the dict-backed ``Graph``.
+    Outgoing edges of node ``i`` occupy ``offsets[i]:offsets[i + 1]`` in
+    ``targets``, ``weight_cost`` and ``weight_neglog``, sorted by target.
+
+    The class mirrors the public ``Graph`` API so every algorithm accepts it;
+    the hot loops in ``traversal``, ``shortest_path`` and ``mst`` read the
+    arrays directly instead of materializing ``Edge`` objects.
+    """
+
+    def __init__(
+        self,
+        nodes: List[str],
+        edges: List[Tuple[str, str, float, float]],
+        directed: bool = True,
+    ):
+        self.nodes = sorted(set(nodes))
+        self.directed = directed
+        self.index: Dict[str, int] = {node: i for i, node in enumerate(self.nodes)}
+
+        sources: List[int] = []
+        targets: List[int] = []
+        costs: List[float] = []
+        neglogs: List[float] = []
+
+        for source, target, w_cost, w_neglog in edges:
+            if source not in self.index:
+                raise ValueError(f"Unknown node in edge: {source}")
+            if target not in self.index:
+                raise ValueError(f"Unknown node in edge: {target}")
+
+            u = self.index[source]
+            v = self.index[target]
+            sources.append(u)
+            targets.append(v)
+            costs.append(w_cost)
+            neglogs.append(w_neglog)
+
+            if not directed:
+                sources.append(v)
+                targets.append(u)
+                costs.append(w_cost)
+                neglogs.append(w_neglog)
+
+        # Stable sort keeps insertion order among parallel edges, like Graph
+        order = sorted(range(len(sources)), key=lambda k: (sources[k], targets[k]))
+
+        counts = [0] * (len(self.nodes) + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for i in range(len(self.nodes)):
+            counts[i + 1] += counts[i]
+
+        self.offsets = array("i", counts)
+        self.targets = array("i", (targets[k] for k in order))
+        self.weight_cost = array("d", (costs[k] for k in order))
+        self.weight_neglog = array("d", (neglogs[k] for k in order))
+        self._reverse: Optional[Tuple[array, array, array, array]] = None
+
+    @property
+    def num_edges(self) -> int:
+        """Number of adjacency entries (undirected edges count twice)."""
+        return len(self.targets)
+
+    def get_neighbors(self, node: str) -> Tuple[Edge, ...]:
+        u = self.index.get(node)
+        if u is None:
+            return ()
+        nodes = self.nodes
+        return tuple(
+            Edge(
+                to=nodes[self.targets[k]],
+                weight_cost=self.weight_cost[k],
+                weight_neglog=self.weight_neglog[k],
+            )
+            for k in range(self.offsets[u], self.offsets[u + 1])
+        )
+
+    def reverse_arrays(self) -> Tuple[array, array, array, array]:
+        """
+        Incoming-edge CSR arrays: (offsets, sources, weight_cost, weight_neglog).
+
+        Built on first use and kept, like Graph's reverse adjacency. Sources
+        of each node are sorted, since edges are scanned in source order.
+        """
+        if self._reverse is None:
+            n = len(self.nodes)
+            counts = [0] * (n + 1)
+            for v in self.targets:
+                counts[v + 1] += 1
+            for i in range(n):
+                counts[i + 1] += counts[i]
+
+            slots = counts[:-1]
+            sources = array("i", bytes(4 * len(self.targets)))
+            costs = array("d", bytes(8 * len(self.targets)))
+            neglogs = array("d", bytes(8 * len(self.targets)))
+            for u in range(n):
+                for k in range(self.offsets[u], self.offsets[u + 1]):
+                    v = self.targets[k]
+                    slot = slots[v]
+                    sources[slot] = u
+                    costs[slot] = self.weight_cost[k]
+                    neglogs[slot] = self.weight_neglog[k]
+                    slots[v] = slot + 1
+
+            self._reverse = (array("i", counts), sources, costs, neglogs)
+        return self._reverse
+
+    def get_predecessors(self, node: str) -> Tuple[Edge, ...]:
+        """Incoming edges of node, reversed: each Edge's ``to`` is the tail."""
+        v = self.index.get(node)
+        if v is None:
+            return ()
+        offsets, sources, costs, neglogs = self.reverse_arrays()
+        nodes = self.nodes
+        return tuple(
+            Edge(to=nodes[sources[k]], weight_cost=costs[k], weight_neglog=neglogs[k])
+            for k in range(offsets[v], offsets[v + 1])
+        )
+
+    def get_weight(
+        self, u: str, v: str, weight_type: str = "cost"
+    ) -> Optional[float]:
+        i = self.index.get(u)
+        j = self.index.get(v)
+        if i is None or j is None:
+            return None
+        k = self._edge_slot(i, j)
+        if k is None:
+            return None
+        weights = self.weight_cost if weight_type == "cost" else self.weight_neglog
+        return weights[k]
+
+    def get_path_weights(
+        self, path: List[str], weight_type: str = "cost"
+    ) -> List[Optional[float]]:
+        """Weights of the hops along path (None for a missing edge)."""
+        weights = self.weight_cost if weight_type == "cost" else self.weight_neglog
+        index = self.index
+        result: List[Optional[float]] = []
+        for u, v in zip(path, path[1:]):
+            i = index.get(u)
+            j = index.get(v)
+            k = None if i is None or j is None else self._edge_slot(i, j)
+            result.append(None if k is None else weights[k])
+        return result
+
+    def _edge_slot(self, i: int, j: int) -> Optional[int]:
+        """
+        Position of the first edge i -> j in the CSR arrays.
+
+        Targets are sorted within each row, so this is a bisect.
+        """
+        hi = self.offsets[i + 1]
+        k = bisect_left(self.targets, j, self.offsets[i], hi)
+        if k < hi and self.targets[k] == j:
+            return k
+        return None
+
+    def get_all_edges(self, weight_type: str = "cost") -> List[Tuple[str, str, float]]:
+        weights = self.weight_cost if weight_type == "cost" else self.weight_neglog
+        nodes = self.nodes
+        edges = []
+        for u in range(len(nodes)):
+            for k in range(self.offsets[u], self.offsets[u + 1]):
+                edges.append((nodes[u], nodes[self.targets[k]], weights[k]))
+        return edges
+
+    @staticmethod
+    def from_graph_payload(graph_payload: dict, directed: bool = True) -> "CSRGraph":
+        nodes = [node["id"] for node in graph_payload["nodes"]]
+
+        edges = [
+            (
+                edge["from"],
+                edge["to"],
+                edge["weight_cost"],
+                edge["weight_neglog"],
+            )
+            for edge in graph_payload["edges"]
+        ]
+
+        return CSRGraph(nodes, edges, directed=directed)
+
+    @staticmethod
+    def from_graph(graph: Graph) -> "CSRGraph":
+        """Convert a dict-backed Graph, keeping its adjacency order."""
+        edges = [
+            (u, edge.to, edge.weight_cost, edge.weight_neglog)
+            for u in graph.nodes
+            for edge in graph.get_neighbors(u)
+        ]
+        # Undirected Graphs already hold both directions in adj
+        csr = CSRGraph(graph.nodes, edges, directed=True)
+        csr.directed = graph.directed
+        return csr
+
+    def to_undirected(self) -> "CSRGraph":
+        if not self.directed:
+            return self
+
+        edge_map: Dict[Tuple[int, int], Tuple[float, float]] = {}
+
+        for u in range(len(self.nodes)):
+            for k in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[k]
+                key = (u, v) if u < v else (v, u)
+                w_cost = self.weight_cost[k]
+                w_neglog = self.weight_neglog[k]
+
+                if key not in edge_map:
+                    edge_map[key] = (w_cost, w_neglog)
+                else:
+                    existing_cost, existing_neglog = edge_map[key]
+                    edge_map[key] = (
+                        min(existing_cost, w_cost),
+                        min(existing_neglog, w_neglog),
+                    )
+
+        nodes = self.nodes
+        undirected_edges = [
+            (nodes[u], nodes[v], w_cost, w_neglog)
+            for (u, v), (w_cost, w_neglog) in edge_map.items()
+        ]
+
+        return CSRGraph(self.nodes, undirected_edges, directed=False)
+
+
+GraphLike = Union[Graph, CSRGraph]
+
+
+def edge_density(graph: GraphLike) -> float:
+    """
+    Adjacency entries per ordered node pair, E / (V * (V - 1)).
+
+    Undirected edges count both ways, so a complete graph has density 1
+    either way. Graphs with fewer than two nodes count as complete.
+    """
+    n = len(graph.nodes)
+    if n < 2:
+        return 1.0
+    return graph.num_edges / (n * (n - 1))
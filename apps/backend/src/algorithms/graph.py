@@ -3,8 +3,18 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-
-@dataclass
+# Approximate CPython footprints, measured with tracemalloc on generated
+# snapshots: an adjacency entry is an Edge, its __dict__ and two floats;
+# the two directions of an undirected edge, and derived entries, share the
+# floats of the edge they were built from.
+_ADJ_ENTRY_BYTES = 152
+_UNDIRECTED_ENTRY_BYTES = 120
+_REVERSE_ENTRY_BYTES = 104
+_INDEX_ENTRY_BYTES = 88
+_NODE_BYTES = 200
+
+
+@dataclass(frozen=True)
 class Edge:
     to: str
     weight_cost: float
@@ -12,6 +22,14 @@ class Edge:
 
 
 class Graph:
+    """
+    Directed or undirected weighted graph.
+
+    The graph is immutable once constructed: adjacency lists are frozen into
+    sorted tuples so a single instance can be shared by concurrent readers
+    (see ``cache.CacheEntry``).
+    """
+
     def __init__(
         self,
         nodes: List[str],
@@ -20,36 +38,115 @@ class Graph:
     ):
         self.nodes = sorted(set(nodes))
         self.directed = directed
-        self.adj: Dict[str, List[Edge]] = {node: [] for node in self.nodes}
+        adj: Dict[str, List[Edge]] = {node: [] for node in self.nodes}
 
         for source, target, w_cost, w_neglog in edges:
-            if source not in self.adj:
+            if source not in adj:
                 raise ValueError(f"Unknown node in edge: {source}")
-            if target not in self.adj:
+            if target not in adj:
                 raise ValueError(f"Unknown node in edge: {target}")
 
-            self.adj[source].append(
+            adj[source].append(
                 Edge(to=target, weight_cost=w_cost, weight_neglog=w_neglog)
             )
 
             if not directed:
-                self.adj[target].append(
+                adj[target].append(
                     Edge(to=source, weight_cost=w_cost, weight_neglog=w_neglog)
                 )
 
-        for node in self.adj:
-            self.adj[node].sort(key=lambda e: e.to)
-
-    def get_neighbors(self, node: str) -> List[Edge]:
-        return self.adj.get(node, [])
+        self.adj: Dict[str, Tuple[Edge, ...]] = {
+            node: tuple(sorted(edges, key=lambda e: e.to))
+            for node, edges in adj.items()
+        }
+        self._reverse_adj: Optional[Dict[str, Tuple[Edge, ...]]] = None
+        self._weight_index: Optional[Dict[Tuple[str, str], Edge]] = None
+
+    @property
+    def num_edges(self) -> int:
+        """Number of adjacency entries (undirected edges count twice)."""
+        return sum(len(edges) for edges in self.adj.values())
+
+    def nbytes(self) -> int:
+        """Estimated bytes held by the graph, including memo_nbytes()."""
+        entry_bytes = _ADJ_ENTRY_BYTES if self.directed else _UNDIRECTED_ENTRY_BYTES
+        return (
+            len(self.nodes) * _NODE_BYTES
+            + self.num_edges * entry_bytes
+            + self.memo_nbytes()
+        )
+
+    def memo_nbytes(self) -> int:
+        """Estimated bytes of the lookups built on first use so far."""
+        nbytes = 0
+        if self._reverse_adj is not None:
+            nbytes += self.num_edges * _REVERSE_ENTRY_BYTES
+        if self._weight_index is not None:
+            nbytes += self.num_edges * _INDEX_ENTRY_BYTES
+        return nbytes
+
+    def get_neighbors(self, node: str) -> Tuple[Edge, ...]:
+        return self.adj.get(node, ())
+
+    def get_predecessors(self, node: str) -> Tuple[Edge, ...]:
+        """
+        Incoming edges of node, reversed: each Edge's ``to`` is the tail.
+
+        The reverse adjacency is built on first use and kept for the lifetime
+        of the (immutable) graph, so cached snapshots build it once.
+        """
+        if self._reverse_adj is None:
+            incoming: Dict[str, List[Edge]] = {node: [] for node in self.nodes}
+            for u in self.nodes:
+                for edge in self.adj[u]:
+                    incoming[edge.to].append(
+                        Edge(
+                            to=u,
+                            weight_cost=edge.weight_cost,
+                            weight_neglog=edge.weight_neglog,
+                        )
+                    )
+            self._reverse_adj = {node: tuple(edges) for node, edges in incoming.items()}
+        return self._reverse_adj.get(node, ())
 
     def get_weight(
         self, u: str, v: str, weight_type: str = "cost"
     ) -> Optional[float]:
-        for edge in self.adj.get(u, []):
-            if edge.to == v:
-                return edge.weight_cost if weight_type == "cost" else edge.weight_neglog
-        return None
+        """
+        Weight of edge u -> v, or None if there is none.
+
+        Looked up in a (u, v) -> Edge index built on first use. With parallel
+        edges the first one listed wins, as in the adjacency list.
+        """
+        edge = self._edge_index().get((u, v))
+        if edge is None:
+            return None
+        return edge.weight_cost if weight_type == "cost" else edge.weight_neglog
+
+    def get_path_weights(
+        self, path: List[str], weight_type: str = "cost"
+    ) -> List[Optional[float]]:
+        """Weights of the hops along path (None for a missing edge)."""
+        index = self._edge_index()
+        weights: List[Optional[float]] = []
+        for hop in zip(path, path[1:]):
+            edge = index.get(hop)
+            if edge is None:
+                weights.append(None)
+            else:
+                weights.append(
+                    edge.weight_cost if weight_type == "cost" else edge.weight_neglog
+                )
+        return weights
+
+    def _edge_index(self) -> Dict[Tuple[str, str], Edge]:
+        if self._weight_index is None:
+            index: Dict[Tuple[str, str], Edge] = {}
+            for u in self.nodes:
+                for edge in self.adj[u]:
+                    index.setdefault((u, edge.to), edge)
+            self._weight_index = index
+        return self._weight_index
 
     def get_all_edges(self, weight_type: str = "cost") -> List[Tuple[str, str, float]]:
         edges = []
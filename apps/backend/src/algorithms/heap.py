@@ -0,0 +1,106 @@
+"""Indexed binary heap with decrease-key."""
+
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class IndexedHeap:
+    """
+    Binary min-heap holding each item at most once, with true decrease-key.
+
+    Entries are ordered by (key, item), which is the order a heapq of
+    (key, item) tuples pops in, so switching an algorithm from lazy
+    deletion to this heap does not change its tie-breaking. The heap never
+    grows beyond the number of distinct items, unlike a lazy heapq that
+    keeps one stale entry per relaxation.
+    """
+
+    def __init__(self):
+        self._items: List[Hashable] = []
+        self._keys: Dict[Hashable, Any] = {}
+        self._pos: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._pos
+
+    def key(self, item: Hashable) -> Any:
+        return self._keys[item]
+
+    def push_or_decrease(self, item: Hashable, key: Any) -> bool:
+        """
+        Insert item, or lower its key if it is already queued.
+
+        Returns:
+            True if the heap changed, False if the current key is not larger
+        """
+        pos = self._pos.get(item)
+        if pos is None:
+            self._keys[item] = key
+            self._pos[item] = len(self._items)
+            self._items.append(item)
+            self._sift_up(len(self._items) - 1)
+            return True
+
+        if (key, item) >= (self._keys[item], item):
+            return False
+        self._keys[item] = key
+        self._sift_up(pos)
+        return True
+
+    def pop(self) -> Tuple[Any, Hashable]:
+        """Remove and return (key, item) with the smallest (key, item)."""
+        items = self._items
+        top = items[0]
+        last = items.pop()
+        if items:
+            items[0] = last
+            self._pos[last] = 0
+            self._sift_down(0)
+        del self._pos[top]
+        return self._keys.pop(top), top
+
+    def _sift_up(self, pos: int) -> None:
+        items, keys, positions = self._items, self._keys, self._pos
+        item = items[pos]
+        entry = (keys[item], item)
+
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            parent_item = items[parent]
+            if (keys[parent_item], parent_item) <= entry:
+                break
+            items[pos] = parent_item
+            positions[parent_item] = pos
+            pos = parent
+
+        items[pos] = item
+        positions[item] = pos
+
+    def _sift_down(self, pos: int) -> None:
+        items, keys, positions = self._items, self._keys, self._pos
+        size = len(items)
+        item = items[pos]
+        entry = (keys[item], item)
+
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            child_item = items[child]
+            child_entry = (keys[child_item], child_item)
+            right = child + 1
+            if right < size:
+                right_item = items[right]
+                right_entry = (keys[right_item], right_item)
+                if right_entry < child_entry:
+                    child, child_item, child_entry = right, right_item, right_entry
+            if entry <= child_entry:
+                break
+            items[pos] = child_item
+            positions[child_item] = pos
+            pos = child
+
+        items[pos] = item
+        positions[item] = pos
@@ -1,9 +1,23 @@
-"""Minimum Spanning Tree algorithms: Prim and Kruskal."""
+"""Minimum Spanning Tree algorithms: Prim, Kruskal and Boruvka."""
 
 import heapq
-from typing import Dict, List
+from typing import Dict, List, Literal, Optional
+from weakref import WeakKeyDictionary
 
-from .graph import Graph
+import numpy as np
+
+from .csr import CSRGraph, GraphLike, edge_density
+from .disjoint_set import DisjointSet
+from .heap import IndexedHeap
+
+PrimEngine = Literal["heap", "dense", "auto"]
+
+# auto switches Prim to the dense O(V^2) engine at this edge density
+# (E / (V * (V - 1)), undirected edges counted both ways); see
+# benchmarks/bench_prim.py. Above DENSE_PRIM_MAX_NODES the V x V float64
+# matrix (128 MiB at 4096 nodes) is not worth it.
+DENSE_PRIM_MIN_DENSITY = 0.1
+DENSE_PRIM_MAX_NODES = 4096
 
 
 class MSTEdge:
@@ -33,15 +47,23 @@ class MSTResult:
         total_cost: float,
         is_forest: bool,
         num_components: int,
+        engine: Optional[str] = None,
     ):
         self.edges = edges
         self.total_cost = total_cost
         self.is_forest = is_forest
         self.num_components = num_components
+        # Prim only: the engine that actually ran ("heap" or "dense")
+        self.engine = engine
 
 
 class UnionFind:
-    """Union-Find (Disjoint Set Union) data structure."""
+    """
+    Union-Find (Disjoint Set Union) data structure.
+
+    Dict-backed over arbitrary hashable ids. Kruskal uses the faster
+    int-indexed ``disjoint_set.DisjointSet``.
+    """
 
     def __init__(self, nodes: List[str]):
         """
@@ -96,24 +118,57 @@ class UnionFind:
         return True
 
 
-def mst_prim(graph: Graph) -> MSTResult:
+def mst_prim(
+    graph: GraphLike,
+    heap: Optional[Literal["lazy", "indexed"]] = None,
+    engine: PrimEngine = "heap",
+) -> MSTResult:
     """
     Prim's MST algorithm on undirected graph.
 
     For disconnected graphs, runs Prim on each component to produce a forest.
 
-    Complexity: O(E log V)
+    Complexity: O(E log V) with the heap engine, O(V^2) with the dense one
 
     Args:
         graph: Undirected graph (should be converted using to_undirected())
+        heap: "lazy" (the default) pushes every candidate edge onto a heapq
+            (O(E) entries); "indexed" keeps the cheapest edge per outside
+            node in an IndexedHeap (at most V entries). Both pick the same
+            edges. Only the heap engine uses a heap.
+        engine: "heap", "dense" (see mst_prim_dense) or "auto" (dense from
+            DENSE_PRIM_MIN_DENSITY up to DENSE_PRIM_MAX_NODES, heap otherwise;
+            always heap when a heap is given)
 
     Returns:
-        MSTResult with edges, total cost, and forest information
+        MSTResult with edges, total cost, forest information and the engine
+        that ran
+
+    Raises:
+        ValueError: For an unknown heap or engine, or a heap with engine="dense"
     """
+    if heap not in (None, "lazy", "indexed"):
+        raise ValueError(f"Unknown heap: {heap}")
+
+    if engine == "auto":
+        engine = "dense" if heap is None and prefers_dense_prim(graph) else "heap"
+    if engine == "dense":
+        if heap is not None:
+            raise ValueError("heap only applies to the heap engine, not engine='dense'")
+        return mst_prim_dense(graph)
+    if engine != "heap":
+        raise ValueError(f"Unknown Prim engine: {engine}")
+    heap = heap or "lazy"
+
     if graph.directed:
         # Convert to undirected if needed
         graph = graph.to_undirected()
 
+    if isinstance(graph, CSRGraph):
+        return _mst_prim_csr(graph, heap)
+
+    grow = _prim_component_indexed if heap == "indexed" else _prim_component
+
     nodes = graph.nodes
     visited = set()
     mst_edges: List[MSTEdge] = []
@@ -126,7 +181,7 @@ def mst_prim(graph: Graph) -> MSTResult:
             continue
 
         num_components += 1
-        component_edges = _prim_component(graph, start_node, visited)
+        component_edges = grow(graph, start_node, visited)
         mst_edges.extend(component_edges)
 
         for edge in component_edges:
@@ -142,11 +197,12 @@ def mst_prim(graph: Graph) -> MSTResult:
         total_cost=total_cost,
         is_forest=is_forest,
         num_components=num_components,
+        engine="heap",
     )
 
 
 def _prim_component(
-    graph: Graph, start: str, visited: set
+    graph: GraphLike, start: str, visited: set
 ) -> List[MSTEdge]:
     """
     Run Prim's algorithm on a single connected component.
@@ -189,13 +245,139 @@ def _prim_component(
     return component_edges
 
 
-def mst_kruskal(graph: Graph) -> MSTResult:
+def _prim_component_indexed(
+    graph: GraphLike, start: str, visited: set
+) -> List[MSTEdge]:
+    """
+    Prim on one component with an indexed heap keyed by outside node.
+
+    Each queued node holds its cheapest known (weight, tree node) link, so
+    pops follow the same (weight, u, v) order as _prim_component.
+    """
+    component_edges: List[MSTEdge] = []
+    pq = IndexedHeap()
+    u = start
+
+    while True:
+        visited.add(u)
+        for edge in graph.get_neighbors(u):
+            if edge.to not in visited:
+                pq.push_or_decrease(edge.to, (edge.weight_cost, u))
+
+        if not pq:
+            return component_edges
+
+        (weight, parent), u = pq.pop()
+        component_edges.append(MSTEdge(parent, u, weight))
+
+
+def prefers_dense_prim(graph: GraphLike) -> bool:
+    """True if the dense engine should beat the heap one on this graph."""
+    return (
+        len(graph.nodes) <= DENSE_PRIM_MAX_NODES
+        and edge_density(graph) >= DENSE_PRIM_MIN_DENSITY
+    )
+
+
+def mst_prim_dense(graph: GraphLike) -> MSTResult:
+    """
+    Prim's algorithm over a dense V x V cost matrix.
+
+    Keeps, for every node outside the tree, the cheapest (weight, tree node)
+    link in two NumPy vectors and grows the tree by the smallest
+    (weight, tree node, node) each step, which is the edge the heap engine
+    pops. Edges, total_cost (summed in the same order) and forest handling
+    therefore match mst_prim exactly. Directed graphs need no
+    to_undirected() call: the matrix keeps the cheaper direction.
+
+    Complexity: O(V^2) time and memory
+    """
+    nodes = sorted(graph.nodes)
+    n = len(nodes)
+    weights = _cost_matrix(graph, nodes)
+
+    INF = np.inf
+    key = np.full(n, INF)
+    link = np.full(n, n, dtype=np.intp)
+    in_tree = np.zeros(n, dtype=bool)
+
+    mst_edges: List[MSTEdge] = []
+    total_cost = 0.0
+    num_components = 0
+    next_start = 0
+
+    for step in range(n):
+        best = key.min() if step else INF
+
+        if best == INF:
+            # Nothing reachable from the tree: start the next component
+            while in_tree[next_start]:
+                next_start += 1
+            u = next_start
+            num_components += 1
+        else:
+            candidates = np.flatnonzero(key == best)
+            if len(candidates) > 1:
+                parents = link[candidates]
+                candidates = candidates[parents == parents.min()]
+            u = int(candidates[0])
+            weight = float(best)
+            mst_edges.append(MSTEdge(nodes[link[u]], nodes[u], weight))
+            total_cost += weight
+
+        in_tree[u] = True
+        key[u] = INF
+
+        row = weights[u]
+        better = (row < key) | ((row == key) & (link > u))
+        better &= ~in_tree
+        key[better] = row[better]
+        link[better] = u
+
+    mst_edges.sort(key=lambda e: (e.u, e.v))
+
+    return MSTResult(
+        edges=mst_edges,
+        total_cost=total_cost,
+        is_forest=num_components > 1,
+        num_components=num_components,
+        engine="dense",
+    )
+
+
+def _cost_matrix(graph: GraphLike, nodes: List[str]) -> np.ndarray:
+    """Symmetric weight_cost matrix, cheapest edge per pair, inf elsewhere."""
+    n = len(nodes)
+    weights = np.full((n, n), np.inf)
+
+    if isinstance(graph, CSRGraph):
+        sources = np.repeat(np.arange(n), np.diff(np.asarray(graph.offsets)))
+        targets = np.asarray(graph.targets)
+        costs = np.asarray(graph.weight_cost)
+    else:
+        index = {node: i for i, node in enumerate(nodes)}
+        sources, targets, costs = [], [], []
+        for u in nodes:
+            i = index[u]
+            for edge in graph.get_neighbors(u):
+                sources.append(i)
+                targets.append(index[edge.to])
+                costs.append(edge.weight_cost)
+
+    np.minimum.at(weights, (sources, targets), costs)
+    return np.minimum(weights, weights.T)
+
+
+def mst_kruskal(graph: GraphLike) -> MSTResult:
     """
     Kruskal's MST algorithm on undirected graph.
 
     For disconnected graphs, produces a spanning forest.
 
-    Complexity: O(E log E)
+    Edges come from sorted_edges, so repeated calls on the same graph skip
+    the sort.
+
+    Complexity: O(E log E) on the first call, near-linear after
 
     Args:
         graph: Undirected graph (should be converted using to_undirected())
@@ -207,37 +389,23 @@ def mst_kruskal(graph: Graph) -> MSTResult:
         # Convert to undirected if needed
         graph = graph.to_undirected()
 
-    nodes = graph.nodes
-    uf = UnionFind(nodes)
+    nodes = sorted(graph.nodes)
+    edges = sorted_edges(graph)
+    ds = DisjointSet(len(nodes))
 
-    # Collect all edges and sort by (weight, u, v) where u < v
-    edges: List[tuple] = []
-    seen_edges = set()
-
-    for u in nodes:
-        for edge in graph.get_neighbors(u):
-            v = edge.to
-            # Normalize edge representation
-            edge_key = (u, v) if u < v else (v, u)
-
-            if edge_key not in seen_edges:
-                seen_edges.add(edge_key)
-                edges.append((edge.weight_cost, edge_key[0], edge_key[1]))
-
-    # Sort by (weight, u, v) for determinism
-    edges.sort()
-
-    # Build MST using Kruskal's algorithm
     mst_edges: List[MSTEdge] = []
     total_cost = 0.0
 
-    for weight, u, v in edges:
-        if uf.union(u, v):
-            mst_edges.append(MSTEdge(u, v, weight))
+    for weight, u, v in zip(
+        edges.costs.tolist(), edges.heads.tolist(), edges.tails.tolist()
+    ):
+        if ds.union(u, v):
+            mst_edges.append(MSTEdge(nodes[u], nodes[v], weight))
             total_cost += weight
+            if ds.num_sets == 1:
+                break
 
-    # Count components
-    components = len(set(uf.find(node) for node in nodes))
+    components = ds.num_sets
     is_forest = components > 1
 
     # Sort edges for deterministic output
@@ -250,3 +418,266 @@ def mst_kruskal(graph: Graph) -> MSTResult:
         num_components=components,
     )
 
+
+class SortedEdges:
+    """
+    Undirected edges as NumPy arrays sorted by (weight, u, v).
+
+    u < v are indices into the sorted node list; parallel edges and the two
+    directions of an undirected edge collapse to one entry of the cheapest
+    weight, matching to_undirected().
+    """
+
+    def __init__(self, heads: np.ndarray, tails: np.ndarray, costs: np.ndarray):
+        self.heads = heads
+        self.tails = tails
+        self.costs = costs
+
+    def __len__(self) -> int:
+        return len(self.costs)
+
+    def nbytes(self) -> int:
+        return self.heads.nbytes + self.tails.nbytes + self.costs.nbytes
+
+
+_sorted_edges_cache: "WeakKeyDictionary[GraphLike, SortedEdges]" = WeakKeyDictionary()
+
+
+def sorted_edges(graph: GraphLike) -> SortedEdges:
+    """
+    SortedEdges for graph, built once per graph object.
+
+    Cached snapshots keep their undirected projection for their whole
+    lifetime, so Kruskal and Boruvka on a snapshot sort its edges only once.
+    """
+    edges = _sorted_edges_cache.get(graph)
+    if edges is None:
+        edges = _build_sorted_edges(graph)
+        _sorted_edges_cache[graph] = edges
+    return edges
+
+
+def sorted_edges_nbytes(graph: GraphLike) -> int:
+    """Bytes of the SortedEdges memoized for graph, or 0 if none was built."""
+    edges = _sorted_edges_cache.get(graph)
+    return edges.nbytes() if edges is not None else 0
+
+
+def _build_sorted_edges(graph: GraphLike) -> SortedEdges:
+    nodes = sorted(graph.nodes)
+    n = len(nodes)
+
+    if isinstance(graph, CSRGraph):
+        heads = np.repeat(np.arange(n), np.diff(np.asarray(graph.offsets)))
+        tails = np.asarray(graph.targets, dtype=np.intp)
+        costs = np.asarray(graph.weight_cost)
+    else:
+        index = {node: i for i, node in enumerate(nodes)}
+        head_list, tail_list, cost_list = [], [], []
+        for u in nodes:
+            i = index[u]
+            for edge in graph.get_neighbors(u):
+                head_list.append(i)
+                tail_list.append(index[edge.to])
+                cost_list.append(edge.weight_cost)
+        heads = np.array(head_list, dtype=np.intp)
+        tails = np.array(tail_list, dtype=np.intp)
+        costs = np.array(cost_list, dtype=np.float64)
+
+    # Orient every edge u < v (self-loops never join two components)
+    low = np.minimum(heads, tails)
+    high = np.maximum(heads, tails)
+    keep = low != high
+    low, high, costs = low[keep], high[keep], costs[keep]
+
+    # Cheapest edge per pair: first of each run sorted by (u, v, weight)
+    order = np.lexsort((costs, high, low))
+    low, high, costs = low[order], high[order], costs[order]
+    first = np.ones(len(costs), dtype=bool)
+    first[1:] = (low[1:] != low[:-1]) | (high[1:] != high[:-1])
+    low, high, costs = low[first], high[first], costs[first]
+
+    order = np.lexsort((high, low, costs))
+    return SortedEdges(low[order], high[order], costs[order])
+
+
+def mst_boruvka(graph: GraphLike) -> MSTResult:
+    """
+    Boruvka's MST algorithm on undirected graph.
+
+    Each round finds the cheapest edge leaving every component and contracts
+    along all of them at once with a DisjointSet. The cheapest-edge scan is
+    one vectorized pass over the sorted_edges arrays. Edges are ranked by
+    their sorted_edges position, the order mst_kruskal scans in, so both
+    return the same edges and the same total_cost (summed in that order).
+
+    Complexity: O(E log V), at most log2(V) rounds
+
+    Args:
+        graph: Undirected graph (should be converted using to_undirected())
+
+    Returns:
+        MSTResult with edges, total cost, and forest information
+    """
+    if graph.directed:
+        graph = graph.to_undirected()
+
+    nodes = sorted(graph.nodes)
+    n = len(nodes)
+    ds = DisjointSet(n)
+
+    # An edge's position in sorted_edges is its rank
+    edges = sorted_edges(graph)
+    heads, tails, costs = edges.heads, edges.tails, edges.costs
+    active = np.arange(len(costs))
+    chosen: List[np.ndarray] = []
+
+    while len(active):
+        roots = _roots(ds)
+        comp_u = roots[heads[active]]
+        comp_v = roots[tails[active]]
+        crossing = comp_u != comp_v
+        active, comp_u, comp_v = active[crossing], comp_u[crossing], comp_v[crossing]
+        if not len(active):
+            break
+
+        cheapest = _cheapest_edges(active, comp_u, comp_v, n)
+        # Both endpoints may pick the same edge; the ranks form a forest
+        picked = np.unique(cheapest[cheapest < len(costs)])
+        for rank in picked.tolist():
+            ds.union(int(heads[rank]), int(tails[rank]))
+        chosen.append(picked)
+
+    mst_edges: List[MSTEdge] = []
+    total_cost = 0.0
+
+    if chosen:
+        for rank in np.sort(np.concatenate(chosen)).tolist():
+            weight = float(costs[rank])
+            mst_edges.append(MSTEdge(nodes[heads[rank]], nodes[tails[rank]], weight))
+            total_cost += weight
+
+    mst_edges.sort(key=lambda e: (e.u, e.v))
+
+    return MSTResult(
+        edges=mst_edges,
+        total_cost=total_cost,
+        is_forest=ds.num_sets > 1,
+        num_components=ds.num_sets,
+    )
+
+
+def _roots(ds: DisjointSet) -> np.ndarray:
+    """Root of every element, by vectorized pointer jumping over a copy."""
+    parent = np.array(ds.parent, dtype=np.intp)
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return parent
+        parent = grandparent
+
+
+def _cheapest_edges(
+    ranks: np.ndarray, comp_u: np.ndarray, comp_v: np.ndarray, n: int
+) -> np.ndarray:
+    """Lowest crossing edge rank per component root (intp max where none)."""
+    best = np.full(n, np.iinfo(np.intp).max, dtype=np.intp)
+    np.minimum.at(best, comp_u, ranks)
+    np.minimum.at(best, comp_v, ranks)
+    return best
+
+
+def _mst_prim_csr(graph: CSRGraph, heap: str = "lazy") -> MSTResult:
+    """Prim's algorithm over CSR arrays; node indices preserve name order."""
+    if heap == "indexed":
+        return _mst_prim_csr_indexed(graph)
+
+    nodes = graph.nodes
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weight_cost
+
+    visited = bytearray(len(nodes))
+    mst_edges: List[MSTEdge] = []
+    total_cost = 0.0
+    num_components = 0
+
+    for start in range(len(nodes)):
+        if visited[start]:
+            continue
+
+        num_components += 1
+        visited[start] = 1
+        pq: List[tuple] = []
+
+        for k in range(offsets[start], offsets[start + 1]):
+            if not visited[targets[k]]:
+                heapq.heappush(pq, (weights[k], start, targets[k]))
+
+        while pq:
+            weight, u, v = heapq.heappop(pq)
+
+            if visited[v]:
+                continue
+
+            visited[v] = 1
+            mst_edges.append(MSTEdge(nodes[u], nodes[v], weight))
+            total_cost += weight
+
+            for k in range(offsets[v], offsets[v + 1]):
+                if not visited[targets[k]]:
+                    heapq.heappush(pq, (weights[k], v, targets[k]))
+
+    mst_edges.sort(key=lambda e: (e.u, e.v))
+
+    return MSTResult(
+        edges=mst_edges,
+        total_cost=total_cost,
+        is_forest=num_components > 1,
+        num_components=num_components,
+        engine="heap",
+    )
+
+
+def _mst_prim_csr_indexed(graph: CSRGraph) -> MSTResult:
+    nodes = graph.nodes
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weight_cost
+
+    visited = bytearray(len(nodes))
+    mst_edges: List[MSTEdge] = []
+    total_cost = 0.0
+    num_components = 0
+
+    for start in range(len(nodes)):
+        if visited[start]:
+            continue
+
+        num_components += 1
+        pq = IndexedHeap()
+        u = start
+
+        while True:
+            visited[u] = 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if not visited[v]:
+                    pq.push_or_decrease(v, (weights[k], u))
+
+            if not pq:
+                break
+
+            (weight, parent), u = pq.pop()
+            mst_edges.append(MSTEdge(nodes[parent], nodes[u], weight))
+            total_cost += weight
+
+    mst_edges.sort(key=lambda e: (e.u, e.v))
+
+    return MSTResult(
+        edges=mst_edges,
+        total_cost=total_cost,
+        is_forest=num_components > 1,
+        num_components=num_components,
+        engine="heap",
+    )
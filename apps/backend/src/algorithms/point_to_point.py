@@ -0,0 +1,286 @@
+"""Point-to-point shortest paths on weight_cost: bidirectional Dijkstra and A*."""
+
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from .csr import GraphLike
+
+Heuristic = Callable[[str], float]
+
+DEFAULT_LANDMARKS = 4
+
+# Approximate CPython footprint of one node -> distance item in a landmark
+# table (dict slot and float), measured with tracemalloc
+_DISTANCE_ITEM_BYTES = 100
+
+
+class PointToPointResult:
+    def __init__(
+        self,
+        distance: Optional[float],
+        path: List[str],
+        settled: int,
+    ):
+        self.distance = distance
+        self.path = path
+        self.settled = settled
+
+    @property
+    def found(self) -> bool:
+        return self.distance is not None
+
+
+def bidirectional_dijkstra(
+    graph: GraphLike, source: str, target: str
+) -> PointToPointResult:
+    """
+    Dijkstra grown from both ends until the two frontiers meet.
+
+    The backward search runs on the graph's reverse adjacency
+    (get_predecessors), which is built once per graph. Each step expands the
+    side with the smaller queue key; the search stops once the two keys sum
+    to at least the best source-target path seen so far. Only the path to
+    target is built. With several shortest paths, the one returned may
+    differ from dijkstra's, but the distance is the same.
+
+    settled counts nodes settled by both searches together.
+    """
+    _check_endpoints(graph, source, target)
+    if source == target:
+        return PointToPointResult(0.0, [source], 1)
+
+    INF = float("inf")
+    dist = ({source: 0.0}, {target: 0.0})
+    parent: Tuple[Dict[str, Optional[str]], Dict[str, Optional[str]]] = (
+        {source: None},
+        {target: None},
+    )
+    settled = (set(), set())
+    queues = ([(0.0, source)], [(0.0, target)])
+    expand = (graph.get_neighbors, graph.get_predecessors)
+
+    best = INF
+    meeting: Optional[str] = None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        other = 1 - side
+        dist_u, u = heapq.heappop(queues[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        for edge in expand[side](u):
+            v = edge.to
+            new_dist = dist_u + edge.weight_cost
+
+            if v not in dist[side] or new_dist < dist[side][v]:
+                dist[side][v] = new_dist
+                parent[side][v] = u
+                heapq.heappush(queues[side], (new_dist, v))
+
+            if v in dist[other]:
+                through = dist[side][v] + dist[other][v]
+                if through < best:
+                    best = through
+                    meeting = v
+
+    settled_count = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return PointToPointResult(None, [], settled_count)
+
+    path = _walk(parent[0], meeting)
+    path.reverse()
+    path.extend(_walk(parent[1], meeting)[1:])
+    return PointToPointResult(best, path, settled_count)
+
+
+def astar(
+    graph: GraphLike,
+    source: str,
+    target: str,
+    heuristic: Optional[Heuristic] = None,
+) -> PointToPointResult:
+    """
+    A* search guided by heuristic(node), a lower bound on the distance to target.
+
+    The heuristic must be admissible (never overestimate); a node reached
+    again with a shorter distance is re-expanded, so consistency is not
+    required. Without a heuristic this is plain Dijkstra stopped at target.
+    See landmark_heuristic for the ALT bound. settled counts expansions.
+    """
+    _check_endpoints(graph, source, target)
+    if heuristic is None:
+        heuristic = _zero
+
+    dist: Dict[str, float] = {source: 0.0}
+    parent: Dict[str, Optional[str]] = {source: None}
+    pq = [(heuristic(source), 0.0, source)]
+    settled = 0
+
+    while pq:
+        _, dist_u, u = heapq.heappop(pq)
+        if dist_u > dist[u]:
+            continue
+        settled += 1
+
+        if u == target:
+            path = _walk(parent, target)
+            path.reverse()
+            return PointToPointResult(dist_u, path, settled)
+
+        for edge in graph.get_neighbors(u):
+            v = edge.to
+            new_dist = dist_u + edge.weight_cost
+
+            if v not in dist or new_dist < dist[v]:
+                estimate = heuristic(v)
+                if estimate == float("inf"):
+                    continue
+                dist[v] = new_dist
+                parent[v] = u
+                heapq.heappush(pq, (new_dist + estimate, new_dist, v))
+
+    return PointToPointResult(None, [], settled)
+
+
+class Landmarks:
+    """
+    Distances from and to a few landmark nodes, for ALT lower bounds.
+
+    By the triangle inequality, for every landmark L:
+        d(v, t) >= d(L, t) - d(L, v)   and   d(v, t) >= d(v, L) - d(t, L)
+    Landmarks are picked greedily, each as far as possible from those
+    already chosen, starting from the first node in sorted order.
+    """
+
+    def __init__(self, graph: GraphLike, count: int = DEFAULT_LANDMARKS):
+        if count < 1:
+            raise ValueError("Landmark count must be at least 1")
+
+        self.landmarks: List[str] = []
+        self.from_landmark: List[Dict[str, float]] = []
+        self.to_landmark: List[Dict[str, float]] = []
+
+        candidate = graph.nodes[0] if graph.nodes else None
+        closest: Dict[str, float] = {}
+
+        while candidate is not None and len(self.landmarks) < count:
+            self.landmarks.append(candidate)
+            forward = _distances(graph.get_neighbors, candidate)
+            self.from_landmark.append(forward)
+            self.to_landmark.append(_distances(graph.get_predecessors, candidate))
+
+            for node, d in forward.items():
+                closest[node] = min(closest.get(node, d), d)
+
+            candidate = None
+            farthest = 0.0
+            for node in graph.nodes:
+                d = closest.get(node)
+                if d is not None and d > farthest and node not in self.landmarks:
+                    candidate, farthest = node, d
+
+    def nbytes(self) -> int:
+        """Estimated bytes of the distance tables."""
+        tables = self.from_landmark + self.to_landmark
+        return sum(len(table) for table in tables) * _DISTANCE_ITEM_BYTES
+
+    def heuristic(self, target: str) -> Heuristic:
+        """Admissible estimate of d(node, target); inf means unreachable."""
+        INF = float("inf")
+        bounds = [
+            (
+                from_landmark.get(target, INF),
+                from_landmark,
+                to_landmark.get(target, INF),
+                to_landmark,
+            )
+            for from_landmark, to_landmark in zip(self.from_landmark, self.to_landmark)
+        ]
+
+        def estimate(node: str) -> float:
+            best = 0.0
+            for from_target, from_landmark, to_target, to_landmark in bounds:
+                from_node = from_landmark.get(node, INF)
+                if from_node < INF:
+                    # L reaches node but not target: neither does node
+                    if from_target == INF:
+                        return INF
+                    best = max(best, from_target - from_node)
+
+                if to_target < INF:
+                    to_node = to_landmark.get(node, INF)
+                    # target reaches L but node does not: node cannot reach target
+                    if to_node == INF:
+                        return INF
+                    best = max(best, to_node - to_target)
+            return best
+
+        return estimate
+
+
+_landmark_cache: "WeakKeyDictionary[GraphLike, Dict[int, Landmarks]]" = WeakKeyDictionary()
+
+
+def landmark_heuristic(
+    graph: GraphLike, target: str, count: int = DEFAULT_LANDMARKS
+) -> Heuristic:
+    """ALT heuristic for target, with landmarks computed once per graph and count."""
+    by_count = _landmark_cache.setdefault(graph, {})
+    landmarks = by_count.get(count)
+    if landmarks is None:
+        landmarks = Landmarks(graph, count)
+        by_count[count] = landmarks
+    return landmarks.heuristic(target)
+
+
+def landmarks_nbytes(graph: GraphLike) -> int:
+    """Bytes of the landmarks memoized for graph by landmark_heuristic."""
+    by_count = _landmark_cache.get(graph, {})
+    return sum(landmarks.nbytes() for landmarks in by_count.values())
+
+
+def _check_endpoints(graph: GraphLike, source: str, target: str) -> None:
+    if source not in graph.nodes:
+        raise ValueError(f"Source node '{source}' not in graph")
+    if target not in graph.nodes:
+        raise ValueError(f"Target node '{target}' not in graph")
+
+
+def _zero(node: str) -> float:
+    return 0.0
+
+
+def _walk(parent: Dict[str, Optional[str]], node: str) -> List[str]:
+    path = []
+    current: Optional[str] = node
+    while current is not None:
+        path.append(current)
+        current = parent[current]
+    return path
+
+
+def _distances(expand: Callable, start: str) -> Dict[str, float]:
+    """Plain Dijkstra over weight_cost along expand (successors or predecessors)."""
+    dist = {start: 0.0}
+    done = set()
+    pq = [(0.0, start)]
+
+    while pq:
+        dist_u, u = heapq.heappop(pq)
+        if u in done:
+            continue
+        done.add(u)
+
+        for edge in expand(u):
+            new_dist = dist_u + edge.weight_cost
+            if edge.to not in dist or new_dist < dist[edge.to]:
+                dist[edge.to] = new_dist
+                heapq.heappush(pq, (new_dist, edge.to))
+
+    return dist
@@ -1,21 +1,57 @@
 """Shortest path algorithms: Dijkstra and Bellman-Ford."""
 
 import heapq
-from typing import Dict, List, Optional
+from collections import deque
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
 
-from .graph import Graph
+from .csr import CSRGraph, GraphLike
+from .heap import IndexedHeap
+
+HeapKind = Literal["lazy", "indexed"]
+
+
+class LazyPaths(Mapping):
+    """
+    Read-only node -> path mapping backed by a parent map.
+
+    Paths are built by walking parent pointers when a node is looked up, so
+    results cost O(V) to produce no matter how deep the shortest-path tree
+    is. Keys are the nodes of the parent map; the source maps to [source].
+    """
+
+    def __init__(self, parent: Dict[str, Optional[str]], source: str):
+        self._parent = parent
+        self._source = source
+
+    def __getitem__(self, node: str) -> List[str]:
+        if node not in self._parent:
+            raise KeyError(node)
+        if node == self._source:
+            return [node]
+        return _walk_parents(self._parent, node)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parent)
+
+    def __len__(self) -> int:
+        return len(self._parent)
 
 
 class DijkstraResult:
     def __init__(
         self,
         distances: Dict[str, Optional[float]],
-        paths: Dict[str, List[str]],
+        parent: Dict[str, Optional[str]],
+        source: str,
         found: bool = True,
+        settled: int = 0,
     ):
         self.distances = distances
-        self.paths = paths
+        self.parent = parent
+        self.paths = LazyPaths(parent, source)
         self.found = found
+        self.settled = settled
 
 
 class BellmanFordResult:
@@ -24,18 +60,47 @@ class BellmanFordResult:
         negative_cycle_found: bool,
         cycle: Optional[List[str]],
         distances: Dict[str, Optional[float]],
-        paths: Dict[str, List[str]],
+        parent: Dict[str, Optional[str]],
+        source: str,
     ):
         self.negative_cycle_found = negative_cycle_found
         self.cycle = cycle
         self.distances = distances
-        self.paths = paths
-
-
-def dijkstra(graph: Graph, source: str, target: Optional[str] = None) -> DijkstraResult:
+        self.parent = parent
+        self.paths = LazyPaths(parent, source)
+
+
+def dijkstra(
+    graph: GraphLike,
+    source: str,
+    target: Optional[str] = None,
+    heap: HeapKind = "lazy",
+) -> DijkstraResult:
+    """
+    Dijkstra on weight_cost.
+
+    heap selects the priority queue: "lazy" pushes a new heapq entry per
+    relaxation and skips stale ones; "indexed" keeps one entry per node in
+    an IndexedHeap and decreases its key. Both settle nodes in the same
+    order and return identical results.
+    """
     if source not in graph.nodes:
         raise ValueError(f"Source node '{source}' not in graph")
 
+    if heap == "indexed":
+        if isinstance(graph, CSRGraph):
+            distances, parent, settled = _dijkstra_csr_indexed(graph, source, target)
+        else:
+            distances, parent, settled = _dijkstra_indexed(graph, source, target)
+        return _dijkstra_result(graph, source, target, distances, parent, settled)
+
+    if heap != "lazy":
+        raise ValueError(f"Unknown heap: {heap}")
+
+    if isinstance(graph, CSRGraph):
+        distances, parent, settled = _dijkstra_csr(graph, source, target)
+        return _dijkstra_result(graph, source, target, distances, parent, settled)
+
     distances: Dict[str, float] = {source: 0.0}
     parent: Dict[str, Optional[str]] = {source: None}
     visited = set()
@@ -65,36 +130,111 @@ def dijkstra(graph: Graph, source: str, target: Optional[str] = None) -> Dijkstr
                 parent[v] = u
                 heapq.heappush(pq, (new_dist, v))
 
-    paths: Dict[str, List[str]] = {}
-    for node in distances:
-        if node == source:
-            paths[node] = [source]
-        else:
-            path = []
-            current = node
-            while current is not None:
-                path.append(current)
-                current = parent.get(current)
-            paths[node] = list(reversed(path))
+    return _dijkstra_result(graph, source, target, distances, parent, len(visited))
+
+
+def _dijkstra_indexed(
+    graph: GraphLike, source: str, target: Optional[str]
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]], int]:
+    distances: Dict[str, float] = {source: 0.0}
+    parent: Dict[str, Optional[str]] = {source: None}
+    visited = set()
+
+    pq = IndexedHeap()
+    pq.push_or_decrease(source, 0.0)
+
+    while pq:
+        dist_u, u = pq.pop()
+        visited.add(u)
+
+        if target and u == target:
+            break
+
+        for edge in graph.get_neighbors(u):
+            v = edge.to
+            if v in visited:
+                continue
+
+            new_dist = dist_u + edge.weight_cost
+
+            if v not in distances or new_dist < distances[v]:
+                distances[v] = new_dist
+                parent[v] = u
+                pq.push_or_decrease(v, new_dist)
+
+    return distances, parent, len(visited)
+
 
+def _dijkstra_result(
+    graph: GraphLike,
+    source: str,
+    target: Optional[str],
+    distances: Dict[str, float],
+    parent: Dict[str, Optional[str]],
+    settled: int,
+) -> DijkstraResult:
     all_distances: Dict[str, Optional[float]] = {}
     for node in graph.nodes:
         all_distances[node] = distances.get(node)
 
     if target:
         found = target in distances
-        return DijkstraResult(distances=all_distances, paths=paths, found=found)
-
-    return DijkstraResult(distances=all_distances, paths=paths, found=True)
+        return DijkstraResult(
+            distances=all_distances,
+            parent=parent,
+            source=source,
+            found=found,
+            settled=settled,
+        )
+
+    return DijkstraResult(
+        distances=all_distances,
+        parent=parent,
+        source=source,
+        found=True,
+        settled=settled,
+    )
 
 
 def bellman_ford(
-    graph: Graph, source: str, detect_negative_cycle: bool = True
+    graph: GraphLike,
+    source: str,
+    detect_negative_cycle: bool = True,
+    mode: Literal["rounds", "queue"] = "rounds",
 ) -> BellmanFordResult:
+    """
+    Bellman-Ford on weight_neglog.
+
+    Modes:
+        rounds: up to n-1 full sweeps over all edges, then one detection sweep
+        queue: SPFA-style relaxation that only revisits nodes whose distance
+            improved, stopping as soon as the parent graph closes a cycle
+
+    Both modes report cycles through _extract_cycle. On graphs with several
+    negative cycles they may report different ones. With
+    detect_negative_cycle=False the queue mode still stops at the first cycle
+    (it could not converge otherwise) but does not report it.
+    """
     if source not in graph.nodes:
         raise ValueError(f"Source node '{source}' not in graph")
 
     n = len(graph.nodes)
+
+    if mode == "queue":
+        distances, parent, cycle_node = _bellman_ford_queue(graph, source)
+        if not detect_negative_cycle:
+            cycle_node = None
+        return _bellman_ford_result(graph, source, distances, parent, cycle_node)
+
+    if mode != "rounds":
+        raise ValueError(f"Unknown Bellman-Ford mode: {mode}")
+
+    if isinstance(graph, CSRGraph):
+        distances, parent, cycle_node = _bellman_ford_csr(
+            graph, source, detect_negative_cycle
+        )
+        return _bellman_ford_result(graph, source, distances, parent, cycle_node)
+
     distances: Dict[str, float] = {source: 0.0}
     parent: Dict[str, Optional[str]] = {source: None}
 
@@ -116,11 +256,9 @@ def bellman_ford(
         if not updated:
             break
 
-    negative_cycle_found = False
-    cycle: Optional[List[str]] = None
+    cycle_node: Optional[str] = None
 
     if detect_negative_cycle:
-        cycle_node = None
         for u in graph.nodes:
             if u not in distances:
                 continue
@@ -132,31 +270,27 @@ def bellman_ford(
 
                 new_dist = distances[u] + edge.weight_neglog
                 if new_dist < distances[v]:
-                    negative_cycle_found = True
                     cycle_node = v
                     parent[v] = u
                     break
 
-            if negative_cycle_found:
+            if cycle_node is not None:
                 break
 
-        if negative_cycle_found and cycle_node:
-            cycle = _extract_cycle(parent, cycle_node, n)
+    return _bellman_ford_result(graph, source, distances, parent, cycle_node)
 
-    paths: Dict[str, List[str]] = {}
-    if not negative_cycle_found:
-        for node in distances:
-            if node == source:
-                paths[node] = [source]
-            else:
-                path = []
-                current = node
-                visited_in_path = set()
-                while current is not None and current not in visited_in_path:
-                    path.append(current)
-                    visited_in_path.add(current)
-                    current = parent.get(current)
-                paths[node] = list(reversed(path))
+
+def _bellman_ford_result(
+    graph: GraphLike,
+    source: str,
+    distances: Dict[str, float],
+    parent: Dict[str, Optional[str]],
+    cycle_node: Optional[str],
+) -> BellmanFordResult:
+    negative_cycle_found = cycle_node is not None
+    cycle: Optional[List[str]] = None
+    if negative_cycle_found:
+        cycle = _extract_cycle(parent, cycle_node, len(graph.nodes))
 
     if not negative_cycle_found:
         all_distances: Dict[str, Optional[float]] = {
@@ -164,15 +298,267 @@ def bellman_ford(
         }
     else:
         all_distances = {}
+        parent = {}
 
     return BellmanFordResult(
         negative_cycle_found=negative_cycle_found,
         cycle=cycle,
         distances=all_distances,
-        paths=paths,
+        parent=parent,
+        source=source,
     )
 
 
+def _bellman_ford_queue(
+    graph: GraphLike, source: str
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]], Optional[str]]:
+    """
+    Queue-driven relaxation (SPFA) with early negative-cycle exit.
+
+    A node is re-queued only when its distance improves. The parent graph is
+    scanned for a cycle when a path reaches n edges and after every n
+    relaxations, but never within n // 2 relaxations of the previous scan.
+    Each O(V) scan is therefore paid for by at least n / 2 relaxations, so
+    detection costs O(1) amortized per relaxation. Once a reachable
+    negative cycle exists the parent graph keeps a cycle after finitely
+    many relaxations, and the periodic scan finds it, which guarantees
+    termination.
+    """
+    n = len(graph.nodes)
+    distances: Dict[str, float] = {source: 0.0}
+    parent: Dict[str, Optional[str]] = {source: None}
+    path_length: Dict[str, int] = {source: 0}
+
+    queue = deque([source])
+    queued = {source}
+    relaxations = 0
+    last_scan = 0
+    scan_gap = n // 2 + 1
+
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+
+        for edge in graph.get_neighbors(u):
+            v = edge.to
+            new_dist = distances[u] + edge.weight_neglog
+
+            if v not in distances or new_dist < distances[v]:
+                distances[v] = new_dist
+                parent[v] = u
+                path_length[v] = path_length[u] + 1
+                relaxations += 1
+
+                if (
+                    path_length[v] >= n or relaxations % n == 0
+                ) and relaxations - last_scan >= scan_gap:
+                    last_scan = relaxations
+                    cycle_node = _find_parent_cycle(parent)
+                    if cycle_node is not None:
+                        return distances, parent, cycle_node
+
+                if v not in queued:
+                    queued.add(v)
+                    queue.append(v)
+
+    return distances, parent, None
+
+
+def _find_parent_cycle(parent: Dict[str, Optional[str]]) -> Optional[str]:
+    """Return a node on a cycle of the parent graph, or None if it is a forest."""
+    # 1 = on the walk being traced, 2 = known to lead to a root
+    state: Dict[str, int] = {}
+
+    for start in parent:
+        if start in state:
+            continue
+
+        walk = []
+        node: Optional[str] = start
+        while node is not None and node not in state:
+            state[node] = 1
+            walk.append(node)
+            node = parent.get(node)
+
+        if node is not None and state[node] == 1:
+            return node
+
+        for visited in walk:
+            state[visited] = 2
+
+    return None
+
+
+def _dijkstra_csr(
+    graph: CSRGraph, source: str, target: Optional[str]
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]], int]:
+    nodes = graph.nodes
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weight_cost
+
+    s = graph.index[source]
+    t = graph.index.get(target) if target else None
+
+    INF = float("inf")
+    dist = [INF] * len(nodes)
+    parent_idx = [-1] * len(nodes)
+    visited = bytearray(len(nodes))
+    reached = [s]
+    dist[s] = 0.0
+
+    pq = [(0.0, s)]
+
+    while pq:
+        dist_u, u = heapq.heappop(pq)
+
+        if visited[u]:
+            continue
+
+        visited[u] = 1
+
+        if u == t:
+            break
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if visited[v]:
+                continue
+
+            new_dist = dist_u + weights[k]
+
+            if new_dist < dist[v]:
+                if dist[v] == INF:
+                    reached.append(v)
+                dist[v] = new_dist
+                parent_idx[v] = u
+                heapq.heappush(pq, (new_dist, v))
+
+    distances = {nodes[u]: dist[u] for u in reached}
+    parent: Dict[str, Optional[str]] = {
+        nodes[u]: (nodes[parent_idx[u]] if parent_idx[u] >= 0 else None)
+        for u in reached
+    }
+    return distances, parent, visited.count(1)
+
+
+def _dijkstra_csr_indexed(
+    graph: CSRGraph, source: str, target: Optional[str]
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]], int]:
+    nodes = graph.nodes
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weight_cost
+
+    s = graph.index[source]
+    t = graph.index.get(target) if target else None
+
+    INF = float("inf")
+    dist = [INF] * len(nodes)
+    parent_idx = [-1] * len(nodes)
+    visited = bytearray(len(nodes))
+    reached = [s]
+    dist[s] = 0.0
+    settled = 0
+
+    pq = IndexedHeap()
+    pq.push_or_decrease(s, 0.0)
+
+    while pq:
+        dist_u, u = pq.pop()
+        visited[u] = 1
+        settled += 1
+
+        if u == t:
+            break
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if visited[v]:
+                continue
+
+            new_dist = dist_u + weights[k]
+
+            if new_dist < dist[v]:
+                if dist[v] == INF:
+                    reached.append(v)
+                dist[v] = new_dist
+                parent_idx[v] = u
+                pq.push_or_decrease(v, new_dist)
+
+    distances = {nodes[u]: dist[u] for u in reached}
+    parent: Dict[str, Optional[str]] = {
+        nodes[u]: (nodes[parent_idx[u]] if parent_idx[u] >= 0 else None)
+        for u in reached
+    }
+    return distances, parent, settled
+
+
+def _bellman_ford_csr(
+    graph: CSRGraph, source: str, detect_negative_cycle: bool
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]], Optional[str]]:
+    nodes = graph.nodes
+    n = len(nodes)
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weight_neglog
+
+    s = graph.index[source]
+
+    INF = float("inf")
+    dist = [INF] * n
+    parent_idx = [-1] * n
+    reached = [s]
+    dist[s] = 0.0
+
+    for _ in range(n - 1):
+        updated = False
+        for u in range(n):
+            if dist[u] == INF:
+                continue
+
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                new_dist = dist[u] + weights[k]
+
+                if new_dist < dist[v]:
+                    if dist[v] == INF:
+                        reached.append(v)
+                    dist[v] = new_dist
+                    parent_idx[v] = u
+                    updated = True
+
+        if not updated:
+            break
+
+    cycle_idx = -1
+    if detect_negative_cycle:
+        for u in range(n):
+            if dist[u] == INF:
+                continue
+
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if dist[v] == INF:
+                    continue
+
+                if dist[u] + weights[k] < dist[v]:
+                    cycle_idx = v
+                    parent_idx[v] = u
+                    break
+
+            if cycle_idx >= 0:
+                break
+
+    distances = {nodes[u]: dist[u] for u in reached}
+    parent: Dict[str, Optional[str]] = {
+        nodes[u]: (nodes[parent_idx[u]] if parent_idx[u] >= 0 else None)
+        for u in reached
+    }
+    cycle_node = nodes[cycle_idx] if cycle_idx >= 0 else None
+    return distances, parent, cycle_node
+
+
 def _extract_cycle(
     parent: Dict[str, Optional[str]], start_node: str, n: int
 ) -> List[str]:
@@ -190,8 +576,43 @@ def _extract_cycle(
     cycle.reverse()
 
     if cycle:
-        min_idx = cycle.index(min(cycle))
-        cycle = cycle[min_idx:] + cycle[:min_idx]
+        cycle = _min_rotation(cycle)
         cycle.append(cycle[0])
 
     return cycle
+
+
+def _walk_parents(parent: Dict[str, Optional[str]], node: str) -> List[str]:
+    """Path from the root of node's parent chain down to node."""
+    path = []
+    current: Optional[str] = node
+    limit = len(parent)
+    while current is not None:
+        path.append(current)
+        if len(path) > limit:
+            # Only reachable when negative-cycle detection was turned off
+            return _walk_parents_until_repeat(parent, node)
+        current = parent.get(current)
+    path.reverse()
+    return path
+
+
+def _walk_parents_until_repeat(
+    parent: Dict[str, Optional[str]], node: str
+) -> List[str]:
+    """Like _walk_parents, but stops before the first repeated node."""
+    path = []
+    seen = set()
+    current: Optional[str] = node
+    while current is not None and current not in seen:
+        path.append(current)
+        seen.add(current)
+        current = parent.get(current)
+    path.reverse()
+    return path
+
+
+def _min_rotation(cycle: List) -> List:
+    """Rotate an open cycle so it starts at its smallest node."""
+    min_idx = cycle.index(min(cycle))
+    return cycle[min_idx:] + cycle[:min_idx]
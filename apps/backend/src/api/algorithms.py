@@ -1,14 +1,32 @@
 """Algorithm execution endpoints."""
 
+import asyncio
+import functools
+import inspect
+import json
 import logging
 from datetime import datetime, timezone
-from typing import Optional, Tuple
-
-from fastapi import APIRouter, HTTPException
-
-from ..algorithms import all_pairs, mst, shortest_path, traversal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+
+from ..algorithms import (
+    all_pairs,
+    arbitrage,
+    mst,
+    point_to_point,
+    shortest_path,
+    traversal,
+)
 from ..algorithms.graph import Graph
+from ..graph.columns import EdgeColumns
 from ..models import (
+    ArbitrageCycle,
+    ArbitrageCyclesRequest,
+    ArbitrageCyclesResponse,
+    BFSBatchRequest,
+    BFSBatchResponse,
     BFSRequest,
     BFSResponse,
     BellmanFordRequest,
@@ -21,12 +39,14 @@ from ..models import (
     FloydWarshallRequest,
     FloydWarshallResponse,
     GraphPayload,
+    IncrementalCycleRequest,
+    IncrementalCycleResponse,
     MSTEdgeResponse,
     MSTRequest,
     MSTResponse,
     PathDetail,
 )
-from ..cache import graph_cache
+from ..cache import CacheEntry, ResultKey, cycle_detectors, graph_cache, result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +56,20 @@ router = APIRouter()
 async def load_graph_from_snapshot(
     snapshot_id: Optional[str] = None,
     graph_payload: Optional[GraphPayload] = None,
+    undirected: bool = False,
+    entry: Optional[CacheEntry] = None,
 ) -> Tuple[str, Graph]:
     """
     Load graph from graph_payload or cache by snapshot_id.
 
+    Cached snapshots hold a compiled Graph (and its undirected projection),
+    so no graph construction happens for snapshot_id lookups.
+
     Args:
         snapshot_id: Optional snapshot ID (used to read cache)
+        graph_payload: Optional inline payload (stored under snapshot_id if given)
+        undirected: Return the undirected projection instead of the directed graph
+        entry: Cache entry already resolved for snapshot_id (skips the lookup)
 
     Returns:
         Tuple of (resolved_snapshot_id, Graph instance)
@@ -51,17 +79,19 @@ async def load_graph_from_snapshot(
     """
     try:
         if graph_payload is not None:
-            resolved_snapshot_id = snapshot_id or "local"
             if snapshot_id:
-                graph_cache.set(
+                entry = graph_cache.set(
                     snapshot_id,
                     graph_payload,
                     datetime.now(timezone.utc).isoformat(),
                 )
+                graph = entry.undirected_graph if undirected else entry.graph
+                return snapshot_id, graph
 
-            graph_payload_dict = graph_payload.model_dump(mode="json", by_alias=True)
-            graph = Graph.from_graph_payload(graph_payload_dict, directed=True)
-            return resolved_snapshot_id, graph
+            graph = EdgeColumns.from_payload(graph_payload).to_graph(directed=True)
+            if undirected:
+                graph = graph.to_undirected()
+            return "local", graph
 
         if snapshot_id is None:
             raise HTTPException(
@@ -69,15 +99,11 @@ async def load_graph_from_snapshot(
                 detail="graph_payload is required when no snapshot_id is provided.",
             )
 
-        cached = graph_cache.get(snapshot_id)
+        cached = entry if entry is not None else graph_cache.get(snapshot_id)
         if cached is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Snapshot not found in cache: {snapshot_id}",
-            )
+            raise _snapshot_not_found(snapshot_id)
 
-        graph_payload_dict = cached.graph_payload.model_dump(mode="json", by_alias=True)
-        graph = Graph.from_graph_payload(graph_payload_dict, directed=True)
+        graph = cached.undirected_graph if undirected else cached.graph
         return snapshot_id, graph
 
     except HTTPException:
@@ -88,8 +114,111 @@ async def load_graph_from_snapshot(
         raise HTTPException(status_code=500, detail="Error loading snapshot")
 
 
+def _snapshot_not_found(snapshot_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail=f"Snapshot not found in cache: {snapshot_id}",
+    )
+
+
+def memoized(
+    algorithm: str,
+    ignore: Union[Tuple[str, ...], Callable[[Any], Tuple[str, ...]]] = (),
+):
+    """
+    Serve repeated requests on a cached snapshot from result_cache.
+
+    Only requests that name a snapshot_id and carry no graph_payload are
+    memoized; inline payloads may overwrite the snapshot and run as usual.
+    Parameters are normalized by dumping the request with defaults filled
+    in, minus ``ignore``: every field the endpoint does not read or that
+    does not change its response (scheduling knobs, options of other
+    methods). ``ignore`` may be a function of the request when that depends
+    on another field.
+    Concurrent misses on the same key share one computation (see
+    _single_flight).
+
+    The snapshot is looked up once here and passed to the handler as
+    ``entry``, which FastAPI does not see. Responses are serialized once
+    and stored as JSON; hits and misses alike return those bytes.
+    """
+
+    def decorate(handler: Callable[..., Awaitable[Any]]):
+        @functools.wraps(handler)
+        async def run(request):
+            if request.graph_payload is not None or request.snapshot_id is None:
+                return await handler(request)
+
+            entry = graph_cache.get(request.snapshot_id)
+            if entry is None:
+                raise _snapshot_not_found(request.snapshot_id)
+
+            ignored = ignore(request) if callable(ignore) else ignore
+            params = request.model_dump(
+                mode="json", exclude={"snapshot_id", "graph_payload", *ignored}
+            )
+            key = (request.snapshot_id, algorithm, json.dumps(params, sort_keys=True))
+            body = result_cache.get(key, entry)
+            if body is None:
+                body = await _single_flight(
+                    key, entry, lambda: handler(request, entry=entry)
+                )
+            return Response(content=body, media_type="application/json")
+
+        # Expose only the request parameter to FastAPI
+        signature = inspect.signature(handler)
+        run.__signature__ = signature.replace(
+            parameters=[signature.parameters["request"]]
+        )
+        return run
+
+    return decorate
+
+
+# Computations running for a memoized key, with the entry they read
+_in_flight: Dict[ResultKey, Tuple[CacheEntry, "asyncio.Task[bytes]"]] = {}
+
+
+async def _single_flight(
+    key: ResultKey, entry: CacheEntry, compute: Callable[[], Awaitable[Any]]
+) -> bytes:
+    """
+    Await the in-flight computation for key, or start one.
+
+    Requests that arrive while a computation for the same key and cache
+    entry is running await that task instead of computing again; errors
+    are shared the same way. The task is shielded, so a disconnecting
+    client does not cancel it for the others. The response is serialized
+    once and stored in result_cache before the task completes; callers get
+    the JSON bytes.
+    """
+    in_flight = _in_flight.get(key)
+    if in_flight is None or in_flight[0] is not entry:
+
+        async def compute_and_store() -> bytes:
+            response = await compute()
+            # Serialized like FastAPI's response_model output
+            body = response.model_dump_json(by_alias=True).encode()
+            result_cache.put(key, entry, body)
+            # The computation may have memoized lookups on the entry's graphs
+            graph_cache.remeasure(key[0], entry)
+            return body
+
+        in_flight = (entry, asyncio.ensure_future(compute_and_store()))
+        _in_flight[key] = in_flight
+
+        def done(_task: "asyncio.Task[bytes]", in_flight=in_flight) -> None:
+            if _in_flight.get(key) is in_flight:
+                del _in_flight[key]
+
+        in_flight[1].add_done_callback(done)
+
+    return await asyncio.shield(in_flight[1])
+
+
 @router.post("/algorithms/bfs", response_model=BFSResponse)
-async def run_bfs(request: BFSRequest):
+@memoized("bfs")
+async def run_bfs(request: BFSRequest, entry: Optional[CacheEntry] = None):
     """
     Run BFS (Breadth-First Search) traversal.
 
@@ -97,10 +226,10 @@ async def run_bfs(request: BFSRequest):
     """
     try:
         snapshot_id, graph = await load_graph_from_snapshot(
-            request.snapshot_id, request.graph_payload
+            request.snapshot_id, request.graph_payload, entry=entry
         )
 
-        result = traversal.bfs(graph, request.start_node)
+        result = traversal.bfs(graph, request.start_node, mode=request.mode)
 
         return BFSResponse(
             snapshot_id=snapshot_id,
@@ -114,8 +243,40 @@ async def run_bfs(request: BFSRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/algorithms/bfs/batch", response_model=BFSBatchResponse)
+@memoized("bfs_batch")
+async def run_bfs_batch(request: BFSBatchRequest, entry: Optional[CacheEntry] = None):
+    """
+    Run BFS from several start nodes in one pass.
+
+    Returns a depth map per start node, optionally limited to max_depth hops.
+    """
+    try:
+        snapshot_id, graph = await load_graph_from_snapshot(
+            request.snapshot_id, request.graph_payload, entry=entry
+        )
+
+        result = traversal.multi_source_bfs(
+            graph, request.start_nodes, request.max_depth
+        )
+
+        return BFSBatchResponse(
+            snapshot_id=snapshot_id,
+            start_nodes=list(result.depth),
+            max_depth=request.max_depth,
+            depth=result.depth,
+            reachable_count={
+                start: len(depths) for start, depths in result.depth.items()
+            },
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post("/algorithms/dfs", response_model=DFSResponse)
-async def run_dfs(request: DFSRequest):
+@memoized("dfs")
+async def run_dfs(request: DFSRequest, entry: Optional[CacheEntry] = None):
     """
     Run DFS (Depth-First Search) traversal.
 
@@ -123,7 +284,7 @@ async def run_dfs(request: DFSRequest):
     """
     try:
         snapshot_id, graph = await load_graph_from_snapshot(
-            request.snapshot_id, request.graph_payload
+            request.snapshot_id, request.graph_payload, entry=entry
         )
 
         result = traversal.dfs(graph, request.start_node)
@@ -141,20 +302,39 @@ async def run_dfs(request: DFSRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _dijkstra_ignore(request: DijkstraRequest) -> Tuple[str, ...]:
+    """Options the requested method does not read."""
+    if request.method == "dijkstra":
+        return ("landmarks",)
+    if request.method == "astar":
+        return ("heap",)
+    return ("landmarks", "heap")
+
+
 @router.post("/algorithms/dijkstra", response_model=DijkstraResponse)
-async def run_dijkstra(request: DijkstraRequest):
+@memoized("dijkstra", ignore=_dijkstra_ignore)
+async def run_dijkstra(request: DijkstraRequest, entry: Optional[CacheEntry] = None):
     """
     Run Dijkstra's shortest path algorithm using weight_cost.
 
     If target is specified, returns path to target.
     If target is None, returns distances to all reachable nodes.
+
+    method="bidirectional" or "astar" (ALT landmark heuristic) answer a
+    single source-target query: only the target's path and distance are
+    returned. settled_nodes reports the size of the search either way.
     """
     try:
         snapshot_id, graph = await load_graph_from_snapshot(
-            request.snapshot_id, request.graph_payload
+            request.snapshot_id, request.graph_payload, entry=entry
         )
 
-        result = shortest_path.dijkstra(graph, request.source, request.target)
+        if request.method != "dijkstra":
+            return _run_point_to_point(snapshot_id, graph, request)
+
+        result = shortest_path.dijkstra(
+            graph, request.source, request.target, heap=request.heap
+        )
 
         # Build path details if target specified and found
         path_details = []
@@ -165,14 +345,7 @@ async def run_dijkstra(request: DijkstraRequest):
             path = result.paths.get(request.target, [])
             distance_to_target = result.distances.get(request.target)
 
-            # Build path details
-            for i in range(len(path) - 1):
-                u, v = path[i], path[i + 1]
-                weight = graph.get_weight(u, v, "cost")
-                if weight is not None:
-                    path_details.append(
-                        PathDetail(**{"from": u, "to": v, "weight": weight})
-                    )
+            path_details = _path_details(graph, path)
 
         return DijkstraResponse(
             snapshot_id=snapshot_id,
@@ -183,26 +356,77 @@ async def run_dijkstra(request: DijkstraRequest):
             path=path,
             path_details=path_details,
             all_distances=result.distances,
+            settled_nodes=result.settled,
         )
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _run_point_to_point(
+    snapshot_id: str, graph: Graph, request: DijkstraRequest
+) -> DijkstraResponse:
+    if request.target is None:
+        raise ValueError(f"target is required for method '{request.method}'")
+
+    if request.method == "bidirectional":
+        result = point_to_point.bidirectional_dijkstra(
+            graph, request.source, request.target
+        )
+    else:
+        # Landmarks are memoized per graph, so they only pay off on cached
+        # snapshots; an inline payload is compiled afresh for each request.
+        # Unknown targets are reported by astar; skip building landmarks for them
+        heuristic = None
+        cached = request.snapshot_id is not None
+        if cached and request.landmarks and request.target in graph.nodes:
+            heuristic = point_to_point.landmark_heuristic(
+                graph, request.target, request.landmarks
+            )
+        result = point_to_point.astar(graph, request.source, request.target, heuristic)
+
+    return DijkstraResponse(
+        snapshot_id=snapshot_id,
+        method=request.method,
+        source=request.source,
+        target=request.target,
+        found=result.found,
+        distance=result.distance,
+        path=result.path,
+        path_details=_path_details(graph, result.path),
+        all_distances={request.target: result.distance},
+        settled_nodes=result.settled,
+    )
+
+
+def _path_details(graph: Graph, path: List[str]) -> List[PathDetail]:
+    """One PathDetail per hop of path, weighted by weight_cost."""
+    return [
+        PathDetail(**{"from": u, "to": v, "weight": weight})
+        for u, v, weight in zip(path, path[1:], graph.get_path_weights(path))
+        if weight is not None
+    ]
+
+
 @router.post("/algorithms/bellman-ford", response_model=BellmanFordResponse)
-async def run_bellman_ford(request: BellmanFordRequest):
+@memoized("bellman_ford")
+async def run_bellman_ford(
+    request: BellmanFordRequest, entry: Optional[CacheEntry] = None
+):
     """
     Run Bellman-Ford shortest path algorithm using weight_neglog.
 
     Detects negative cycles and returns explicit cycle.
+    With path_format="parent" the response carries the parent map instead
+    of one path per node.
     """
     try:
         snapshot_id, graph = await load_graph_from_snapshot(
-            request.snapshot_id, request.graph_payload
+            request.snapshot_id, request.graph_payload, entry=entry
         )
 
         result = shortest_path.bellman_ford(
-            graph, request.source, request.detect_negative_cycle
+            graph, request.source, request.detect_negative_cycle, mode=request.mode
         )
 
         return BellmanFordResponse(
@@ -211,7 +435,82 @@ async def run_bellman_ford(request: BellmanFordRequest):
             negative_cycle_found=result.negative_cycle_found,
             cycle=result.cycle,
             distances=result.distances,
-            paths=result.paths,
+            paths=dict(result.paths) if request.path_format == "paths" else {},
+            parent=result.parent if request.path_format == "parent" else None,
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post(
+    "/algorithms/bellman-ford/incremental", response_model=IncrementalCycleResponse
+)
+async def run_bellman_ford_incremental(request: IncrementalCycleRequest):
+    """
+    Apply edge weight updates to a cached snapshot's negative-cycle detector.
+
+    The detector keeps Bellman-Ford potentials between calls, so each batch
+    only re-relaxes the region it affects. Updates live in the detector
+    only; the cached snapshot is unchanged, and overwriting it resets the
+    detector. Reports whether a negative cycle appeared or disappeared.
+    """
+    try:
+        detector = cycle_detectors.get(request.snapshot_id)
+        if detector is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Snapshot not found in cache: {request.snapshot_id}",
+            )
+
+        result = detector.update(
+            (update.source, update.target, update.weight_neglog)
+            for update in request.updates
+        )
+
+        return IncrementalCycleResponse(
+            snapshot_id=request.snapshot_id,
+            negative_cycle_found=result.negative_cycle_found,
+            cycle=result.cycle,
+            appeared=result.appeared,
+            disappeared=result.disappeared,
+            updates_applied=len(request.updates),
+            relaxations=result.relaxations,
+            rebuilt=result.rebuilt,
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/algorithms/arbitrage/cycles", response_model=ArbitrageCyclesResponse)
+async def run_arbitrage_cycles(request: ArbitrageCyclesRequest):
+    """
+    Enumerate elementary negative cycles (arbitrage loops) on weight_neglog.
+
+    Cycles are ranked by profit = -sum(weight_neglog). The search is bounded
+    by max_length, max_cycles and time_budget_ms; complete is False when a
+    bound cut it short.
+    """
+    try:
+        snapshot_id, graph = await load_graph_from_snapshot(
+            request.snapshot_id, request.graph_payload
+        )
+
+        result = arbitrage.find_negative_cycles(
+            graph,
+            max_length=request.max_length,
+            max_cycles=request.max_cycles,
+            time_budget=request.time_budget_ms / 1000,
+        )
+
+        return ArbitrageCyclesResponse(
+            snapshot_id=snapshot_id,
+            cycles=[ArbitrageCycle(**cycle.to_dict()) for cycle in result.cycles],
+            cycle_count=len(result.cycles),
+            complete=result.complete,
+            truncated=result.truncated,
+            timed_out=result.timed_out,
         )
 
     except ValueError as e:
@@ -219,7 +518,10 @@ async def run_bellman_ford(request: BellmanFordRequest):
 
 
 @router.post("/algorithms/floyd-warshall", response_model=FloydWarshallResponse)
-async def run_floyd_warshall(request: FloydWarshallRequest):
+@memoized("floyd_warshall", ignore=("block_size", "workers"))
+async def run_floyd_warshall(
+    request: FloydWarshallRequest, entry: Optional[CacheEntry] = None
+):
     """
     Run Floyd-Warshall all-pairs shortest path algorithm.
 
@@ -228,10 +530,18 @@ async def run_floyd_warshall(request: FloydWarshallRequest):
     """
     try:
         snapshot_id, graph = await load_graph_from_snapshot(
-            request.snapshot_id, request.graph_payload
+            request.snapshot_id, request.graph_payload, entry=entry
         )
 
-        result = all_pairs.floyd_warshall(graph, request.weight_mode)
+        # O(V^3) work; run it off the event loop so other requests proceed
+        result = await run_in_threadpool(
+            all_pairs.floyd_warshall,
+            graph,
+            request.weight_mode,
+            engine=request.engine,
+            block_size=request.block_size,
+            workers=request.workers,
+        )
 
         # Convert centrality to response format
         centrality_response = {}
@@ -244,11 +554,14 @@ async def run_floyd_warshall(request: FloydWarshallRequest):
         return FloydWarshallResponse(
             snapshot_id=snapshot_id,
             weight_mode=request.weight_mode,
+            engine=result.engine,
             node_order=result.node_order,
             distance_matrix=result.distance_matrix,
             central_node=result.central_node,
             centrality=centrality_response,
             centrality_note=result.centrality_note,
+            negative_cycle_found=result.negative_cycle_found,
+            cycle=result.cycle,
         )
 
     except ValueError as e:
@@ -256,21 +569,23 @@ async def run_floyd_warshall(request: FloydWarshallRequest):
 
 
 @router.post("/algorithms/mst/prim", response_model=MSTResponse)
-async def run_mst_prim(request: MSTRequest):
+@memoized("mst_prim")
+async def run_mst_prim(request: MSTRequest, entry: Optional[CacheEntry] = None):
     """
     Run Prim's MST algorithm on undirected graph projection.
 
-    For disconnected graphs, returns spanning forest.
+    For disconnected graphs, returns spanning forest. With engine=auto,
+    near-complete graphs run on the dense O(V^2) engine unless a heap is
+    requested; the response reports the engine that ran.
     """
     try:
-        snapshot_id, graph = await load_graph_from_snapshot(
-            request.snapshot_id, request.graph_payload
+        snapshot_id, undirected_graph = await load_graph_from_snapshot(
+            request.snapshot_id, request.graph_payload, undirected=True, entry=entry
         )
 
-        # Convert to undirected graph
-        undirected_graph = graph.to_undirected()
-
-        result = mst.mst_prim(undirected_graph)
+        result = mst.mst_prim(
+            undirected_graph, heap=request.heap, engine=request.engine
+        )
 
         # Convert edges to response format
         edges_response = [edge.to_dict() for edge in result.edges]
@@ -282,6 +597,7 @@ async def run_mst_prim(request: MSTRequest):
             total_cost=result.total_cost,
             is_forest=result.is_forest,
             num_components=result.num_components,
+            engine=result.engine,
         )
 
     except ValueError as e:
@@ -289,20 +605,18 @@ async def run_mst_prim(request: MSTRequest):
 
 
 @router.post("/algorithms/mst/kruskal", response_model=MSTResponse)
-async def run_mst_kruskal(request: MSTRequest):
+@memoized("mst_kruskal", ignore=("heap", "engine"))
+async def run_mst_kruskal(request: MSTRequest, entry: Optional[CacheEntry] = None):
     """
     Run Kruskal's MST algorithm on undirected graph projection.
 
     For disconnected graphs, returns spanning forest.
     """
     try:
-        snapshot_id, graph = await load_graph_from_snapshot(
-            request.snapshot_id, request.graph_payload
+        snapshot_id, undirected_graph = await load_graph_from_snapshot(
+            request.snapshot_id, request.graph_payload, undirected=True, entry=entry
         )
 
-        # Convert to undirected graph
-        undirected_graph = graph.to_undirected()
-
         result = mst.mst_kruskal(undirected_graph)
 
         # Convert edges to response format
@@ -319,3 +633,35 @@ async def run_mst_kruskal(request: MSTRequest):
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/algorithms/mst/boruvka", response_model=MSTResponse)
+@memoized("mst_boruvka", ignore=("heap", "engine"))
+async def run_mst_boruvka(request: MSTRequest, entry: Optional[CacheEntry] = None):
+    """
+    Run Boruvka's MST algorithm on undirected graph projection.
+
+    Cheapest-edge scans are vectorized; ties break on (weight, u, v) like
+    Kruskal. For disconnected graphs, returns spanning forest.
+    """
+    try:
+        snapshot_id, undirected_graph = await load_graph_from_snapshot(
+            request.snapshot_id, request.graph_payload, undirected=True, entry=entry
+        )
+
+        result = mst.mst_boruvka(undirected_graph)
+
+        # Convert edges to response format
+        edges_response = [edge.to_dict() for edge in result.edges]
+
+        return MSTResponse(
+            snapshot_id=snapshot_id,
+            algorithm="mst_boruvka",
+            edges=edges_response,
+            total_cost=result.total_cost,
+            is_forest=result.is_forest,
+            num_components=result.num_components,
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -105,7 +105,7 @@ async def generate_snapshot(request: Optional[GenerationRequest] = None):
         cost_model = CostModel(base_cost=config.base_cost, extra_cost=config.extra_cost)
         graph_builder = GraphBuilder(cost_model=cost_model)
 
-        graph_payload = graph_builder.build_graph(
+        columns = graph_builder.build_columns(
             node_values=dataset.node_values,
             nodes=nodes,
             pairs=pairs,
@@ -119,16 +119,16 @@ async def generate_snapshot(request: Optional[GenerationRequest] = None):
             anchor_node=dataset.anchor_node,
             scenario_id=dataset.scenario_id,
         )
-        graph_cache.set(snapshot_id, graph_payload, timestamp_str)
+        graph_cache.set(snapshot_id, columns, timestamp_str)
 
         return GenerationResponse(
             snapshot_id=snapshot_id,
             timestamp=timestamp_str,
-            node_count=graph_payload.metadata.node_count,
-            edge_count=graph_payload.metadata.edge_count,
+            node_count=len(columns.nodes),
+            edge_count=len(columns),
             dataset_type=dataset.dataset_type,
             scenario_id=dataset.scenario_id,
-            graph_payload=graph_payload,
+            graph_payload=columns.to_payload() if request.include_graph_payload else None,
         )
 
     except ValueError as e:
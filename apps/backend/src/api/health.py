@@ -7,7 +7,7 @@ from fastapi import APIRouter
 
 from ..config import config
 from ..models import HealthResponse
-from ..cache import graph_cache
+from ..cache import graph_cache, result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +19,27 @@ async def health_check():
     """
     Health check endpoint.
 
-    Returns service status and latest snapshot info.
+    Returns service status, latest snapshot info and graph/result cache counters.
     """
     try:
         latest = graph_cache.latest()
-        latest_snapshot = latest[1].timestamp if latest else None
+        latest_snapshot = latest[1] if latest else None
         snapshot_count = graph_cache.size()
+        cache_stats = graph_cache.stats()
+        result_stats = result_cache.stats()
     except Exception as e:
         logger.warning(f"Failed to load cache info for health check: {e}")
         latest_snapshot = None
         snapshot_count = 0
+        cache_stats = None
+        result_stats = None
 
     return HealthResponse(
         status="healthy",
         latest_snapshot=latest_snapshot,
         snapshot_count=snapshot_count,
+        graph_cache=cache_stats,
+        result_cache=result_stats,
     )
 
 
@@ -1,49 +1,438 @@
-"""In-memory graph cache for ephemeral snapshots."""
+"""Graph cache for snapshots, optionally backed by a persistent store."""
 
 from collections import OrderedDict
 from dataclasses import dataclass
 from threading import Lock
-from typing import Optional
-
-from .models import GraphPayload
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
 
+from .algorithms import mst, point_to_point
+from .algorithms.graph import Graph
+from .algorithms.incremental import IncrementalCycleDetector
+from .graph.columns import EdgeColumns
+from .config import config
+from .models import CacheStats, GraphPayload
+from .snapshot_store import SnapshotStore, open_snapshot_store
 
 @dataclass(frozen=True)
 class CacheEntry:
-    graph_payload: GraphPayload
+    """
+    Cached snapshot.
+
+    The edges are kept as EdgeColumns rather than the payload models they may
+    have arrived in. Each entry also carries the compiled directed Graph
+    and its undirected projection. Both are built once when the snapshot is
+    stored and shared read-only by every algorithm request. The sorted edge
+    list used by Kruskal and Boruvka (mst.sorted_edges) is memoized on the
+    projection on first use and lives as long as the entry.
+    """
+
+    columns: EdgeColumns
     timestamp: str
+    graph: Graph
+    undirected_graph: Graph
+
+    @property
+    def graph_payload(self) -> GraphPayload:
+        """The snapshot as a GraphPayload, built on demand for responses."""
+        return self.columns.to_payload()
+
+    def nbytes(self) -> int:
+        """
+        Estimated memory footprint of the entry.
+
+        Counts the edge columns, both compiled graphs and whatever has been
+        memoized on them so far (reverse adjacency, weight index, sorted MST
+        edges, ALT landmarks), so the estimate grows as derived results are
+        built.
+        """
+        return self.columns.nbytes() + sum(
+            graph.nbytes()
+            + mst.sorted_edges_nbytes(graph)
+            + point_to_point.landmarks_nbytes(graph)
+            for graph in (self.graph, self.undirected_graph)
+        )
+
+    @classmethod
+    def build(
+        cls, edges: Union[EdgeColumns, GraphPayload], timestamp: str
+    ) -> "CacheEntry":
+        if isinstance(edges, EdgeColumns):
+            columns = edges
+        else:
+            columns = EdgeColumns.from_payload(edges)
+        graph = columns.to_graph(directed=True)
+        return cls(
+            columns=columns,
+            timestamp=timestamp,
+            graph=graph,
+            undirected_graph=graph.to_undirected(),
+        )
 
 
 class GraphCache:
-    def __init__(self, max_size: int = 50):
-        self.max_size = max_size
+    """
+    LRU of compiled snapshots, in front of an optional SnapshotStore.
+
+    Without a store the cache is the only copy of each snapshot. With one,
+    ``set`` also persists the columns, and ``get``/``latest`` compile
+    snapshots written by other workers (or before a restart) on first use.
+    A compiled entry is reused only while the store still reports the
+    version it was loaded from, so overwrites by another worker are seen.
+    After each ``set`` the store's retention policy is applied: snapshots it
+    reports as expired are deleted from disk and from this cache.
+
+    Compiled entries are evicted least recently used first once their
+    estimated footprint exceeds max_bytes. An entry's size is
+    CacheEntry.nbytes plus whatever the hooks registered with
+    ``add_size_hook`` report for it (e.g. its cycle detector). Sizes are
+    measured when an entry is stored and again when ``remeasure`` is called
+    after something was memoized on it; a running total is kept, so lookups
+    and stats never re-walk the cache. The entry just stored is always
+    kept, even if it alone is over budget. With a store, evicted snapshots
+    stay on disk and are recompiled on demand.
+
+    Callbacks registered with ``on_remove`` are called with the key of
+    every entry that is overwritten, evicted or found gone from the store.
+    """
+
+    def __init__(
+        self, max_bytes: int = 512 * 1024 * 1024, store: Optional[SnapshotStore] = None
+    ):
+        self.max_bytes = max_bytes
+        self.store = store
         self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._versions: Dict[str, Hashable] = {}
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
         self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._remove_callbacks: List[Callable[[str], None]] = []
+        self._size_hooks: List[Callable[[str, CacheEntry], int]] = []
+
+    def on_remove(self, callback: Callable[[str], None]) -> None:
+        self._remove_callbacks.append(callback)
+
+    def add_size_hook(self, hook: Callable[[str, CacheEntry], int]) -> None:
+        """Count hook(key, entry) bytes, held elsewhere for an entry, against it."""
+        self._size_hooks.append(hook)
+
+    def remeasure(self, key: str, entry: CacheEntry) -> None:
+        """
+        Re-estimate a cached entry after results were memoized on it.
 
-    def set(self, key: str, graph_payload: GraphPayload, timestamp: str) -> None:
+        Evicts least recently used entries if the new total is over budget.
+        Does nothing if key no longer holds entry.
+        """
+        nbytes = self._measure(key, entry)
         with self._lock:
-            self._cache[key] = CacheEntry(graph_payload=graph_payload, timestamp=timestamp)
-            self._cache.move_to_end(key)
-            while len(self._cache) > self.max_size:
-                self._cache.popitem(last=False)
+            if self._cache.get(key) is not entry:
+                return
+            self._bytes += nbytes - self._sizes[key]
+            self._sizes[key] = nbytes
+            removed = self._evict_over_budget()
+        self._notify_removed(removed)
+
+    def set(
+        self, key: str, edges: Union[EdgeColumns, GraphPayload], timestamp: str
+    ) -> CacheEntry:
+        # Compile outside the lock so readers are not blocked by graph construction
+        entry = CacheEntry.build(edges, timestamp)
+        version = None
+        if self.store is not None:
+            self.store.save(key, entry.columns, timestamp)
+            version = self.store.version(key)
+        self._insert(key, entry, version)
+        if self.store is not None:
+            for expired in self.store.expired_keys():
+                if expired != key:
+                    self.delete(expired)
+        return entry
+
+    def delete(self, key: str) -> bool:
+        """Remove a snapshot from the cache and the store; False if unknown."""
+        with self._lock:
+            cached = key in self._cache
+        deleted = self.store.delete(key) if self.store is not None else False
+        self._discard(key)
+        return cached or deleted
 
     def get(self, key: str) -> Optional[CacheEntry]:
+        if self.store is None:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry:
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                else:
+                    self._misses += 1
+                return entry
+
+        version = self.store.version(key)
         with self._lock:
             entry = self._cache.get(key)
-            if entry:
-                self._cache.move_to_end(key)
-            return entry
+            if entry is not None and version is not None:
+                if self._versions.get(key) == version:
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return entry
+            self._misses += 1
+        if version is None:
+            self._discard(key)
+            return None
+
+        # Missing here or overwritten by another worker; compile outside the lock
+        loaded = self.store.load(key)
+        if loaded is None:
+            self._discard(key)
+            return None
+        columns, timestamp, version = loaded
+        entry = CacheEntry.build(columns, timestamp)
+        self._insert(key, entry, version)
+        return entry
+
+    def latest(self) -> Optional[Tuple[str, str]]:
+        """
+        Key and timestamp of the most recent snapshot.
+
+        With a store the timestamp comes from the snapshot's header, so
+        nothing is compiled and the hit/miss counters are not touched.
+        """
+        if self.store is not None:
+            key = self.store.latest_key()
+            timestamp = self.store.timestamp(key) if key is not None else None
+            return (key, timestamp) if timestamp is not None else None
 
-    def latest(self) -> Optional[tuple[str, CacheEntry]]:
         with self._lock:
             if not self._cache:
                 return None
             key = next(reversed(self._cache))
-            return key, self._cache[key]
+            return key, self._cache[key].timestamp
 
     def size(self) -> int:
+        if self.store is not None:
+            return len(self.store)
         with self._lock:
             return len(self._cache)
 
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return _cache_stats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._cache),
+                self._bytes,
+                self.max_bytes,
+            )
+
+    def is_current(self, key: str, entry: CacheEntry) -> bool:
+        """Whether key still holds entry (not overwritten, evicted or deleted)."""
+        with self._lock:
+            return self._cache.get(key) is entry
+
+    def __contains__(self, key: str) -> bool:
+        if self.store is not None:
+            return key in self.store
+        with self._lock:
+            return key in self._cache
+
+    def _insert(self, key: str, entry: CacheEntry, version: Optional[Hashable]) -> None:
+        nbytes = self._measure(key, entry)
+        with self._lock:
+            self._bytes += nbytes - self._sizes.get(key, 0)
+            self._sizes[key] = nbytes
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            self._versions[key] = version
+            removed = [key] + self._evict_over_budget()
+        self._notify_removed(removed)
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            if self._cache.pop(key, None) is not None:
+                self._bytes -= self._sizes.pop(key)
+            self._versions.pop(key, None)
+        self._notify_removed([key])
+
+    def _measure(self, key: str, entry: CacheEntry) -> int:
+        # Called outside the lock: hooks may take their own locks
+        return entry.nbytes() + sum(hook(key, entry) for hook in self._size_hooks)
+
+    def _evict_over_budget(self) -> List[str]:
+        """Pop LRU entries until within max_bytes; the caller holds the lock."""
+        evicted = []
+        while self._bytes > self.max_bytes and len(self._cache) > 1:
+            key, _ = self._cache.popitem(last=False)
+            self._versions.pop(key, None)
+            self._bytes -= self._sizes.pop(key)
+            self._evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _notify_removed(self, keys: List[str]) -> None:
+        # Called outside the lock so callbacks may use the cache
+        for callback in self._remove_callbacks:
+            for key in keys:
+                callback(key)
+
+
+class CycleDetectorRegistry:
+    """
+    Incremental negative-cycle detectors, one per cached snapshot.
+
+    A detector is built on first use and tied to the cache entry it was
+    built from: when the snapshot is overwritten a fresh detector replaces
+    it, and detectors are dropped as soon as GraphCache overwrites, evicts
+    or deletes their snapshot.
+    """
+
+    def __init__(self, cache: GraphCache):
+        self._cache = cache
+        self._detectors: Dict[str, Tuple[CacheEntry, IncrementalCycleDetector]] = {}
+        self._lock = Lock()
+        cache.on_remove(self._drop)
+        cache.add_size_hook(self._nbytes)
+
+    def get(self, key: str) -> Optional[IncrementalCycleDetector]:
+        entry = self._cache.get(key)
+        if entry is None:
+            with self._lock:
+                self._detectors.pop(key, None)
+            return None
+
+        with self._lock:
+            stored = self._detectors.get(key)
+            if stored is not None and stored[0] is entry:
+                return stored[1]
+
+        # Initial Bellman-Ford runs outside the lock
+        detector = IncrementalCycleDetector(entry.graph)
+        with self._lock:
+            stored = self._detectors.get(key)
+            if stored is not None and stored[0] is entry:
+                return stored[1]
+            self._detectors[key] = (entry, detector)
+        self._cache.remeasure(key, entry)
+        return detector
+
+    def _nbytes(self, key: str, entry: CacheEntry) -> int:
+        with self._lock:
+            stored = self._detectors.get(key)
+        if stored is None or stored[0] is not entry:
+            return 0
+        return stored[1].nbytes()
+
+    def _drop(self, key: str) -> None:
+        with self._lock:
+            self._detectors.pop(key, None)
+
+
+# (snapshot_id, algorithm, normalized params)
+ResultKey = Tuple[str, str, str]
+
+
+class ResultCache:
+    """
+    Algorithm responses memoized per cached snapshot.
+
+    Keys are (snapshot_id, algorithm, normalized params). Like detectors in
+    CycleDetectorRegistry, each result is tied to the cache entry it was
+    computed from and is only served for that same entry. Results are also
+    dropped eagerly when GraphCache overwrites or evicts their snapshot,
+    and a result whose entry already left the cache is not stored at all.
+
+    Results are stored as the JSON bodies served to clients, so a hit needs
+    no serialization. Eviction is LRU against max_bytes, counting the exact
+    length of each body.
+    """
+
+    def __init__(self, cache: GraphCache, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        # key -> (entry the result was computed from, JSON body)
+        self._results: "OrderedDict[ResultKey, Tuple[CacheEntry, bytes]]"
+        self._results = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._cache = cache
+        cache.on_remove(self.invalidate)
+
+    def get(self, key: ResultKey, entry: CacheEntry) -> Optional[bytes]:
+        with self._lock:
+            stored = self._results.get(key)
+            if stored is not None and stored[0] is entry:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return stored[1]
+            self._misses += 1
+            if stored is not None:
+                self._pop(key)
+            return None
+
+    def put(self, key: ResultKey, entry: CacheEntry, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            # Checked under the lock: a later removal's invalidate() waits
+            # for it, so no stale result (pinning its entry) is left behind
+            if not self._cache.is_current(key[0], entry):
+                return
+            if key in self._results:
+                self._pop(key)
+            self._results[key] = (entry, body)
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                self._pop(next(iter(self._results)))
+                self._evictions += 1
+
+    def invalidate(self, snapshot_id: str) -> None:
+        """Drop every result computed for snapshot_id."""
+        with self._lock:
+            for key in [key for key in self._results if key[0] == snapshot_id]:
+                self._pop(key)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return _cache_stats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._results),
+                self._bytes,
+                self.max_bytes,
+            )
+
+    def _pop(self, key: ResultKey) -> None:
+        self._bytes -= len(self._results.pop(key)[1])
+
+
+def _cache_stats(
+    hits: int, misses: int, evictions: int, entries: int, nbytes: int, max_bytes: int
+) -> CacheStats:
+    lookups = hits + misses
+    return CacheStats(
+        hits=hits,
+        misses=misses,
+        hit_rate=hits / lookups if lookups else 0.0,
+        evictions=evictions,
+        entries=entries,
+        bytes=nbytes,
+        max_bytes=max_bytes,
+    )
+
 
-graph_cache = GraphCache()
+graph_cache = GraphCache(
+    max_bytes=config.graph_cache_max_bytes,
+    store=open_snapshot_store(
+        config.snapshot_store_backend,
+        config.snapshot_store_directory,
+        max_snapshots=config.snapshot_store_max_snapshots,
+        max_age_seconds=config.snapshot_store_max_age_seconds,
+    ),
+)
+cycle_detectors = CycleDetectorRegistry(graph_cache)
+result_cache = ResultCache(graph_cache, max_bytes=config.result_cache_max_bytes)
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import yaml
 from dotenv import load_dotenv
@@ -33,6 +33,13 @@ class Config:
         self.api_host = os.getenv("API_HOST", "0.0.0.0")
         self.api_port = int(os.getenv("API_PORT", "8000"))
 
+        # Snapshot store settings
+        store = self._config.setdefault("snapshot_store", {})
+        if os.getenv("SNAPSHOT_STORE_BACKEND"):
+            store["backend"] = os.getenv("SNAPSHOT_STORE_BACKEND")
+        if os.getenv("SNAPSHOT_STORE_DIR"):
+            store["directory"] = os.getenv("SNAPSHOT_STORE_DIR")
+
     @property
     def nodes(self) -> List[str]:
         return self._config["nodes"]["default_list"]
@@ -57,5 +64,36 @@ class Config:
     def available_nodes(self) -> List[str]:
         return self._config["generated_data"]["available_nodes"]
 
+    @property
+    def graph_cache_max_bytes(self) -> int:
+        graph_cache = self._config.get("graph_cache") or {}
+        return int(graph_cache.get("max_bytes", 512 * 1024 * 1024))
+
+    @property
+    def result_cache_max_bytes(self) -> int:
+        result_cache = self._config.get("result_cache") or {}
+        return int(result_cache.get("max_bytes", 64 * 1024 * 1024))
+
+    @property
+    def snapshot_store_backend(self) -> str:
+        return self._config["snapshot_store"].get("backend", "memory")
+
+    @property
+    def snapshot_store_directory(self) -> Path:
+        """Snapshot directory; relative paths are resolved from the backend root."""
+        store = self._config["snapshot_store"]
+        directory = Path(store.get("directory", "data/snapshots"))
+        return directory if directory.is_absolute() else PROJECT_ROOT / directory
+
+    @property
+    def snapshot_store_max_snapshots(self) -> Optional[int]:
+        value = self._config["snapshot_store"].get("max_snapshots")
+        return int(value) if value is not None else None
+
+    @property
+    def snapshot_store_max_age_seconds(self) -> Optional[float]:
+        value = self._config["snapshot_store"].get("max_age_seconds")
+        return float(value) if value is not None else None
+
 # Global config instance
 config = Config()
@@ -1,7 +1,8 @@
 """Graph building and weight calculation."""
 
 from .builder import GraphBuilder
+from .columns import EdgeColumns
 from .weights import WeightCalculator
 
-__all__ = ["GraphBuilder", "WeightCalculator"]
+__all__ = ["EdgeColumns", "GraphBuilder", "WeightCalculator"]
 
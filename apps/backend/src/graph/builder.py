@@ -2,7 +2,10 @@
 
 from typing import Dict, List, Tuple
 
-from ..models import CostModel, GraphEdge, GraphMetadata, GraphNode, GraphPayload
+import numpy as np
+
+from ..models import CostModel, GraphPayload
+from .columns import EdgeColumns
 from .weights import WeightCalculator
 
 
@@ -17,80 +20,105 @@ class GraphBuilder:
         nodes: List[str],
         pairs: List[Tuple[str, str]] | None = None,
     ) -> GraphPayload:
+        return self.build_columns(node_values, nodes, pairs).to_payload()
+
+    def build_columns(
+        self,
+        node_values: Dict[str, float],
+        nodes: List[str],
+        pairs: List[Tuple[str, str]] | None = None,
+    ) -> EdgeColumns:
+        """
+        Same graph as build_graph, as EdgeColumns over the sorted nodes.
+
+        Edges keep the order of pairs (all ordered pairs of nodes, in the
+        given node order, when pairs is omitted).
+        """
         missing = set(nodes) - set(node_values.keys())
         if missing:
             raise ValueError(f"Missing values for nodes: {', '.join(missing)}")
 
-        graph_nodes = [GraphNode(id=node) for node in sorted(nodes)]
+        graph_nodes = sorted(nodes)
+        index = {node: i for i, node in enumerate(graph_nodes)}
 
         if not pairs:
-            pairs = self._build_full_pairs(nodes)
+            sources, targets = self._full_pair_indices(nodes, index)
+        else:
+            sources, targets = self._pair_indices(pairs, index)
 
-        edges = self._build_pairs_edges(node_values, pairs)
+        values = np.array([node_values[node] for node in graph_nodes], dtype=np.float64)
+        weight_cost, weight_neglog = self._edge_weights(
+            graph_nodes, values, sources, targets
+        )
 
-        metadata = GraphMetadata(node_count=len(graph_nodes), edge_count=len(edges))
+        return EdgeColumns(
+            nodes=graph_nodes,
+            source_idx=sources,
+            target_idx=targets,
+            weight_cost=weight_cost,
+            weight_neglog=weight_neglog,
+        )
 
-        return GraphPayload(nodes=graph_nodes, edges=edges, metadata=metadata)
+    @staticmethod
+    def _full_pair_indices(
+        nodes: List[str], index: Dict[str, int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.array([index[node] for node in nodes], dtype=np.int32)
+        sources = np.repeat(order, len(order))
+        targets = np.tile(order, len(order))
+        distinct = sources != targets
+        return sources[distinct], targets[distinct]
 
-    def _build_pairs_edges(
-        self,
-        node_values: Dict[str, float],
-        pairs: List[Tuple[str, str]],
-    ) -> List[GraphEdge]:
-        edges = []
-        available_nodes = set(node_values.keys())
+    @staticmethod
+    def _pair_indices(
+        pairs: List[Tuple[str, str]], index: Dict[str, int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        sources: List[int] = []
+        targets: List[int] = []
+        # Endpoints outside nodes are skipped even if they have a value: every
+        # edge must index into the node table, which is exactly nodes
         skipped_pairs = []
 
         for source, target in pairs:
-            if source not in available_nodes or target not in available_nodes:
+            if source not in index or target not in index:
                 skipped_pairs.append((source, target))
                 continue
 
             if source == target:
                 continue
 
-            edge = self._create_edge(source, target, node_values)
-            edges.append(edge)
+            sources.append(index[source])
+            targets.append(index[target])
 
-        if skipped_pairs and not edges:
+        if skipped_pairs and not sources:
             raise ValueError(
                 "No valid node pairs found. "
-                f"Available nodes: {', '.join(sorted(available_nodes))}."
+                f"Available nodes: {', '.join(sorted(index))}."
             )
 
-        return edges
+        return np.array(sources, dtype=np.int32), np.array(targets, dtype=np.int32)
 
-    @staticmethod
-    def _build_full_pairs(nodes: List[str]) -> List[Tuple[str, str]]:
-        pairs: List[Tuple[str, str]] = []
-        for source in nodes:
-            for target in nodes:
-                if source == target:
-                    continue
-                pairs.append((source, target))
-        return pairs
-
-    def _create_edge(
+    def _edge_weights(
         self,
-        source: str,
-        target: str,
-        node_values: Dict[str, float],
-    ) -> GraphEdge:
-        raw_value = node_values[target] / node_values[source]
-        value_factor = min(2.0, max(0.5, raw_value))
-
-        base_cost = self.cost_model.base_cost * (0.7 + 0.6 * value_factor)
-        extra_cost = self.cost_model.extra_cost * (0.8 + 0.4 / value_factor)
-
-        _, _, weight_cost, weight_neglog = self.weight_calculator.calculate_all_weights(
-            raw_value=raw_value,
-            base_cost=base_cost,
-            extra_cost=extra_cost,
+        nodes: List[str],
+        values: np.ndarray,
+        sources: np.ndarray,
+        targets: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(weight_cost, weight_neglog) arrays for the edges sources -> targets."""
+        raw_values = values[targets] / values[sources]
+        value_factors = np.clip(raw_values, 0.5, 2.0)
+
+        base_costs = self.cost_model.base_cost * (0.7 + 0.6 * value_factors)
+        extra_costs = self.cost_model.extra_cost * (0.8 + 0.4 / value_factors)
+
+        _, _, weight_cost, weight_neglog = (
+            self.weight_calculator.calculate_all_weights_batch(
+                raw_values,
+                base_costs,
+                extra_costs,
+                describe=lambda k: f"pair {nodes[sources[k]]} -> {nodes[targets[k]]}",
+            )
         )
 
-        return GraphEdge(
-            source=source,
-            target=target,
-            weight_cost=weight_cost,
-            weight_neglog=weight_neglog,
-        )
+        return weight_cost, weight_neglog
@@ -0,0 +1,126 @@
+"""Columnar edge storage shared by the builder, the cache and Graph."""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+from ..algorithms.graph import Graph
+from ..models import GraphEdge, GraphMetadata, GraphNode, GraphPayload
+
+# A short node id string plus its list slot
+_NODE_BYTES = 64
+
+
+@dataclass(frozen=True, eq=False)
+class EdgeColumns:
+    """
+    Edge list as parallel arrays over a node table.
+
+    Edge k runs from ``nodes[source_idx[k]]`` to ``nodes[target_idx[k]]``.
+    GraphBuilder produces this directly and the cache compiles Graph from
+    it, so no per-edge Pydantic model exists unless a response needs
+    ``graph_payload`` (see to_payload). Arrays are read-only, like Graph.
+    """
+
+    nodes: List[str]
+    source_idx: np.ndarray
+    target_idx: np.ndarray
+    weight_cost: np.ndarray
+    weight_neglog: np.ndarray
+
+    def __post_init__(self):
+        for column in (
+            self.source_idx,
+            self.target_idx,
+            self.weight_cost,
+            self.weight_neglog,
+        ):
+            column.setflags(write=False)
+
+    def __len__(self) -> int:
+        return len(self.weight_cost)
+
+    def nbytes(self) -> int:
+        """
+        Estimated bytes of the node table and edge arrays.
+
+        Memory-mapped arrays count in full, though their pages are shared.
+        """
+        return len(self.nodes) * _NODE_BYTES + sum(
+            column.nbytes
+            for column in (
+                self.source_idx,
+                self.target_idx,
+                self.weight_cost,
+                self.weight_neglog,
+            )
+        )
+
+    @classmethod
+    def from_lists(
+        cls,
+        nodes: List[str],
+        source_idx: List[int],
+        target_idx: List[int],
+        weight_cost: List[float],
+        weight_neglog: List[float],
+    ) -> "EdgeColumns":
+        return cls(
+            nodes=nodes,
+            source_idx=np.array(source_idx, dtype=np.int32),
+            target_idx=np.array(target_idx, dtype=np.int32),
+            weight_cost=np.array(weight_cost, dtype=np.float64),
+            weight_neglog=np.array(weight_neglog, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_payload(cls, graph_payload: GraphPayload) -> "EdgeColumns":
+        """Columns for a client-supplied payload, without dumping it to dicts."""
+        nodes = [node.id for node in graph_payload.nodes]
+        index = {node: i for i, node in enumerate(nodes)}
+        sources, targets, costs, neglogs = [], [], [], []
+
+        for edge in graph_payload.edges:
+            for node in (edge.source, edge.target):
+                if node not in index:
+                    raise ValueError(f"Unknown node in edge: {node}")
+            sources.append(index[edge.source])
+            targets.append(index[edge.target])
+            costs.append(edge.weight_cost)
+            neglogs.append(edge.weight_neglog)
+
+        return cls.from_lists(nodes, sources, targets, costs, neglogs)
+
+    def edge_tuples(self) -> List[Tuple[str, str, float, float]]:
+        """(source, target, weight_cost, weight_neglog) per edge, as Python values."""
+        nodes = self.nodes
+        return [
+            (nodes[u], nodes[v], cost, neglog)
+            for u, v, cost, neglog in zip(
+                self.source_idx.tolist(),
+                self.target_idx.tolist(),
+                self.weight_cost.tolist(),
+                self.weight_neglog.tolist(),
+            )
+        ]
+
+    def to_graph(self, directed: bool = True) -> Graph:
+        return Graph(self.nodes, self.edge_tuples(), directed=directed)
+
+    def to_payload(self) -> GraphPayload:
+        """GraphPayload for API responses; edges are built unvalidated."""
+        edges = [
+            GraphEdge.model_construct(
+                source=source,
+                target=target,
+                weight_cost=cost,
+                weight_neglog=neglog,
+            )
+            for source, target, cost, neglog in self.edge_tuples()
+        ]
+        return GraphPayload(
+            nodes=[GraphNode(id=node) for node in self.nodes],
+            edges=edges,
+            metadata=GraphMetadata(node_count=len(self.nodes), edge_count=len(edges)),
+        )
@@ -1,7 +1,9 @@
 """Weight calculation utilities."""
 
 import math
-from typing import Tuple
+from typing import Callable, Optional, Tuple
+
+import numpy as np
 
 
 class WeightCalculator:
@@ -42,3 +44,40 @@ class WeightCalculator:
         weight_cost = WeightCalculator.calculate_weight_cost(total_cost)
         weight_neglog = WeightCalculator.calculate_weight_neglog(effective_value)
         return total_cost, effective_value, weight_cost, weight_neglog
+
+    @staticmethod
+    def calculate_all_weights_batch(
+        raw_values: np.ndarray,
+        base_costs: np.ndarray,
+        extra_costs: np.ndarray,
+        describe: Optional[Callable[[int], str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        calculate_all_weights over whole arrays at once.
+
+        The first invalid element is re-checked with the scalar methods, so
+        the error message is the same as calculate_all_weights would give,
+        followed by describe(index) (e.g. the pair name) or the index.
+        """
+        total_costs = base_costs + extra_costs
+        effective_values = raw_values * (1 - total_costs / 10000)
+
+        invalid = (
+            (total_costs >= 10000)
+            | ~(raw_values > 0)
+            | (total_costs < 0)
+            | ~(effective_values > 0)
+        )
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            where = describe(i) if describe else f"index {i}"
+            try:
+                WeightCalculator.calculate_all_weights(
+                    float(raw_values[i]), float(base_costs[i]), float(extra_costs[i])
+                )
+            except ValueError as e:
+                raise ValueError(f"{e} ({where})") from None
+            raise ValueError(f"Invalid weight inputs ({where})")
+
+        weight_neglogs = -np.log(effective_values)
+        return total_costs, effective_values, total_costs, weight_neglogs
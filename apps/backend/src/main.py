@@ -49,12 +49,16 @@ async def root():
             "available_nodes": "GET /nodes",
             "algorithms": {
                 "bfs": "POST /algorithms/bfs",
+                "bfs_batch": "POST /algorithms/bfs/batch",
                 "dfs": "POST /algorithms/dfs",
                 "dijkstra": "POST /algorithms/dijkstra",
                 "bellman_ford": "POST /algorithms/bellman-ford",
+                "bellman_ford_incremental": "POST /algorithms/bellman-ford/incremental",
+                "arbitrage_cycles": "POST /algorithms/arbitrage/cycles",
                 "floyd_warshall": "POST /algorithms/floyd-warshall",
                 "mst_prim": "POST /algorithms/mst/prim",
                 "mst_kruskal": "POST /algorithms/mst/kruskal",
+                "mst_boruvka": "POST /algorithms/mst/boruvka",
             },
         },
     }
@@ -93,6 +93,13 @@ class GenerationRequest(BaseModel):
         None, validation_alias=AliasChoices("nodes", "currencies")
     )
     pairs: Optional[List[Tuple[str, str]]] = None
+    include_graph_payload: bool = Field(
+        True,
+        description=(
+            "Return the generated graph_payload; set false to only cache the "
+            "snapshot and query it by snapshot_id"
+        ),
+    )
 
 
 class GenerationResponse(BaseModel):
@@ -102,13 +109,25 @@ class GenerationResponse(BaseModel):
     edge_count: int
     dataset_type: str
     scenario_id: Optional[str] = None
-    graph_payload: GraphPayload
+    graph_payload: Optional[GraphPayload] = None
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = Field(0, description="Estimated memory held by cached entries")
+    max_bytes: int = 0
 
 
 class HealthResponse(BaseModel):
     status: str
     latest_snapshot: Optional[str] = None
     snapshot_count: int = 0
+    graph_cache: Optional[CacheStats] = None
+    result_cache: Optional[CacheStats] = None
 
 
 class BFSRequest(BaseModel):
@@ -117,6 +136,24 @@ class BFSRequest(BaseModel):
     start_node: str = Field(
         ..., validation_alias=AliasChoices("start_node", "start_currency")
     )
+    mode: Literal["top_down", "direction_optimizing"] = Field(
+        "top_down",
+        description=(
+            "top_down or direction_optimizing (bottom-up steps on large "
+            "frontiers; same depths, parents may differ)"
+        ),
+    )
+
+
+class BFSBatchRequest(BaseModel):
+    snapshot_id: Optional[str] = Field(None, description="Snapshot ID (default: latest)")
+    graph_payload: Optional[GraphPayload] = None
+    start_nodes: List[str] = Field(
+        ..., min_length=1, description="Start nodes, expanded together"
+    )
+    max_depth: Optional[int] = Field(
+        None, ge=0, description="Stop after this many hops (default: unlimited)"
+    )
 
 
 class DFSRequest(BaseModel):
@@ -132,6 +169,26 @@ class DijkstraRequest(BaseModel):
     graph_payload: Optional[GraphPayload] = None
     source: str
     target: Optional[str] = None
+    method: Literal["dijkstra", "bidirectional", "astar"] = Field(
+        "dijkstra",
+        description=(
+            "dijkstra (single frontier), bidirectional or astar; "
+            "bidirectional and astar need a target and only build its path"
+        ),
+    )
+    landmarks: int = Field(
+        4,
+        ge=0,
+        le=32,
+        description=(
+            "ALT landmarks for astar on cached snapshots (0 = no heuristic); "
+            "inline graph_payload requests run astar without a heuristic"
+        ),
+    )
+    heap: Literal["lazy", "indexed"] = Field(
+        "lazy",
+        description="Priority queue for dijkstra: lazy (heapq) or indexed (decrease-key)",
+    )
 
 
 class BellmanFordRequest(BaseModel):
@@ -139,17 +196,84 @@ class BellmanFordRequest(BaseModel):
     graph_payload: Optional[GraphPayload] = None
     source: str
     detect_negative_cycle: bool = True
+    mode: Literal["rounds", "queue"] = Field(
+        "rounds",
+        description="rounds (n-1 full sweeps) or queue (SPFA with early cycle exit)",
+    )
+    path_format: Literal["paths", "parent"] = Field(
+        "paths",
+        description="paths (full path per node) or parent (parent map, O(V) size)",
+    )
 
 
 class FloydWarshallRequest(BaseModel):
     snapshot_id: Optional[str] = Field(None, description="Snapshot ID (default: latest)")
     graph_payload: Optional[GraphPayload] = None
     weight_mode: Literal["cost", "neglog"]
+    engine: Literal["numpy", "python", "blocked", "johnson", "auto"] = Field(
+        "numpy",
+        description=(
+            "numpy (vectorized), python (reference implementation), "
+            "blocked (tiled, multi-process for large graphs), johnson "
+            "(sparse graphs) or auto (johnson or numpy by edge density)"
+        ),
+    )
+    block_size: Optional[int] = Field(
+        None, ge=8, le=4096, description="Tile size for the blocked engine"
+    )
+    workers: Optional[int] = Field(
+        None, ge=1, le=64, description="Worker processes for the blocked engine"
+    )
 
 
 class MSTRequest(BaseModel):
     snapshot_id: Optional[str] = Field(None, description="Snapshot ID (default: latest)")
     graph_payload: Optional[GraphPayload] = None
+    heap: Optional[Literal["lazy", "indexed"]] = Field(
+        None,
+        description=(
+            "Priority queue for Prim's heap engine: lazy (heapq, the default) "
+            "or indexed (decrease-key); rejected with engine=dense"
+        ),
+    )
+    engine: Literal["heap", "dense", "auto"] = Field(
+        "auto",
+        description=(
+            "Prim engine: heap, dense (O(V^2) matrix, for near-complete graphs) "
+            "or auto (dense or heap by edge density; heap when heap is set)"
+        ),
+    )
+
+
+class EdgeWeightUpdate(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    source: str = Field(
+        ..., validation_alias=AliasChoices("source", "from"), serialization_alias="from"
+    )
+    target: str = Field(
+        ..., validation_alias=AliasChoices("target", "to"), serialization_alias="to"
+    )
+    weight_neglog: float
+
+
+class IncrementalCycleRequest(BaseModel):
+    snapshot_id: str = Field(..., description="Cached snapshot the detector tracks")
+    updates: List[EdgeWeightUpdate] = Field(
+        default_factory=list, description="Batch of edge weight changes"
+    )
+
+
+class ArbitrageCyclesRequest(BaseModel):
+    snapshot_id: Optional[str] = Field(None, description="Snapshot ID (default: latest)")
+    graph_payload: Optional[GraphPayload] = None
+    max_length: int = Field(6, ge=1, le=12, description="Maximum edges per cycle")
+    max_cycles: int = Field(
+        100, ge=1, le=10000, description="Maximum number of cycles returned"
+    )
+    time_budget_ms: int = Field(
+        500, ge=1, le=30000, description="Search time budget in milliseconds"
+    )
 
 
 class BFSResponse(BaseModel):
@@ -161,6 +285,15 @@ class BFSResponse(BaseModel):
     depth: Dict[str, int]
 
 
+class BFSBatchResponse(BaseModel):
+    snapshot_id: str
+    algorithm: str = "bfs_batch"
+    start_nodes: List[str]
+    max_depth: Optional[int] = None
+    depth: Dict[str, Dict[str, int]]
+    reachable_count: Dict[str, int]
+
+
 class DFSResponse(BaseModel):
     snapshot_id: str
     algorithm: str = "dfs"
@@ -186,6 +319,7 @@ class PathDetail(BaseModel):
 class DijkstraResponse(BaseModel):
     snapshot_id: str
     algorithm: str = "dijkstra"
+    method: str = "dijkstra"
     source: str
     target: Optional[str] = None
     found: bool
@@ -193,6 +327,7 @@ class DijkstraResponse(BaseModel):
     path: List[str] = Field(default_factory=list)
     path_details: List[PathDetail] = Field(default_factory=list)
     all_distances: Dict[str, Optional[float]] = Field(default_factory=dict)
+    settled_nodes: int = 0
 
 
 class BellmanFordResponse(BaseModel):
@@ -203,6 +338,19 @@ class BellmanFordResponse(BaseModel):
     cycle: Optional[List[str]] = None
     distances: Dict[str, Optional[float]] = Field(default_factory=dict)
     paths: Dict[str, List[str]] = Field(default_factory=dict)
+    parent: Optional[Dict[str, Optional[str]]] = None
+
+
+class IncrementalCycleResponse(BaseModel):
+    snapshot_id: str
+    algorithm: str = "incremental_negative_cycle"
+    negative_cycle_found: bool
+    cycle: Optional[List[str]] = None
+    appeared: bool
+    disappeared: bool
+    updates_applied: int
+    relaxations: int
+    rebuilt: bool
 
 
 class CentralityInfo(BaseModel):
@@ -214,11 +362,14 @@ class FloydWarshallResponse(BaseModel):
     snapshot_id: str
     algorithm: str = "floyd_warshall"
     weight_mode: str
+    engine: str = "numpy"
     node_order: List[str]
     distance_matrix: Dict[str, Dict[str, Optional[float]]]
     central_node: Optional[str] = None
     centrality: Dict[str, CentralityInfo]
     centrality_note: str
+    negative_cycle_found: bool = False
+    cycle: Optional[List[str]] = None
 
 
 class MSTEdgeResponse(BaseModel):
@@ -234,3 +385,21 @@ class MSTResponse(BaseModel):
     total_cost: float
     is_forest: bool
     num_components: int
+    engine: Optional[str] = None
+
+
+class ArbitrageCycle(BaseModel):
+    cycle: List[str]
+    length: int
+    total_weight: float
+    profit: float
+
+
+class ArbitrageCyclesResponse(BaseModel):
+    snapshot_id: str
+    algorithm: str = "arbitrage_cycles"
+    cycles: List[ArbitrageCycle]
+    cycle_count: int
+    complete: bool
+    truncated: bool = False
+    timed_out: bool = False
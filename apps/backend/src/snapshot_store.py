@@ -0,0 +1,293 @@
+"""Snapshot store backends behind the graph cache."""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Hashable, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+import numpy as np
+
+from .graph.columns import EdgeColumns
+
+SNAPSHOT_SUFFIX = ".snap"
+
+# Quoting can triple a key's length; longer names than this are hashed to
+# stay under the usual 255-byte filename limit
+_MAX_QUOTED_NAME = 200
+# Marks hashed file names; quote() escapes "#", so no quoted key starts with it
+_HASHED_PREFIX = "#"
+
+_MAGIC = b"FXSNAP1\n"
+_PREFIX = struct.Struct("<8s16sQ")  # magic, write id, header length
+
+# Column order and dtypes of the edge section. The int32 columns take 8
+# bytes per edge together, so every float64 column stays 8-byte aligned.
+_COLUMNS = (
+    ("source_idx", np.dtype("<i4")),
+    ("target_idx", np.dtype("<i4")),
+    ("weight_cost", np.dtype("<f8")),
+    ("weight_neglog", np.dtype("<f8")),
+)
+
+
+class SnapshotStore(ABC):
+    """
+    Persistent snapshots shared by every worker process.
+
+    GraphCache keeps compiled graphs per process and falls back to the
+    store for snapshots it has not seen, so a snapshot written by one
+    worker can be served by any other and survives restarts.
+    """
+
+    @abstractmethod
+    def save(self, key: str, columns: EdgeColumns, timestamp: str) -> None:
+        ...
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Tuple[EdgeColumns, str, Hashable]]:
+        """
+        Columns, timestamp and version of a stored snapshot.
+
+        The version changes whenever the snapshot is overwritten, which
+        lets callers tell whether a compiled copy is still current.
+        """
+
+    @abstractmethod
+    def version(self, key: str) -> Optional[Hashable]:
+        ...
+
+    @abstractmethod
+    def timestamp(self, key: str) -> Optional[str]:
+        """Timestamp of a stored snapshot, without loading its edges."""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove a snapshot; False if it was not stored."""
+
+    @abstractmethod
+    def expired_keys(self) -> List[str]:
+        """Snapshots the store's retention policy says should be deleted."""
+
+    @abstractmethod
+    def latest_key(self) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def __contains__(self, key: str) -> bool:
+        return self.version(key) is not None
+
+
+class DiskSnapshotStore(SnapshotStore):
+    """
+    One binary file per snapshot under a directory.
+
+    Layout: a fixed prefix (magic, random 16-byte write id, little-endian
+    u64 header length), a JSON header (key, timestamp, node table, edge
+    count) padded to 8 bytes, then the edge columns back to back in
+    EdgeColumns order. Columns are opened with np.memmap, so workers
+    reading the same snapshot share the page cache instead of each holding
+    a private copy of the edge list.
+
+    Files are written to a temporary name and renamed into place. A reader
+    that already mapped the old file keeps a valid mapping after an
+    overwrite. The write id is the snapshot version: checking it costs one
+    small read and, unlike inode or mtime, cannot repeat across writes.
+
+    Retention: beyond max_snapshots files, or once a file is older than
+    max_age_seconds, the oldest snapshots are reported by expired_keys.
+    None disables either limit.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_snapshots: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+    ):
+        if max_snapshots is not None and max_snapshots < 1:
+            raise ValueError("max_snapshots must be at least 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_snapshots = max_snapshots
+        self.max_age_seconds = max_age_seconds
+
+    def _path(self, key: str) -> Path:
+        """
+        File for key: the quoted key, or a hash of it for long keys.
+
+        The key itself is always in the header, so hashed names lose nothing.
+        """
+        name = quote(key, safe="")
+        if len(name) > _MAX_QUOTED_NAME:
+            name = _HASHED_PREFIX + hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / (name + SNAPSHOT_SUFFIX)
+
+    def save(self, key: str, columns: EdgeColumns, timestamp: str) -> None:
+        header = json.dumps(
+            {
+                "key": key,
+                "timestamp": timestamp,
+                "nodes": list(columns.nodes),
+                "edge_count": len(columns),
+            }
+        ).encode()
+        header += b" " * (-(_PREFIX.size + len(header)) % 8)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_PREFIX.pack(_MAGIC, uuid.uuid4().bytes, len(header)))
+                f.write(header)
+                for name, dtype in _COLUMNS:
+                    column = getattr(columns, name)
+                    f.write(np.ascontiguousarray(column, dtype=dtype).data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, key: str) -> Optional[Tuple[EdgeColumns, str, Hashable]]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                version, header = _read_header(f, path)
+                arrays = _map_columns(f, header["edge_count"])
+        except FileNotFoundError:
+            return None
+
+        columns = EdgeColumns(nodes=header["nodes"], **arrays)
+        return columns, header["timestamp"], version
+
+    def version(self, key: str) -> Optional[Hashable]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                return _read_prefix(f, path)[0]
+        except FileNotFoundError:
+            return None
+
+    def timestamp(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                return _read_header(f, path)[1]["timestamp"]
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key: str) -> bool:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def expired_keys(self) -> List[str]:
+        """Oldest snapshots past max_age_seconds or beyond max_snapshots."""
+        if self.max_snapshots is None and self.max_age_seconds is None:
+            return []
+        # Newest first, so everything past the first expired file is expired too
+        ranked = sorted(self._ranked_entries(), reverse=True)
+        keep = len(ranked)
+        if self.max_snapshots is not None:
+            keep = min(keep, self.max_snapshots)
+        if self.max_age_seconds is not None:
+            cutoff = time.time_ns() - int(self.max_age_seconds * 1e9)
+            keep = min(keep, sum(1 for mtime, _ in ranked if mtime >= cutoff))
+        keys = (self._key_from_name(name) for _, name in ranked[keep:])
+        return [key for key in keys if key is not None]
+
+    def latest_key(self) -> Optional[str]:
+        """Most recently written snapshot, ties broken by key."""
+        latest = max(self._ranked_entries(), default=None)
+        if latest is None:
+            return None
+        return self._key_from_name(latest[1])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
+
+    def _key_from_name(self, name: str) -> Optional[str]:
+        """Key of a snapshot file, or None if it was deleted meanwhile."""
+        if not name.startswith(_HASHED_PREFIX):
+            return unquote(name[: -len(SNAPSHOT_SUFFIX)])
+        path = self.directory / name
+        try:
+            with open(path, "rb") as f:
+                return _read_header(f, path)[1]["key"]
+        except FileNotFoundError:
+            return None
+
+    def _ranked_entries(self):
+        """(mtime_ns, file name) of every snapshot file."""
+        for entry in self._entries():
+            try:
+                yield entry.stat().st_mtime_ns, entry.name
+            except FileNotFoundError:
+                continue
+
+    def _entries(self):
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(SNAPSHOT_SUFFIX) and entry.is_file():
+                    yield entry
+
+
+def _read_prefix(f, path: Path) -> Tuple[bytes, int]:
+    """Write id and header length from the start of a snapshot file."""
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) != _PREFIX.size or prefix[: len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"Not a snapshot file: {path}")
+    _, write_id, header_len = _PREFIX.unpack(prefix)
+    return write_id, header_len
+
+
+def _read_header(f, path: Path) -> Tuple[bytes, dict]:
+    """Write id and JSON header; leaves f at the start of the edge columns."""
+    version, header_len = _read_prefix(f, path)
+    return version, json.loads(f.read(header_len))
+
+
+def _map_columns(f, edge_count: int) -> dict:
+    """Memory-map the edge columns that follow the header in an open file."""
+    offset = f.tell()
+    arrays = {}
+    for name, dtype in _COLUMNS:
+        if edge_count:
+            arrays[name] = np.memmap(
+                f, dtype=dtype, mode="r", offset=offset, shape=(edge_count,)
+            )
+        else:
+            # mmap cannot map zero bytes
+            arrays[name] = np.empty(0, dtype=dtype)
+        offset += edge_count * dtype.itemsize
+    return arrays
+
+
+def open_snapshot_store(
+    backend: str,
+    directory: Path,
+    max_snapshots: Optional[int] = None,
+    max_age_seconds: Optional[float] = None,
+) -> Optional[SnapshotStore]:
+    """
+    Store for the configured backend.
+
+    ``memory`` returns None: the graph cache alone holds the snapshots,
+    which are lost on restart and private to each worker, and the retention
+    limits do not apply (the cache's byte budget bounds it instead).
+    """
+    if backend == "memory":
+        return None
+    if backend == "disk":
+        return DiskSnapshotStore(directory, max_snapshots, max_age_seconds)
+    raise ValueError(f"Unknown snapshot store backend: {backend}")
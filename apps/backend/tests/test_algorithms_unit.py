@@ -1,9 +1,36 @@
 """Unit tests for graph algorithms."""
 
+import itertools
+import random
+
 import pytest
 
-from src.algorithms import all_pairs, mst, shortest_path, traversal
+from src.algorithms import (
+    all_pairs,
+    arbitrage,
+    mst,
+    point_to_point,
+    shortest_path,
+    traversal,
+)
+from src.algorithms.csr import CSRGraph
+from src.algorithms.disjoint_set import DisjointSet, connected_components
 from src.algorithms.graph import Graph
+from src.algorithms.heap import IndexedHeap
+from src.algorithms.incremental import IncrementalCycleDetector
+from src.generation.scenarios import BASE_VALUES
+from src.graph.builder import GraphBuilder
+from src.models import CostModel
+
+
+def random_graph_edges(num_nodes: int, num_edges: int, seed: int = 7):
+    rng = random.Random(seed)
+    nodes = [f"N{i:03d}" for i in range(num_nodes)]
+    edges = []
+    for _ in range(num_edges):
+        u, v = rng.sample(nodes, 2)
+        edges.append((u, v, round(rng.uniform(1.0, 20.0), 3), rng.uniform(-0.05, 0.5)))
+    return nodes, edges
 
 
 class TestGraph:
@@ -56,6 +83,30 @@ class TestGraph:
         weight = undirected.get_weight("USD", "EUR", "cost")
         assert weight == 10.0
 
+    @pytest.mark.parametrize("backend", [Graph, "csr"])
+    def test_get_weight_and_path_weights(self, backend):
+        nodes = ["A", "B", "C", "D"]
+        edges = [
+            ("A", "C", 5.0, 0.5),
+            ("A", "B", 2.0, 0.2),
+            ("A", "B", 1.0, 0.1),
+            ("B", "C", 3.0, 0.3),
+        ]
+        graph = Graph(nodes, edges, directed=True)
+        if backend == "csr":
+            graph = CSRGraph.from_graph(graph)
+
+        # First listed parallel edge wins
+        assert graph.get_weight("A", "B") == 2.0
+        assert graph.get_weight("A", "B", "neglog") == 0.2
+        assert graph.get_weight("B", "A") is None
+        assert graph.get_weight("A", "Z") is None
+
+        assert graph.get_path_weights(["A", "B", "C"]) == [2.0, 3.0]
+        assert graph.get_path_weights(["A", "B", "C"], "neglog") == [0.2, 0.3]
+        assert graph.get_path_weights(["A", "D", "C"]) == [None, None]
+        assert graph.get_path_weights(["A"]) == []
+
 
 class TestBFS:
     """Tests for BFS algorithm."""
@@ -101,6 +152,102 @@ class TestBFS:
             traversal.bfs(graph, "X")
 
 
+class TestDirectionOptimizingBFS:
+    """Tests for direction-optimizing BFS."""
+
+    @staticmethod
+    def assert_valid_bfs(graph, result, expected):
+        assert result.depth == expected.depth
+        assert list(result.depth) == result.order == list(result.parent)
+        assert sorted(result.order) == sorted(expected.order)
+        depths = [result.depth[node] for node in result.order]
+        assert depths == sorted(depths)
+        for node, parent in result.parent.items():
+            if parent is None:
+                continue
+            assert result.depth[parent] == result.depth[node] - 1
+            assert any(edge.to == node for edge in graph.get_neighbors(parent))
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    @pytest.mark.parametrize("num_edges", [150, 2000, 9000])
+    def test_same_depths_as_top_down(self, backend, num_edges):
+        nodes, edges = random_graph_edges(100, num_edges, seed=8)
+        graph = backend(nodes, edges, directed=True)
+
+        for start in nodes[:5]:
+            expected = traversal.bfs(graph, start)
+            result = traversal.bfs(graph, start, mode="direction_optimizing")
+            self.assert_valid_bfs(graph, result, expected)
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    def test_complete_graph(self, backend):
+        nodes = [f"N{i:03d}" for i in range(60)]
+        edges = [(u, v, 1.0, 0.1) for u in nodes for v in nodes if u != v]
+        graph = backend(nodes, edges, directed=True)
+
+        result = traversal.bfs(graph, "N030", mode="direction_optimizing")
+
+        self.assert_valid_bfs(graph, result, traversal.bfs(graph, "N030"))
+        assert result.order[0] == "N030"
+        assert set(result.depth.values()) == {0, 1}
+
+    def test_unknown_mode(self):
+        graph = Graph(["A"], [], directed=True)
+
+        with pytest.raises(ValueError, match="Unknown BFS mode"):
+            traversal.bfs(graph, "A", mode="sideways")
+
+
+class TestMultiSourceBFS:
+    """Tests for bitset multi-source BFS."""
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    def test_matches_single_source_bfs(self, backend):
+        nodes, edges = random_graph_edges(120, 300, seed=4)
+        graph = backend(nodes, edges, directed=True)
+        starts = nodes[::7]
+
+        result = traversal.multi_source_bfs(graph, starts)
+
+        assert list(result.depth) == starts
+        for start in starts:
+            assert result.depth[start] == traversal.bfs(graph, start).depth
+
+    def test_max_depth(self):
+        nodes, edges = random_graph_edges(80, 200, seed=6)
+        graph = Graph(nodes, edges, directed=True)
+
+        result = traversal.multi_source_bfs(graph, nodes[:5], max_depth=2)
+
+        for start in nodes[:5]:
+            expected = {
+                node: depth
+                for node, depth in traversal.bfs(graph, start).depth.items()
+                if depth <= 2
+            }
+            assert result.depth[start] == expected
+            assert list(result.depth[start].values()) == sorted(expected.values())
+
+    def test_many_sources_share_frontier(self):
+        # More sources than bits in a machine word
+        nodes = [f"N{i:03d}" for i in range(200)]
+        edges = [(nodes[i], nodes[(i + 1) % 200], 1.0, 0.1) for i in range(200)]
+        graph = Graph(nodes, edges, directed=True)
+
+        result = traversal.multi_source_bfs(graph, nodes + nodes[:3], max_depth=3)
+
+        assert len(result.depth) == 200
+        assert result.depth["N199"] == {"N199": 0, "N000": 1, "N001": 2, "N002": 3}
+
+    def test_invalid_arguments(self):
+        graph = Graph(["A", "B"], [("A", "B", 1.0, 0.1)], directed=True)
+
+        with pytest.raises(ValueError, match="Start node 'X' not in graph"):
+            traversal.multi_source_bfs(graph, ["A", "X"])
+        with pytest.raises(ValueError, match="max_depth"):
+            traversal.multi_source_bfs(graph, ["A"], max_depth=-1)
+
+
 class TestDFS:
     """Tests for DFS algorithm."""
 
@@ -133,6 +280,51 @@ class TestDFS:
         with pytest.raises(ValueError, match="not in graph"):
             traversal.dfs(graph, "X")
 
+    @staticmethod
+    def recursive_dfs(graph, start):
+        """The original recursive implementation, kept as the reference."""
+        order, parent, discovery, finish = [], {start: None}, {}, {}
+        time = [0]
+
+        def visit(u):
+            time[0] += 1
+            discovery[u] = time[0]
+            order.append(u)
+            for edge in graph.get_neighbors(u):
+                if edge.to not in discovery:
+                    parent[edge.to] = u
+                    visit(edge.to)
+            time[0] += 1
+            finish[u] = time[0]
+
+        visit(start)
+        return order, parent, discovery, finish
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_recursive_reference(self, seed):
+        nodes, edges = random_graph_edges(80, 200, seed=seed)
+        graph = Graph(nodes, edges, directed=True)
+
+        for start in nodes[:10]:
+            result = traversal.dfs(graph, start)
+            order, parent, discovery, finish = self.recursive_dfs(graph, start)
+
+            assert result.order == order
+            assert list(result.parent.items()) == list(parent.items())
+            assert list(result.discovery_time.items()) == list(discovery.items())
+            assert list(result.finish_time.items()) == list(finish.items())
+
+    def test_deep_chain(self):
+        nodes = [f"N{i:05d}" for i in range(20000)]
+        edges = [(nodes[i], nodes[i + 1], 1.0, 0.1) for i in range(len(nodes) - 1)]
+        graph = Graph(nodes, edges, directed=True)
+
+        result = traversal.dfs(graph, nodes[0])
+
+        assert result.order == nodes
+        assert result.finish_time[nodes[-1]] == len(nodes) + 1
+        assert result.finish_time[nodes[0]] == 2 * len(nodes)
+
 
 class TestDijkstra:
     """Tests for Dijkstra algorithm."""
@@ -179,6 +371,131 @@ class TestDijkstra:
         assert result.distances["B"] == 10.0
         assert result.distances["C"] == 20.0
 
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    def test_indexed_heap_matches_lazy(self, backend):
+        """Indexed heap gives the same distances and parents, ties included."""
+        rng = random.Random(5)
+        nodes, edges = random_graph_edges(80, 600)
+        # Small integer weights force many equal distances
+        edges = [(u, v, float(rng.randint(1, 4)), neglog) for u, v, _, neglog in edges]
+        graph = backend(nodes, edges, directed=True)
+
+        lazy = shortest_path.dijkstra(graph, "N000")
+        indexed = shortest_path.dijkstra(graph, "N000", heap="indexed")
+
+        assert indexed.distances == lazy.distances
+        assert dict(indexed.paths) == dict(lazy.paths)
+        assert indexed.settled == lazy.settled
+
+    def test_unknown_heap(self):
+        graph = Graph(["A", "B"], [("A", "B", 1.0, 0.1)], directed=True)
+
+        with pytest.raises(ValueError, match="Unknown heap"):
+            shortest_path.dijkstra(graph, "A", heap="fibonacci")
+
+
+class TestPointToPoint:
+    """Tests for bidirectional Dijkstra and A*."""
+
+    @staticmethod
+    def grid_graph(size):
+        rng = random.Random(3)
+        name = "R{:02d}C{:02d}".format
+        nodes = [name(r, c) for r in range(size) for c in range(size)]
+        edges = []
+        for r in range(size):
+            for c in range(size):
+                for r2, c2 in ((r, c + 1), (r + 1, c)):
+                    if r2 < size and c2 < size:
+                        w = round(rng.uniform(1.0, 2.0), 3)
+                        edges.append((name(r, c), name(r2, c2), w, 0.0))
+                        edges.append((name(r2, c2), name(r, c), w, 0.0))
+        return Graph(nodes, edges, directed=True)
+
+    @staticmethod
+    def path_cost(graph, path):
+        # Parallel edges: the search uses the cheapest one
+        return sum(
+            min(e.weight_cost for e in graph.get_neighbors(u) if e.to == v)
+            for u, v in zip(path, path[1:])
+        )
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    def test_matches_dijkstra(self, backend):
+        nodes, edges = random_graph_edges(60, 240)
+        graph = backend(nodes, edges, directed=True)
+        rng = random.Random(5)
+
+        for _ in range(40):
+            source, target = rng.choice(nodes), rng.choice(nodes)
+            expected = shortest_path.dijkstra(graph, source, target)
+            heuristic = point_to_point.landmark_heuristic(graph, target)
+
+            for result in (
+                point_to_point.bidirectional_dijkstra(graph, source, target),
+                point_to_point.astar(graph, source, target),
+                point_to_point.astar(graph, source, target, heuristic),
+            ):
+                assert result.found == expected.found
+                if expected.found:
+                    assert result.distance == pytest.approx(expected.distances[target])
+                    assert result.path[0] == source and result.path[-1] == target
+                    assert self.path_cost(graph, result.path) == pytest.approx(
+                        result.distance
+                    )
+                else:
+                    assert result.path == []
+
+    def test_landmark_bound_is_admissible(self):
+        nodes, edges = random_graph_edges(40, 160, seed=9)
+        graph = Graph(nodes, edges, directed=True)
+        landmarks = point_to_point.Landmarks(graph, count=3)
+        assert len(landmarks.landmarks) == 3
+
+        for target in nodes[:10]:
+            heuristic = landmarks.heuristic(target)
+            for node in nodes:
+                true_distance = shortest_path.dijkstra(graph, node, target).distances[target]
+                bound = heuristic(node)
+                if true_distance is None:
+                    continue
+                assert bound <= true_distance + 1e-9
+
+    def test_search_space_shrinks(self):
+        graph = self.grid_graph(30)
+        source, target = "R00C00", "R29C29"
+
+        full = shortest_path.dijkstra(graph, source, target)
+        heuristic = point_to_point.landmark_heuristic(graph, target, count=4)
+        guided = point_to_point.astar(graph, source, target, heuristic)
+        bidirectional = point_to_point.bidirectional_dijkstra(graph, "R10C10", "R12C12")
+        one_sided = shortest_path.dijkstra(graph, "R10C10", "R12C12")
+
+        assert guided.distance == pytest.approx(full.distances[target])
+        assert guided.settled < full.settled / 4
+        assert bidirectional.distance == pytest.approx(one_sided.distances["R12C12"])
+        assert bidirectional.settled < one_sided.settled
+
+    def test_reverse_adjacency_built_once(self):
+        graph = self.grid_graph(3)
+
+        first = graph.get_predecessors("R01C01")
+        assert {edge.to for edge in first} == {"R00C01", "R01C00", "R01C02", "R02C01"}
+        assert graph.get_predecessors("R01C01") is first
+
+        csr = CSRGraph.from_graph(graph)
+        assert csr.get_predecessors("R01C01") == first
+        assert csr.reverse_arrays() is csr.reverse_arrays()
+
+    def test_same_node_and_unknown_target(self):
+        graph = Graph(["A", "B"], [("A", "B", 1.0, 0.1)], directed=True)
+
+        result = point_to_point.bidirectional_dijkstra(graph, "A", "A")
+        assert result.distance == 0.0 and result.path == ["A"]
+
+        with pytest.raises(ValueError, match="Target node 'Z' not in graph"):
+            point_to_point.astar(graph, "A", "Z")
+
 
 class TestBellmanFord:
     """Tests for Bellman-Ford algorithm."""
@@ -229,6 +546,362 @@ class TestBellmanFord:
         assert result.distances["C"] is None
 
 
+class TestLazyPaths:
+    """Tests for on-demand path reconstruction."""
+
+    def test_paths_follow_parent_map(self):
+        nodes, edges = random_graph_edges(50, 200)
+        edges = [(u, v, w_cost, abs(w_neglog)) for u, v, w_cost, w_neglog in edges]
+        graph = Graph(nodes, edges, directed=True)
+
+        for result in (
+            shortest_path.dijkstra(graph, "N000"),
+            shortest_path.bellman_ford(graph, "N000"),
+        ):
+            assert set(result.paths) == set(result.parent)
+            assert len(result.paths) == len(result.parent)
+            for node, path in result.paths.items():
+                assert path[0] == "N000" and path[-1] == node
+                for u, v in zip(path, path[1:]):
+                    assert result.parent[v] == u
+
+    def test_missing_node_raises_key_error(self):
+        graph = Graph(["A", "B", "C"], [("A", "B", 1.0, 0.1)], directed=True)
+        result = shortest_path.dijkstra(graph, "A")
+
+        assert result.paths.get("C") is None
+        with pytest.raises(KeyError):
+            result.paths["C"]
+
+    def test_parent_cycle_without_detection(self):
+        nodes = ["A", "B", "C"]
+        edges = [
+            ("A", "B", 1.0, 0.1),
+            ("B", "C", 1.0, -0.5),
+            ("C", "B", 1.0, -0.5),
+        ]
+        graph = Graph(nodes, edges, directed=True)
+
+        result = shortest_path.bellman_ford(graph, "A", detect_negative_cycle=False)
+
+        assert not result.negative_cycle_found
+        assert result.paths["A"] == ["A"]
+        # The walk stops before revisiting a node of the parent cycle
+        assert result.parent == {"A": None, "B": "C", "C": "B"}
+        assert result.paths["B"] == ["C", "B"]
+        assert result.paths["C"] == ["B", "C"]
+
+
+class TestBellmanFordQueue:
+    """Tests for the queue-based (SPFA) Bellman-Ford mode."""
+
+    def test_matches_rounds_without_cycle(self):
+        nodes, edges = random_graph_edges(40, 200)
+        edges = [(u, v, w_cost, abs(w_neglog)) for u, v, w_cost, w_neglog in edges]
+        graph = Graph(nodes, edges)
+
+        rounds = shortest_path.bellman_ford(graph, "N000", mode="rounds")
+        queue = shortest_path.bellman_ford(graph, "N000", mode="queue")
+
+        assert not queue.negative_cycle_found
+        assert queue.distances.keys() == rounds.distances.keys()
+        for node, distance in rounds.distances.items():
+            if distance is None:
+                assert queue.distances[node] is None
+            else:
+                assert queue.distances[node] == pytest.approx(distance, abs=1e-12)
+
+    def test_negative_cycle_canonical_output(self):
+        nodes = ["A", "B", "C", "D", "E"]
+        edges = [
+            ("A", "B", 1.0, 0.1),
+            ("B", "C", 1.0, 0.1),
+            ("C", "D", 1.0, -0.3),
+            ("D", "B", 1.0, 0.1),
+            ("D", "E", 1.0, 0.1),
+        ]
+        graph = Graph(nodes, edges)
+
+        rounds = shortest_path.bellman_ford(graph, "A", mode="rounds")
+        queue = shortest_path.bellman_ford(graph, "A", mode="queue")
+
+        assert queue.negative_cycle_found
+        assert queue.cycle == rounds.cycle == ["B", "C", "D", "B"]
+        assert queue.distances == {}
+        assert queue.paths == {}
+
+    def test_negative_cycle_on_csr_graph(self):
+        nodes, edges = random_graph_edges(30, 120, seed=9)
+        edges.append(("N010", "N011", 1.0, -5.0))
+        edges.append(("N011", "N010", 1.0, -5.0))
+        csr = CSRGraph(nodes, edges)
+
+        result = shortest_path.bellman_ford(csr, "N010", mode="queue")
+
+        assert result.negative_cycle_found
+        assert result.cycle[0] == result.cycle[-1]
+        cycle_weight = sum(
+            csr.get_weight(u, v, "neglog") for u, v in zip(result.cycle, result.cycle[1:])
+        )
+        assert cycle_weight < 0
+
+    def test_detection_disabled_still_terminates(self):
+        nodes = ["A", "B"]
+        edges = [("A", "B", 1.0, -0.5), ("B", "A", 1.0, -0.5)]
+
+        result = shortest_path.bellman_ford(
+            Graph(nodes, edges), "A", detect_negative_cycle=False, mode="queue"
+        )
+
+        assert not result.negative_cycle_found
+        assert result.cycle is None
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown Bellman-Ford mode"):
+            shortest_path.bellman_ford(Graph(["A"], []), "A", mode="dfs")
+
+
+class TestArbitrageCycles:
+    """Tests for negative cycle enumeration."""
+
+    @staticmethod
+    def brute_force_cycles(graph, max_length):
+        cheapest = {}
+        for u in graph.nodes:
+            for edge in graph.get_neighbors(u):
+                key = (u, edge.to)
+                cheapest[key] = min(cheapest.get(key, edge.weight_neglog), edge.weight_neglog)
+
+        cycles = {}
+        for length in range(1, max_length + 1):
+            for combo in itertools.permutations(graph.nodes, length):
+                if combo[0] != min(combo):
+                    continue
+                hops = list(zip(combo, combo[1:] + combo[:1]))
+                if all(hop in cheapest for hop in hops):
+                    total = sum(cheapest[hop] for hop in hops)
+                    if total < 0:
+                        cycles[combo] = total
+        return cycles
+
+    def test_matches_brute_force(self):
+        nodes, edges = random_graph_edges(9, 45, seed=3)
+        edges = [(u, v, w_cost, w_neglog - 0.2) for u, v, w_cost, w_neglog in edges]
+        graph = Graph(nodes, edges, directed=True)
+
+        result = arbitrage.find_negative_cycles(graph, max_length=5, max_cycles=10000)
+        expected = self.brute_force_cycles(graph, 5)
+
+        assert result.complete
+        assert len(expected) > 10
+        assert {tuple(c.nodes[:-1]) for c in result.cycles} == set(expected)
+        for cycle in result.cycles:
+            assert cycle.total_weight == pytest.approx(expected[tuple(cycle.nodes[:-1])])
+
+    def test_ranked_by_profit(self):
+        nodes = ["A", "B", "C", "D"]
+        edges = [
+            ("A", "B", 1.0, -0.1),
+            ("B", "A", 1.0, 0.05),
+            ("B", "C", 1.0, -0.2),
+            ("C", "D", 1.0, 0.1),
+            ("D", "B", 1.0, 0.0),
+            ("C", "C", 1.0, -0.01),
+        ]
+        graph = Graph(nodes, edges, directed=True)
+
+        result = arbitrage.find_negative_cycles(graph)
+
+        assert [c.nodes for c in result.cycles] == [
+            ["B", "C", "D", "B"],
+            ["A", "B", "A"],
+            ["C", "C"],
+        ]
+        assert result.cycles[0].profit == pytest.approx(0.1)
+        assert result.cycles[0].length == 3
+
+    def test_rotation_matches_bellman_ford(self):
+        nodes = ["A", "B", "C"]
+        edges = [
+            ("C", "A", 10.0, -0.5),
+            ("A", "B", 10.0, -0.5),
+            ("B", "C", 10.0, -0.5),
+        ]
+        graph = Graph(nodes, edges, directed=True)
+
+        cycles = arbitrage.find_negative_cycles(graph).cycles
+
+        assert [c.nodes for c in cycles] == [shortest_path.bellman_ford(graph, "B").cycle]
+
+    def test_no_negative_cycle(self):
+        nodes, edges = random_graph_edges(30, 150)
+        edges = [(u, v, w_cost, abs(w_neglog)) for u, v, w_cost, w_neglog in edges]
+
+        result = arbitrage.find_negative_cycles(Graph(nodes, edges, directed=True))
+
+        assert result.cycles == []
+        assert result.complete
+
+    def test_length_limit(self):
+        nodes = ["A", "B", "C", "D"]
+        edges = [
+            ("A", "B", 1.0, -0.1),
+            ("B", "C", 1.0, -0.1),
+            ("C", "D", 1.0, -0.1),
+            ("D", "A", 1.0, -0.1),
+        ]
+        graph = Graph(nodes, edges, directed=True)
+
+        assert arbitrage.find_negative_cycles(graph, max_length=3).cycles == []
+        assert len(arbitrage.find_negative_cycles(graph, max_length=4).cycles) == 1
+
+    def test_result_cap(self):
+        nodes, edges = random_graph_edges(9, 45, seed=3)
+        edges = [(u, v, w_cost, w_neglog - 0.2) for u, v, w_cost, w_neglog in edges]
+        graph = Graph(nodes, edges, directed=True)
+
+        result = arbitrage.find_negative_cycles(graph, max_length=5, max_cycles=5)
+
+        assert len(result.cycles) == 5
+        assert result.truncated
+        assert not result.complete
+
+    def test_time_budget(self):
+        nodes, edges = random_graph_edges(200, 8000)
+        edges = [(u, v, w_cost, w_neglog - 0.3) for u, v, w_cost, w_neglog in edges]
+        graph = Graph(nodes, edges, directed=True)
+
+        result = arbitrage.find_negative_cycles(
+            graph, max_length=8, max_cycles=10**6, time_budget=0.05
+        )
+
+        assert result.timed_out
+        assert not result.complete
+        assert result.cycles
+
+    def test_csr_backend_agrees(self):
+        nodes, edges = random_graph_edges(9, 45, seed=3)
+        edges = [(u, v, w_cost, w_neglog - 0.2) for u, v, w_cost, w_neglog in edges]
+
+        dict_result = arbitrage.find_negative_cycles(Graph(nodes, edges), max_cycles=10000)
+        csr_result = arbitrage.find_negative_cycles(CSRGraph(nodes, edges), max_cycles=10000)
+
+        assert [c.to_dict() for c in dict_result.cycles] == [
+            c.to_dict() for c in csr_result.cycles
+        ]
+
+
+class TestIncrementalCycleDetector:
+    """Tests for incremental negative-cycle detection."""
+
+    @staticmethod
+    def from_scratch(nodes, weights):
+        virtual = "\0source"
+        edges = [(u, v, 1.0, w) for (u, v), w in weights.items()]
+        edges += [(virtual, node, 1.0, 0.0) for node in nodes]
+        return shortest_path.bellman_ford(Graph(nodes + [virtual], edges), virtual)
+
+    def test_random_ticks_match_from_scratch(self):
+        rng = random.Random(11)
+        nodes, edges = random_graph_edges(25, 120)
+        weights = {}
+        for u, v, _, w_neglog in edges:
+            weights[(u, v)] = min(weights.get((u, v), 1.0), abs(w_neglog))
+        detector = IncrementalCycleDetector(
+            Graph(nodes, [(u, v, 1.0, w) for (u, v), w in weights.items()])
+        )
+        pairs = list(weights)
+        transitions = 0
+
+        for _ in range(300):
+            # Mostly ordinary ticks, with the occasional shock that opens a loop
+            batch = []
+            for _ in range(rng.randint(1, 4)):
+                shock = rng.random() < 0.03
+                weight = rng.uniform(-0.3, -0.1) if shock else rng.uniform(0.05, 0.5)
+                batch.append((*rng.choice(pairs), weight))
+            was_cyclic = detector.negative_cycle_found
+            result = detector.update(batch)
+            for u, v, w in batch:
+                weights[(u, v)] = w
+
+            expected = self.from_scratch(nodes, weights)
+            assert result.negative_cycle_found == expected.negative_cycle_found
+            assert result.appeared == (not was_cyclic and result.negative_cycle_found)
+            assert result.disappeared == (was_cyclic and not result.negative_cycle_found)
+            transitions += result.appeared + result.disappeared
+
+            if result.negative_cycle_found:
+                cycle = result.cycle
+                assert cycle[0] == cycle[-1] == min(cycle)
+                assert sum(weights[hop] for hop in zip(cycle, cycle[1:])) < 0
+            else:
+                for node, dist in detector.distances().items():
+                    assert dist == pytest.approx(expected.distances[node])
+
+        assert transitions >= 6
+
+    def test_cycle_appears_and_disappears(self):
+        nodes = ["A", "B", "C"]
+        edges = [
+            ("A", "B", 1.0, 0.1),
+            ("B", "C", 1.0, 0.1),
+            ("C", "A", 1.0, 0.1),
+        ]
+        detector = IncrementalCycleDetector(Graph(nodes, edges))
+        assert not detector.negative_cycle_found
+
+        appeared = detector.update([("C", "A", -0.3)])
+        assert appeared.appeared
+        assert appeared.cycle == ["A", "B", "C", "A"]
+
+        still = detector.update([("A", "B", 0.05)])
+        assert still.negative_cycle_found
+        assert not still.appeared and not still.rebuilt
+
+        gone = detector.update([("C", "A", 0.0)])
+        assert gone.disappeared
+        assert gone.rebuilt
+        assert gone.cycle is None
+
+    def test_small_tick_relaxes_locally(self):
+        nodes = [f"N{i:03d}" for i in range(300)]
+        edges = [(nodes[i], nodes[i + 1], 1.0, 0.01) for i in range(299)]
+        edges += [(nodes[i + 1], nodes[i], 1.0, 0.02) for i in range(299)]
+        detector = IncrementalCycleDetector(Graph(nodes, edges))
+
+        result = detector.update([(nodes[150], nodes[151], 0.005)])
+
+        assert not result.negative_cycle_found
+        assert result.relaxations <= 2
+        assert detector.distances()[nodes[151]] == 0.0
+
+    def test_long_chain_relaxes_without_root_walks(self, monkeypatch):
+        nodes = [f"N{i:04d}" for i in range(2000)]
+        edges = [(nodes[i], nodes[i + 1], 1.0, -0.001) for i in range(1999)]
+        detector = IncrementalCycleDetector(Graph(nodes, edges))
+
+        def no_root_walk(*args):
+            raise AssertionError("ancestor walk outside a cycle")
+
+        monkeypatch.setattr(IncrementalCycleDetector, "_ancestor_path", no_root_walk)
+        result = detector.update([(nodes[0], nodes[1], -0.5)])
+
+        assert not result.negative_cycle_found
+        expected = IncrementalCycleDetector(
+            Graph(nodes, [(nodes[0], nodes[1], 1.0, -0.5)] + edges[1:])
+        )
+        for node, dist in detector.distances().items():
+            assert dist == pytest.approx(expected.distances()[node])
+
+    def test_unknown_node_rejected(self):
+        detector = IncrementalCycleDetector(Graph(["A", "B"], [("A", "B", 1.0, 0.1)]))
+
+        with pytest.raises(ValueError, match="Unknown node in update: Z"):
+            detector.update([("A", "B", -1.0), ("A", "Z", 0.1)])
+        assert not detector.negative_cycle_found
+
+
 class TestFloydWarshall:
     """Tests for Floyd-Warshall algorithm."""
 
@@ -278,6 +951,204 @@ class TestFloydWarshall:
         assert result.centrality["B"]["reachable_count"] == 2
 
 
+class TestFloydWarshallEngines:
+    """Tests that the NumPy engine matches the Python reference engine."""
+
+    @staticmethod
+    def assert_engines_match(graph, weight_mode):
+        reference = all_pairs.floyd_warshall(graph, weight_mode, engine="python")
+        vectorized = all_pairs.floyd_warshall(graph, weight_mode, engine="numpy")
+
+        assert vectorized.node_order == reference.node_order
+        assert vectorized.distance_matrix == reference.distance_matrix
+        assert vectorized.central_node == reference.central_node
+        assert vectorized.centrality == reference.centrality
+
+    @pytest.mark.parametrize("weight_mode", ["cost", "neglog"])
+    def test_random_graph(self, weight_mode):
+        nodes, edges = random_graph_edges(30, 120)
+        self.assert_engines_match(Graph(nodes, edges, directed=True), weight_mode)
+
+    def test_negative_cycle(self):
+        nodes, edges = random_graph_edges(12, 40, seed=3)
+        edges += [
+            ("N001", "N002", 1.0, -0.6),
+            ("N002", "N003", 1.0, -0.6),
+            ("N003", "N001", 1.0, -0.6),
+        ]
+        self.assert_engines_match(Graph(nodes, edges, directed=True), "neglog")
+
+    def test_central_node_tie_breaking(self):
+        # Every node reaches one other; C and D tie on the smallest sum
+        nodes = ["A", "B", "C", "D"]
+        edges = [
+            ("A", "B", 2.0, 0.2),
+            ("B", "A", 2.0, 0.2),
+            ("C", "D", 1.0, 0.1),
+            ("D", "C", 1.0, 0.1),
+        ]
+        graph = Graph(nodes, edges, directed=True)
+
+        self.assert_engines_match(graph, "cost")
+        assert all_pairs.floyd_warshall(graph, "cost").central_node == "C"
+
+    def test_no_reachable_pairs(self):
+        graph = Graph(["A", "B"], [], directed=True)
+
+        self.assert_engines_match(graph, "cost")
+        assert all_pairs.floyd_warshall(graph, "cost").central_node is None
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_blocked_engine_matches(self, workers):
+        # Integer weights keep sums exact regardless of relaxation order
+        rng = random.Random(11)
+        nodes = [f"N{i:02d}" for i in range(45)]
+        edges = [
+            (u, v, float(rng.randint(1, 30)), float(rng.randint(-2, 9)))
+            for u in nodes
+            for v in rng.sample(nodes, 4)
+            if u != v
+        ]
+        graph = Graph(nodes, edges, directed=True)
+
+        for weight_mode in ("cost", "neglog"):
+            expected = all_pairs.floyd_warshall(graph, weight_mode, engine="numpy")
+            actual = all_pairs.floyd_warshall(
+                graph, weight_mode, engine="blocked", block_size=8, workers=workers
+            )
+            if weight_mode == "cost":
+                assert actual.distance_matrix == expected.distance_matrix
+                assert actual.central_node == expected.central_node
+            else:
+                # Negative edges may form cycles; only check the pool matches serial
+                serial = all_pairs.floyd_warshall(
+                    graph, weight_mode, engine="blocked", block_size=8, workers=1
+                )
+                assert actual.distance_matrix == serial.distance_matrix
+
+    def test_blocked_engine_reuses_pool(self):
+        graph = Graph(
+            [f"N{i}" for i in range(20)],
+            [(f"N{i}", f"N{i + 1}", 1.0, 0.0) for i in range(19)],
+            directed=True,
+        )
+        all_pairs.floyd_warshall(graph, engine="blocked", block_size=4, workers=2)
+        pool = all_pairs._blocked_pool()
+        all_pairs.floyd_warshall(graph, engine="blocked", block_size=4, workers=2)
+        assert all_pairs._blocked_pool() is pool
+
+    def test_unknown_engine(self):
+        graph = Graph(["A"], [], directed=True)
+
+        with pytest.raises(ValueError, match="Unknown Floyd-Warshall engine"):
+            all_pairs.floyd_warshall(graph, "cost", engine="fortran")
+
+
+class TestJohnson:
+    """Tests for Johnson's all-pairs engine."""
+
+    @staticmethod
+    def assert_close_to_floyd_warshall(graph, weight_mode):
+        expected = all_pairs.floyd_warshall(graph, weight_mode, engine="numpy")
+        actual = all_pairs.floyd_warshall(graph, weight_mode, engine="johnson")
+
+        assert actual.engine == "johnson"
+        assert not actual.negative_cycle_found
+        for u in expected.node_order:
+            for v in expected.node_order:
+                if expected.distance_matrix[u][v] is None:
+                    assert actual.distance_matrix[u][v] is None
+                else:
+                    assert actual.distance_matrix[u][v] == pytest.approx(
+                        expected.distance_matrix[u][v], abs=1e-12
+                    )
+        assert actual.central_node == expected.central_node
+
+    @pytest.mark.parametrize(
+        "scenario_id", ["sparse_graph", "hub_and_spoke", "balanced_tree"]
+    )
+    def test_matches_floyd_warshall_on_scenarios(self, scenario_id):
+        from src.generation.scenarios import get_scenario
+        from src.graph.builder import GraphBuilder
+        from src.models import CostModel
+
+        values, info = get_scenario(scenario_id)
+        payload = GraphBuilder(CostModel(base_cost=10, extra_cost=5)).build_graph(
+            values, info.nodes, info.pairs
+        )
+        graph = Graph.from_graph_payload(payload.model_dump(by_alias=True))
+
+        for weight_mode in ("cost", "neglog"):
+            self.assert_close_to_floyd_warshall(graph, weight_mode)
+
+    def test_negative_weights_without_cycle(self):
+        # Potential-shifted weights: negative edges, but every cycle is positive
+        rng = random.Random(5)
+        nodes, edges = random_graph_edges(25, 80, seed=5)
+        potential = {node: rng.uniform(-3.0, 3.0) for node in nodes}
+        edges = [
+            (u, v, w_cost, w_cost + potential[u] - potential[v])
+            for u, v, w_cost, _ in edges
+        ]
+
+        self.assert_close_to_floyd_warshall(Graph(nodes, edges), "neglog")
+
+    def test_negative_cycle_reported(self):
+        nodes = ["A", "B", "C", "D"]
+        edges = [
+            ("A", "B", 1.0, 0.1),
+            ("B", "C", 1.0, -0.4),
+            ("C", "D", 1.0, 0.1),
+            ("D", "B", 1.0, 0.1),
+        ]
+        graph = Graph(nodes, edges)
+
+        result = all_pairs.floyd_warshall(graph, "neglog", engine="johnson")
+        expected = all_pairs.floyd_warshall(graph, "neglog", engine="numpy")
+
+        assert result.negative_cycle_found
+        assert result.cycle == ["B", "C", "D", "B"]
+        assert result.distance_matrix == expected.distance_matrix
+
+    def test_auto_picks_engine_by_size_and_density(self):
+        def chain(size):
+            nodes = [f"N{i:04d}" for i in range(size)]
+            return Graph(nodes, [(u, v, 1.0, 0.1) for u, v in zip(nodes, nodes[1:])])
+
+        dense_nodes, dense_edges = random_graph_edges(20, 200)
+        dense = Graph(dense_nodes, dense_edges)
+
+        def auto_engine(graph):
+            return all_pairs.floyd_warshall(graph, "cost", engine="auto").engine
+
+        assert auto_engine(chain(800)) == "johnson"
+        assert auto_engine(chain(50)) == "numpy"
+        assert auto_engine(dense) == "numpy"
+
+    def test_auto_picks_johnson_on_sparse_snapshot(self):
+        """A generated ring of currency pairs, as in the sparse scenarios, scaled up."""
+        bases = sorted(BASE_VALUES)
+        values = {}
+        for i in range(1000):
+            base = bases[i % len(bases)]
+            copy = i // len(bases)
+            values[f"{base}{copy:03d}"] = BASE_VALUES[base] * (1 + 0.001 * copy)
+        nodes = list(values)
+        pairs = [
+            pair
+            for u, v in zip(nodes, nodes[1:] + nodes[:1])
+            for pair in ((u, v), (v, u))
+        ]
+        columns = GraphBuilder(CostModel(base_cost=10, extra_cost=5)).build_columns(
+            values, nodes, pairs
+        )
+        graph = columns.to_graph()
+
+        assert all_pairs.prefers_johnson(graph)
+        result = all_pairs.floyd_warshall(graph, "cost", engine="auto")
+        assert result.engine == "johnson"
+
+
 class TestMST:
     """Tests for MST algorithms."""
 
@@ -363,3 +1234,326 @@ class TestMST:
 
         assert prim_result.total_cost == kruskal_result.total_cost
         assert len(prim_result.edges) == len(kruskal_result.edges)
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    def test_prim_indexed_heap_matches_lazy(self, backend):
+        """Indexed heap picks the same edges as the lazy heap, ties included."""
+        rng = random.Random(6)
+        nodes, edges = random_graph_edges(60, 300)
+        edges = [(u, v, float(rng.randint(1, 3)), neglog) for u, v, _, neglog in edges]
+        graph = backend(nodes, edges, directed=False)
+
+        lazy = mst.mst_prim(graph)
+        indexed = mst.mst_prim(graph, heap="indexed")
+
+        assert [e.to_dict() for e in indexed.edges] == [e.to_dict() for e in lazy.edges]
+        assert indexed.total_cost == lazy.total_cost
+        assert indexed.num_components == lazy.num_components
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_prim_dense_matches_heap(self, backend, directed):
+        """Dense Prim gives the same edges and total_cost, ties and forests included."""
+        rng = random.Random(8)
+        nodes, edges = random_graph_edges(50, 400)
+        edges = [(u, v, float(rng.randint(1, 3)), neglog) for u, v, _, neglog in edges]
+        # Two isolated nodes make it a forest
+        graph = backend(nodes + ["Z1", "Z2"], edges, directed=directed)
+
+        heap = mst.mst_prim(graph)
+        dense = mst.mst_prim(graph, engine="dense")
+
+        assert [e.to_dict() for e in dense.edges] == [e.to_dict() for e in heap.edges]
+        assert dense.total_cost == heap.total_cost
+        assert dense.num_components == heap.num_components == 3
+        assert dense.is_forest
+
+    def test_prim_dense_complete_graph(self):
+        nodes, edges = random_graph_edges(30, 0)
+        edges = [
+            (u, v, round(random.Random(u + v).uniform(1.0, 20.0), 3), 0.0)
+            for u, v in itertools.permutations(nodes, 2)
+        ]
+        graph = CSRGraph(nodes, edges, directed=True).to_undirected()
+
+        assert mst.prefers_dense_prim(graph)
+        dense = mst.mst_prim(graph, engine="auto")
+        heap = mst.mst_prim(graph)
+        assert [e.to_dict() for e in dense.edges] == [e.to_dict() for e in heap.edges]
+        assert dense.total_cost == heap.total_cost
+        assert (dense.engine, heap.engine) == ("dense", "heap")
+
+        # An explicit heap asks for the heap engine, and dense cannot use one
+        assert mst.mst_prim(graph, heap="indexed", engine="auto").engine == "heap"
+        with pytest.raises(ValueError, match="heap only applies"):
+            mst.mst_prim(graph, heap="indexed", engine="dense")
+
+    def test_prim_auto_keeps_heap_on_sparse_graph(self):
+        nodes, edges = random_graph_edges(200, 300)
+
+        assert not mst.prefers_dense_prim(Graph(nodes, edges, directed=False))
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    def test_boruvka_matches_kruskal(self, backend):
+        """Same edges and total_cost as Kruskal, ties and forests included."""
+        rng = random.Random(9)
+        nodes, edges = random_graph_edges(80, 250)
+        edges = [(u, v, float(rng.randint(1, 3)), neglog) for u, v, _, neglog in edges]
+        graph = backend(nodes + ["Z1"], edges, directed=True).to_undirected()
+
+        kruskal = mst.mst_kruskal(graph)
+        boruvka = mst.mst_boruvka(graph)
+
+        assert [e.to_dict() for e in boruvka.edges] == [e.to_dict() for e in kruskal.edges]
+        assert boruvka.total_cost == kruskal.total_cost
+        assert boruvka.num_components == kruskal.num_components
+        assert boruvka.is_forest
+
+    def test_boruvka_parallel_edges_use_cheapest(self):
+        graph = Graph(
+            ["A", "B", "C"],
+            [("A", "B", 9.0, 0.0), ("B", "A", 2.0, 0.0), ("B", "C", 3.0, 0.0)],
+            directed=False,
+        )
+
+        result = mst.mst_boruvka(graph)
+
+        assert [e.to_dict() for e in result.edges] == [
+            {"u": "A", "v": "B", "weight": 2.0},
+            {"u": "B", "v": "C", "weight": 3.0},
+        ]
+        assert result.total_cost == 5.0
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    def test_sorted_edges(self, backend):
+        graph = backend(
+            ["A", "B", "C", "D"],
+            [
+                ("B", "A", 4.0, 0.0),
+                ("A", "B", 2.0, 0.0),
+                ("C", "C", 1.0, 0.0),
+                ("D", "C", 2.0, 0.0),
+                ("A", "D", 1.0, 0.0),
+            ],
+            directed=False,
+        )
+
+        edges = mst.sorted_edges(graph)
+
+        assert mst.sorted_edges(graph) is edges
+        assert list(zip(edges.costs.tolist(), edges.heads.tolist(), edges.tails.tolist())) == [
+            (1.0, 0, 3),
+            (2.0, 0, 1),
+            (2.0, 2, 3),
+        ]
+
+    def test_kruskal_parallel_edges_use_cheapest(self):
+        graph = Graph(
+            ["A", "B", "C"],
+            [("A", "B", 9.0, 0.0), ("B", "A", 2.0, 0.0), ("B", "C", 3.0, 0.0)],
+            directed=False,
+        )
+
+        assert mst.mst_kruskal(graph).total_cost == 5.0
+
+    def test_boruvka_empty_graph(self):
+        result = mst.mst_boruvka(Graph(["A"], [], directed=False))
+
+        assert result.edges == []
+        assert result.num_components == 1
+        assert not result.is_forest
+
+
+class TestIndexedHeap:
+    """Tests for the decrease-key heap."""
+
+    def test_pops_in_key_then_item_order(self):
+        heap = IndexedHeap()
+        for item, key in [("C", 2.0), ("A", 3.0), ("B", 2.0), ("D", 1.0)]:
+            heap.push_or_decrease(item, key)
+
+        assert [heap.pop() for _ in range(len(heap))] == [
+            (1.0, "D"),
+            (2.0, "B"),
+            (2.0, "C"),
+            (3.0, "A"),
+        ]
+
+    def test_decrease_key_keeps_one_entry_per_item(self):
+        heap = IndexedHeap()
+        heap.push_or_decrease("A", 5.0)
+        heap.push_or_decrease("B", 4.0)
+
+        assert heap.push_or_decrease("A", 1.0)
+        assert not heap.push_or_decrease("A", 2.0)
+        assert len(heap) == 2
+        assert "A" in heap
+        assert heap.key("A") == 1.0
+        assert heap.pop() == (1.0, "A")
+        assert "A" not in heap
+
+    def test_matches_sorted_order(self):
+        rng = random.Random(4)
+        heap = IndexedHeap()
+        best = {}
+        for _ in range(2000):
+            item, key = rng.randrange(200), rng.randint(0, 50)
+            heap.push_or_decrease(item, key)
+            best[item] = min(best.get(item, key), key)
+
+        assert len(heap) == len(best)
+        popped = [heap.pop() for _ in range(len(heap))]
+        assert popped == sorted((key, item) for item, key in best.items())
+
+
+class TestDisjointSet:
+    """Tests for the array-backed disjoint-set."""
+
+    def test_union_and_find(self):
+        ds = DisjointSet(6)
+
+        assert ds.union(0, 1)
+        assert ds.union(2, 3)
+        assert ds.union(1, 3)
+        assert not ds.union(0, 2)
+
+        assert ds.connected(0, 3)
+        assert not ds.connected(0, 4)
+        assert ds.set_size(2) == 4
+        assert ds.num_sets == 3
+        assert ds.groups() == [[0, 1, 2, 3], [4], [5]]
+
+    def test_long_chain_stays_iterative(self):
+        ds = DisjointSet(100000)
+        for x in range(1, len(ds)):
+            ds.union(x - 1, x)
+
+        assert ds.num_sets == 1
+        assert ds.find(99999) == ds.find(0)
+
+    def test_matches_union_find(self):
+        rng = random.Random(2)
+        nodes = [f"N{i:03d}" for i in range(300)]
+        uf = mst.UnionFind(nodes)
+        ds = DisjointSet(len(nodes))
+
+        for _ in range(250):
+            a, b = rng.randrange(300), rng.randrange(300)
+            assert uf.union(nodes[a], nodes[b]) == ds.union(a, b)
+
+        for _ in range(500):
+            a, b = rng.randrange(300), rng.randrange(300)
+            assert (uf.find(nodes[a]) == uf.find(nodes[b])) == ds.connected(a, b)
+
+    @pytest.mark.parametrize("backend", [Graph, CSRGraph])
+    def test_connected_components(self, backend):
+        nodes = ["A", "B", "C", "D", "E", "F"]
+        edges = [
+            ("B", "A", 1.0, 0.1),
+            ("C", "B", 1.0, 0.1),
+            ("E", "D", 1.0, 0.1),
+        ]
+        graph = backend(nodes, edges, directed=True)
+
+        assert connected_components(graph) == [["A", "B", "C"], ["D", "E"], ["F"]]
+
+
+class TestCSRGraph:
+    """Tests for the CSR backend against the dict-backed Graph."""
+
+    @pytest.fixture
+    def graphs(self):
+        nodes, edges = random_graph_edges(40, 160)
+        return Graph(nodes, edges, directed=True), CSRGraph(nodes, edges, directed=True)
+
+    def test_adjacency_matches_graph(self, graphs):
+        graph, csr = graphs
+
+        assert csr.nodes == graph.nodes
+        assert csr.num_edges == 160
+        for node in graph.nodes:
+            assert csr.get_neighbors(node) == graph.get_neighbors(node)
+        assert csr.get_all_edges("neglog") == graph.get_all_edges("neglog")
+        assert csr.get_weight("N000", "N999") is None
+
+    def test_from_graph_round_trip(self, graphs):
+        graph, _ = graphs
+        undirected = graph.to_undirected()
+
+        csr = CSRGraph.from_graph(undirected)
+
+        assert not csr.directed
+        for node in undirected.nodes:
+            assert csr.get_neighbors(node) == undirected.get_neighbors(node)
+
+    def test_traversals_match(self, graphs):
+        graph, csr = graphs
+
+        for start in ("N000", "N017"):
+            expected_bfs = traversal.bfs(graph, start)
+            actual_bfs = traversal.bfs(csr, start)
+            assert actual_bfs.order == expected_bfs.order
+            assert list(actual_bfs.parent.items()) == list(expected_bfs.parent.items())
+            assert actual_bfs.depth == expected_bfs.depth
+
+            expected_dfs = traversal.dfs(graph, start)
+            actual_dfs = traversal.dfs(csr, start)
+            assert actual_dfs.order == expected_dfs.order
+            assert actual_dfs.parent == expected_dfs.parent
+            assert actual_dfs.discovery_time == expected_dfs.discovery_time
+            assert list(actual_dfs.finish_time.items()) == list(
+                expected_dfs.finish_time.items()
+            )
+
+    def test_shortest_paths_match(self, graphs):
+        graph, csr = graphs
+
+        for target in (None, "N031"):
+            expected = shortest_path.dijkstra(graph, "N000", target)
+            actual = shortest_path.dijkstra(csr, "N000", target)
+            assert actual.found == expected.found
+            assert actual.distances == expected.distances
+            assert actual.paths == expected.paths
+
+        expected_bf = shortest_path.bellman_ford(graph, "N000")
+        actual_bf = shortest_path.bellman_ford(csr, "N000")
+        assert actual_bf.negative_cycle_found == expected_bf.negative_cycle_found
+        assert actual_bf.cycle == expected_bf.cycle
+        assert actual_bf.distances == expected_bf.distances
+        assert actual_bf.paths == expected_bf.paths
+
+    def test_bellman_ford_negative_cycle_matches(self):
+        nodes = ["A", "B", "C", "D"]
+        edges = [
+            ("A", "B", 1.0, 0.1),
+            ("B", "C", 1.0, -0.4),
+            ("C", "D", 1.0, 0.1),
+            ("D", "B", 1.0, 0.1),
+        ]
+
+        expected = shortest_path.bellman_ford(Graph(nodes, edges), "A")
+        actual = shortest_path.bellman_ford(CSRGraph(nodes, edges), "A")
+
+        assert actual.negative_cycle_found
+        assert actual.cycle == expected.cycle == ["B", "C", "D", "B"]
+
+    def test_floyd_warshall_matches(self, graphs):
+        graph, csr = graphs
+
+        expected = all_pairs.floyd_warshall(graph, "cost")
+        actual = all_pairs.floyd_warshall(csr, "cost")
+
+        assert actual.distance_matrix == expected.distance_matrix
+        assert actual.central_node == expected.central_node
+
+    def test_mst_matches(self, graphs):
+        graph, csr = graphs
+
+        for algorithm in (mst.mst_prim, mst.mst_kruskal):
+            expected = algorithm(graph)
+            actual = algorithm(csr)
+            assert [e.to_dict() for e in actual.edges] == [
+                e.to_dict() for e in expected.edges
+            ]
+            assert actual.total_cost == expected.total_cost
+            assert actual.num_components == expected.num_components
@@ -1,24 +1,32 @@
 """Tests for API endpoints."""
 
-from types import SimpleNamespace
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
+from src.graph.columns import EdgeColumns
 from src.main import app
-from src.models import GeneratedDataset, GraphMetadata, GraphNode, GraphPayload
+from src.models import CacheStats, GeneratedDataset
 
 client = TestClient(app)
 
 
 class TestHealthEndpoint:
+    @patch("src.api.health.result_cache")
     @patch("src.api.health.graph_cache")
-    def test_health_check(self, mock_cache):
-        mock_cache.latest.return_value = (
-            "id",
-            SimpleNamespace(timestamp="2025-01-12T14:30:22Z"),
-        )
+    def test_health_check(self, mock_cache, mock_results):
+        mock_cache.latest.return_value = ("id", "2025-01-12T14:30:22Z")
         mock_cache.size.return_value = 1
+        mock_cache.stats.return_value = CacheStats(
+            hits=3,
+            misses=1,
+            hit_rate=0.75,
+            evictions=0,
+            entries=1,
+            bytes=4096,
+            max_bytes=8192,
+        )
+        mock_results.stats.return_value = CacheStats(hits=1, misses=1, hit_rate=0.5)
 
         response = client.get("/health")
 
@@ -27,6 +35,16 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert data["latest_snapshot"] == "2025-01-12T14:30:22Z"
         assert data["snapshot_count"] == 1
+        assert data["graph_cache"] == {
+            "hits": 3,
+            "misses": 1,
+            "hit_rate": 0.75,
+            "evictions": 0,
+            "entries": 1,
+            "bytes": 4096,
+            "max_bytes": 8192,
+        }
+        assert data["result_cache"]["hit_rate"] == 0.5
 
 
 class TestGenerateEndpoint:
@@ -46,12 +64,9 @@ class TestGenerateEndpoint:
         mock_gen_instance.generate_custom_values.return_value = mock_dataset
 
         mock_gb_instance = mock_graph_builder.return_value
-        mock_graph_payload = GraphPayload(
-            nodes=[GraphNode(id="A"), GraphNode(id="B")],
-            edges=[],
-            metadata=GraphMetadata(node_count=2, edge_count=0),
+        mock_gb_instance.build_columns.return_value = EdgeColumns.from_lists(
+            ["A", "B"], [], [], [], []
         )
-        mock_gb_instance.build_graph.return_value = mock_graph_payload
 
         response = client.post(
             "/generate",
@@ -67,6 +82,27 @@ class TestGenerateEndpoint:
         data = response.json()
         assert data["dataset_type"] == "custom"
         assert "graph_payload" in data
+        assert data["graph_payload"]["nodes"] == [{"id": "A"}, {"id": "B"}]
+        assert data["node_count"] == 2
+        assert data["edge_count"] == 0
+
+    def test_generate_without_graph_payload(self):
+        response = client.post(
+            "/generate",
+            json={"mode": "scenario", "include_graph_payload": False},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["graph_payload"] is None
+        assert data["edge_count"] > 0
+
+        bfs = client.post(
+            "/algorithms/bfs",
+            json={"snapshot_id": data["snapshot_id"], "start_node": "USD"},
+        )
+        assert bfs.status_code == 200
+        assert len(bfs.json()["order"]) == data["node_count"]
 
     def test_generate_invalid_node(self):
         response = client.post(
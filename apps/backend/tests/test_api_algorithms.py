@@ -1,8 +1,11 @@
 """Integration tests for algorithm API endpoints."""
 
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 
+from src.algorithms import point_to_point
 from src.main import app
 
 
@@ -46,6 +49,45 @@ class TestAlgorithmEndpoints:
         assert "depth" in data
         assert data["order"][0] == "A"
 
+    def test_bfs_direction_optimizing(self, client, graph_payload):
+        def run(mode):
+            return client.post(
+                "/algorithms/bfs",
+                json={"start_node": "A", "mode": mode, "graph_payload": graph_payload},
+            ).json()
+
+        top_down = run("top_down")
+        optimized = run("direction_optimizing")
+
+        assert optimized["depth"] == top_down["depth"]
+        assert optimized["order"][0] == "A"
+
+    def test_bfs_batch_endpoint(self, client, graph_payload):
+        response = client.post(
+            "/algorithms/bfs/batch",
+            json={
+                "start_nodes": ["A", "C"],
+                "max_depth": 1,
+                "graph_payload": graph_payload,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["algorithm"] == "bfs_batch"
+        assert data["start_nodes"] == ["A", "C"]
+        assert data["depth"]["A"] == {"A": 0, "B": 1, "C": 1}
+        assert data["reachable_count"] == {"A": 3, "C": 3}
+
+    def test_bfs_batch_invalid_start(self, client, graph_payload):
+        response = client.post(
+            "/algorithms/bfs/batch",
+            json={"start_nodes": ["A", "Z"], "graph_payload": graph_payload},
+        )
+
+        assert response.status_code == 400
+
     def test_dfs_endpoint(self, client, graph_payload):
         response = client.post(
             "/algorithms/dfs", json={"start_node": "A", "graph_payload": graph_payload}
@@ -92,6 +134,90 @@ class TestAlgorithmEndpoints:
         assert "B" in data["all_distances"]
         assert "C" in data["all_distances"]
 
+    def test_bellman_ford_parent_format(self, client, graph_payload):
+        def run(path_format):
+            return client.post(
+                "/algorithms/bellman-ford",
+                json={
+                    "source": "A",
+                    "path_format": path_format,
+                    "graph_payload": graph_payload,
+                },
+            ).json()
+
+        with_paths = run("paths")
+        with_parent = run("parent")
+
+        assert with_paths["parent"] is None
+        assert with_parent["paths"] == {}
+        assert with_parent["parent"] == {"A": None, "B": "A", "C": "A"}
+        assert with_paths["paths"]["C"] == ["A", "C"]
+        assert with_parent["distances"] == with_paths["distances"]
+
+    @pytest.mark.parametrize("method", ["bidirectional", "astar"])
+    def test_dijkstra_point_to_point_methods(self, client, graph_payload, method):
+        baseline = client.post(
+            "/algorithms/dijkstra",
+            json={"source": "A", "target": "C", "graph_payload": graph_payload},
+        ).json()
+
+        response = client.post(
+            "/algorithms/dijkstra",
+            json={
+                "source": "A",
+                "target": "C",
+                "method": method,
+                "graph_payload": graph_payload,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["method"] == method
+        assert data["distance"] == pytest.approx(baseline["distance"])
+        assert data["path"] == baseline["path"]
+        assert data["all_distances"] == {"C": data["distance"]}
+        assert data["settled_nodes"] >= 1
+
+    def test_astar_builds_landmarks_only_for_cached_snapshots(
+        self, client, graph_payload
+    ):
+        request = {"source": "A", "target": "C", "method": "astar"}
+
+        with patch.object(
+            point_to_point, "Landmarks", wraps=point_to_point.Landmarks
+        ) as landmarks:
+            inline = client.post(
+                "/algorithms/dijkstra", json={**request, "graph_payload": graph_payload}
+            )
+            assert inline.status_code == 200
+            landmarks.assert_not_called()
+
+            client.post(
+                "/algorithms/dijkstra",
+                json={
+                    **request,
+                    "snapshot_id": "astar-snap",
+                    "graph_payload": graph_payload,
+                },
+            )
+            cached = client.post(
+                "/algorithms/dijkstra",
+                json={**request, "snapshot_id": "astar-snap", "target": "B"},
+            )
+            assert cached.status_code == 200
+            assert landmarks.call_count == 1
+
+        assert inline.json()["distance"] == pytest.approx(2.0)
+
+    def test_dijkstra_point_to_point_requires_target(self, client, graph_payload):
+        response = client.post(
+            "/algorithms/dijkstra",
+            json={"source": "A", "method": "astar", "graph_payload": graph_payload},
+        )
+
+        assert response.status_code == 400
+
     def test_bellman_ford_endpoint(self, client, graph_payload):
         response = client.post(
             "/algorithms/bellman-ford",
@@ -111,6 +237,88 @@ class TestAlgorithmEndpoints:
         assert "cycle" in data
         assert "distances" in data
 
+    def test_bellman_ford_incremental_endpoint(self, client, graph_payload):
+        client.post(
+            "/algorithms/bfs",
+            json={
+                "snapshot_id": "incremental-snap",
+                "start_node": "A",
+                "graph_payload": graph_payload,
+            },
+        )
+
+        def tick(updates):
+            response = client.post(
+                "/algorithms/bellman-ford/incremental",
+                json={"snapshot_id": "incremental-snap", "updates": updates},
+            )
+            assert response.status_code == 200
+            return response.json()
+
+        initial = tick([])
+        assert initial["negative_cycle_found"] is False
+
+        shock = tick([{"from": "A", "to": "B", "weight_neglog": -0.5}])
+        assert shock["appeared"] is True
+        assert shock["cycle"] == ["A", "B", "A"]
+        assert shock["updates_applied"] == 1
+
+        recovery = tick([{"from": "A", "to": "B", "weight_neglog": 0.1}])
+        assert recovery["disappeared"] is True
+        assert recovery["negative_cycle_found"] is False
+
+    def test_bellman_ford_incremental_errors(self, client, graph_payload):
+        missing = client.post(
+            "/algorithms/bellman-ford/incremental",
+            json={"snapshot_id": "no-such-snapshot", "updates": []},
+        )
+        assert missing.status_code == 404
+
+        client.post(
+            "/algorithms/bfs",
+            json={
+                "snapshot_id": "incremental-snap-2",
+                "start_node": "A",
+                "graph_payload": graph_payload,
+            },
+        )
+        unknown = client.post(
+            "/algorithms/bellman-ford/incremental",
+            json={
+                "snapshot_id": "incremental-snap-2",
+                "updates": [{"from": "A", "to": "Z", "weight_neglog": 0.1}],
+            },
+        )
+        assert unknown.status_code == 400
+
+    def test_arbitrage_cycles_endpoint(self, client, graph_payload):
+        graph_payload["edges"][0]["weight_neglog"] = -0.5
+
+        response = client.post(
+            "/algorithms/arbitrage/cycles",
+            json={"max_length": 3, "graph_payload": graph_payload},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["algorithm"] == "arbitrage_cycles"
+        assert data["complete"] is True
+        assert data["cycle_count"] == 2
+        assert [c["cycle"] for c in data["cycles"]] == [
+            ["A", "B", "A"],
+            ["A", "B", "C", "A"],
+        ]
+        assert data["cycles"][0]["profit"] == pytest.approx(0.38)
+
+    def test_arbitrage_cycles_invalid_limits(self, client, graph_payload):
+        response = client.post(
+            "/algorithms/arbitrage/cycles",
+            json={"max_length": 0, "graph_payload": graph_payload},
+        )
+
+        assert response.status_code == 422
+
     def test_floyd_warshall_endpoint_cost(self, client, graph_payload):
         response = client.post(
             "/algorithms/floyd-warshall",
@@ -142,6 +350,44 @@ class TestAlgorithmEndpoints:
         assert data["weight_mode"] == "neglog"
         assert "central_node" in data
 
+    def test_floyd_warshall_engines_agree(self, client, graph_payload):
+        responses = [
+            client.post(
+                "/algorithms/floyd-warshall",
+                json={
+                    "weight_mode": "cost",
+                    "engine": engine,
+                    "graph_payload": graph_payload,
+                },
+            )
+            for engine in ("numpy", "python")
+        ]
+
+        assert [r.status_code for r in responses] == [200, 200]
+        numpy_data, python_data = (r.json() for r in responses)
+        assert numpy_data["engine"] == "numpy"
+        assert python_data["engine"] == "python"
+        assert numpy_data["distance_matrix"] == python_data["distance_matrix"]
+        assert numpy_data["central_node"] == python_data["central_node"]
+
+    def test_floyd_warshall_johnson_negative_cycle(self, client, graph_payload):
+        graph_payload["edges"][0]["weight_neglog"] = -0.5
+
+        response = client.post(
+            "/algorithms/floyd-warshall",
+            json={
+                "weight_mode": "neglog",
+                "engine": "johnson",
+                "graph_payload": graph_payload,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["engine"] == "johnson"
+        assert data["negative_cycle_found"] is True
+        assert data["cycle"] == ["A", "B", "A"]
+
     def test_mst_prim_endpoint(self, client, graph_payload):
         response = client.post(
             "/algorithms/mst/prim", json={"graph_payload": graph_payload}
@@ -158,6 +404,67 @@ class TestAlgorithmEndpoints:
 
         assert len(data["edges"]) == 2
 
+    def test_indexed_heap_matches_lazy(self, client, graph_payload):
+        for path, body in [
+            ("/algorithms/mst/prim", {}),
+            ("/algorithms/dijkstra", {"source": "A"}),
+        ]:
+            lazy = client.post(
+                path, json={"graph_payload": graph_payload, "heap": "lazy", **body}
+            )
+            indexed = client.post(
+                path, json={"graph_payload": graph_payload, "heap": "indexed", **body}
+            )
+
+            assert indexed.status_code == 200
+            assert indexed.json() == lazy.json()
+
+    def test_mst_prim_auto_engine(self, client, graph_payload):
+        auto = client.post(
+            "/algorithms/mst/prim", json={"graph_payload": graph_payload}
+        )
+        heap = client.post(
+            "/algorithms/mst/prim",
+            json={"graph_payload": graph_payload, "engine": "heap"},
+        )
+
+        assert auto.status_code == 200
+        assert auto.json()["engine"] == "dense"
+        assert heap.json()["engine"] == "heap"
+        assert auto.json()["edges"] == heap.json()["edges"]
+        assert auto.json()["total_cost"] == heap.json()["total_cost"]
+
+    def test_mst_prim_explicit_heap(self, client, graph_payload):
+        indexed = client.post(
+            "/algorithms/mst/prim",
+            json={"graph_payload": graph_payload, "heap": "indexed"},
+        )
+        dense = client.post(
+            "/algorithms/mst/prim",
+            json={"graph_payload": graph_payload, "heap": "indexed", "engine": "dense"},
+        )
+
+        assert indexed.status_code == 200
+        assert indexed.json()["engine"] == "heap"
+        assert dense.status_code == 400
+        assert "heap only applies" in dense.json()["detail"]
+
+    def test_mst_boruvka_endpoint(self, client, graph_payload):
+        boruvka = client.post(
+            "/algorithms/mst/boruvka",
+            json={"graph_payload": graph_payload},
+        )
+        kruskal = client.post(
+            "/algorithms/mst/kruskal", json={"graph_payload": graph_payload}
+        )
+
+        assert boruvka.status_code == 200
+        data = boruvka.json()
+        assert data["algorithm"] == "mst_boruvka"
+        assert data["edges"] == kruskal.json()["edges"]
+        assert data["total_cost"] == kruskal.json()["total_cost"]
+        assert data["num_components"] == kruskal.json()["num_components"]
+
     def test_mst_kruskal_endpoint(self, client, graph_payload):
         response = client.post(
             "/algorithms/mst/kruskal", json={"graph_payload": graph_payload}
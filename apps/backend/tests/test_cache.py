@@ -0,0 +1,642 @@
+"""Tests for the snapshot graph cache."""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from src.algorithms import all_pairs, mst, point_to_point
+from src.api.algorithms import memoized
+from src.cache import (
+    CacheEntry,
+    CycleDetectorRegistry,
+    GraphCache,
+    ResultCache,
+    graph_cache,
+    result_cache,
+)
+from src.graph.columns import EdgeColumns
+from src.main import app
+from src.models import CacheStats, GraphPayload, MSTRequest, MSTResponse
+from src.snapshot_store import DiskSnapshotStore, SnapshotStore, open_snapshot_store
+
+
+@pytest.fixture
+def graph_payload():
+    return GraphPayload.model_validate(
+        {
+            "nodes": [{"id": "A"}, {"id": "B"}, {"id": "C"}],
+            "edges": [
+                {"from": "A", "to": "B", "weight_cost": 1.0, "weight_neglog": 0.1},
+                {"from": "B", "to": "A", "weight_cost": 3.0, "weight_neglog": 0.3},
+                {"from": "B", "to": "C", "weight_cost": 2.0, "weight_neglog": 0.2},
+            ],
+            "metadata": {"node_count": 3, "edge_count": 3},
+        }
+    )
+
+
+class TestGraphCache:
+    def test_set_compiles_graph_once(self, graph_payload):
+        cache = GraphCache()
+        entry = cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        assert entry.graph.directed
+        assert entry.graph.nodes == ["A", "B", "C"]
+        assert not entry.undirected_graph.directed
+        assert entry.undirected_graph.get_weight("A", "B", "cost") == 1.0
+
+        assert cache.get("snap").graph is entry.graph
+        assert cache.get("snap").undirected_graph is entry.undirected_graph
+
+    def test_compiled_graph_is_read_only(self, graph_payload):
+        cache = GraphCache()
+        entry = cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        assert isinstance(entry.graph.get_neighbors("A"), tuple)
+        with pytest.raises(AttributeError):
+            entry.graph.get_neighbors("A")[0].weight_cost = 0.0
+
+    def test_stores_edge_columns(self, graph_payload):
+        cache = GraphCache()
+        entry = cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        assert entry.columns.nodes == ["A", "B", "C"]
+        assert entry.columns.target_idx.tolist() == [1, 0, 2]
+        assert entry.graph_payload.model_dump(by_alias=True) == graph_payload.model_dump(
+            by_alias=True
+        )
+
+        from_columns = cache.set("cols", entry.columns, "2025-01-12T14:30:22Z")
+        assert from_columns.columns is entry.columns
+        assert from_columns.graph.get_all_edges() == entry.graph.get_all_edges()
+
+    def test_eviction_keeps_byte_budget(self, graph_payload):
+        entry_bytes = GraphCache().set("x", graph_payload, "ts").nbytes()
+        cache = GraphCache(max_bytes=2 * entry_bytes)
+        for key in ("a", "b", "c"):
+            cache.set(key, graph_payload, "2025-01-12T14:30:22Z")
+
+        assert cache.size() == 2
+        assert cache.get("a") is None
+        assert cache.latest()[0] == "c"
+        assert cache.stats().bytes == 2 * entry_bytes
+
+    def test_oversized_entry_is_kept_alone(self, graph_payload):
+        cache = GraphCache(max_bytes=1)
+        cache.set("a", graph_payload, "2025-01-12T14:30:22Z")
+        cache.set("b", graph_payload, "2025-01-12T14:30:22Z")
+
+        assert cache.size() == 1
+        assert cache.get("b") is not None
+
+    def test_nbytes_counts_memoized_results(self, graph_payload):
+        entry = GraphCache().set("snap", graph_payload, "2025-01-12T14:30:22Z")
+        before = entry.nbytes()
+
+        entry.graph.get_predecessors("A")
+        mst.sorted_edges(entry.undirected_graph)
+
+        assert entry.nbytes() > before
+
+    def test_remeasure_tracks_memoized_results(self, graph_payload):
+        cache = GraphCache()
+        entry = cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+        stored = cache.stats().bytes
+
+        mst.sorted_edges(entry.undirected_graph)
+        assert cache.stats().bytes == stored
+
+        cache.remeasure("snap", entry)
+        assert cache.stats().bytes == entry.nbytes() > stored
+
+    def test_remeasure_evicts_over_budget(self, graph_payload):
+        entry_bytes = GraphCache().set("x", graph_payload, "ts").nbytes()
+        cache = GraphCache(max_bytes=2 * entry_bytes)
+        a = cache.set("a", graph_payload, "2025-01-12T14:30:22Z")
+        cache.set("b", graph_payload, "2025-01-12T14:30:22Z")
+
+        a.graph.get_predecessors("A")
+        cache.remeasure("a", a)
+
+        assert list(cache._cache) == ["b"]
+        assert cache.stats().bytes == entry_bytes
+
+    def test_stats(self, graph_payload):
+        cache = GraphCache(max_bytes=1)
+        cache.set("a", graph_payload, "2025-01-12T14:30:22Z")
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+        cache.set("b", graph_payload, "2025-01-12T14:30:22Z")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (2, 1, 1)
+        assert stats.entries == 1
+        assert stats.bytes == cache.get("b").nbytes()
+        assert stats.max_bytes == 1
+
+
+class TestDiskSnapshotStore:
+    def test_round_trip_is_memory_mapped(self, tmp_path, graph_payload):
+        store = DiskSnapshotStore(tmp_path)
+        entry = GraphCache().set("2025-01-12T14-30-22Z_live/USD", graph_payload, "ts")
+        store.save("2025-01-12T14-30-22Z_live/USD", entry.columns, "ts")
+
+        columns, timestamp, version = store.load("2025-01-12T14-30-22Z_live/USD")
+
+        assert timestamp == "ts"
+        assert version == store.version("2025-01-12T14-30-22Z_live/USD")
+        assert columns.nodes == ["A", "B", "C"]
+        assert isinstance(columns.weight_cost, np.memmap)
+        assert columns.edge_tuples() == entry.columns.edge_tuples()
+        assert [p.name for p in tmp_path.iterdir()] == [
+            "2025-01-12T14-30-22Z_live%2FUSD.snap"
+        ]
+
+    def test_empty_snapshot(self, tmp_path):
+        store = DiskSnapshotStore(tmp_path)
+        store.save("empty", EdgeColumns.from_lists(["A"], [], [], [], []), "ts")
+
+        columns, _, _ = store.load("empty")
+        assert columns.nodes == ["A"]
+        assert len(columns) == 0
+
+    def test_missing_snapshot(self, tmp_path):
+        store = DiskSnapshotStore(tmp_path)
+        assert store.load("missing") is None
+        assert "missing" not in store
+        assert store.latest_key() is None
+        assert len(store) == 0
+
+    def test_long_keys_are_hashed(self, tmp_path):
+        store = DiskSnapshotStore(tmp_path, max_snapshots=1)
+        key = "снимок/" * 40
+        columns = EdgeColumns.from_lists(["A"], [], [], [], [])
+        store.save(key, columns, "ts")
+
+        [path] = tmp_path.iterdir()
+        assert len(path.name.encode()) < 255
+        assert store.load(key)[1] == "ts"
+        assert store.latest_key() == key
+
+        store.save("short", columns, "ts")
+        os.utime(store._path(key), ns=(0, 0))
+        assert store.expired_keys() == [key]
+        assert store.delete(key)
+
+    def test_retention_reports_oldest_snapshots(self, tmp_path):
+        store = DiskSnapshotStore(tmp_path, max_snapshots=2)
+        columns = EdgeColumns.from_lists(["A"], [], [], [], [])
+        for i, key in enumerate(["a", "b", "c"]):
+            store.save(key, columns, "ts")
+            os.utime(store._path(key), ns=(i * 10**9, i * 10**9))
+
+        assert store.expired_keys() == ["a"]
+        assert store.delete("a")
+        assert not store.delete("a")
+        assert store.expired_keys() == []
+
+        store.max_age_seconds = 60
+        assert sorted(store.expired_keys()) == ["b", "c"]
+
+    def test_store_requires_every_method(self):
+        with pytest.raises(TypeError):
+            SnapshotStore()
+
+    def test_unknown_backend(self, tmp_path):
+        assert open_snapshot_store("memory", tmp_path) is None
+        with pytest.raises(ValueError, match="Unknown snapshot store backend"):
+            open_snapshot_store("redis", tmp_path)
+
+
+class TestDiskBackedGraphCache:
+    def test_get_and_latest_match_memory_backend(self, tmp_path, graph_payload):
+        memory = GraphCache()
+        disk = GraphCache(store=DiskSnapshotStore(tmp_path))
+        for cache in (memory, disk):
+            cache.set("a", graph_payload, "2025-01-12T14:30:22Z")
+            cache.set("b", graph_payload, "2025-01-12T14:31:00Z")
+
+        for cache in (memory, disk):
+            assert cache.latest() == ("b", "2025-01-12T14:31:00Z")
+            edges = cache.get("a").graph.get_all_edges()
+            assert edges == memory.get("a").graph.get_all_edges()
+            assert cache.get("missing") is None
+            assert cache.size() == 2
+            assert "a" in cache
+
+    def test_other_worker_reads_and_sees_overwrites(self, tmp_path, graph_payload):
+        writer = GraphCache(store=DiskSnapshotStore(tmp_path))
+        reader = GraphCache(store=DiskSnapshotStore(tmp_path))
+        writer.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        entry = reader.get("snap")
+        assert entry.graph.get_weight("A", "B", "cost") == 1.0
+        assert isinstance(entry.columns.source_idx, np.memmap)
+        assert reader.get("snap") is entry
+
+        changed = graph_payload.model_copy(deep=True)
+        changed.edges[0].weight_cost = 7.0
+        writer.set("snap", changed, "2025-01-12T14:31:00Z")
+
+        assert reader.get("snap").graph.get_weight("A", "B", "cost") == 7.0
+        assert reader.latest() == ("snap", "2025-01-12T14:31:00Z")
+
+    def test_latest_reads_only_the_header(self, tmp_path, graph_payload):
+        GraphCache(store=DiskSnapshotStore(tmp_path)).set(
+            "snap", graph_payload, "2025-01-12T14:30:22Z"
+        )
+        cold = GraphCache(store=DiskSnapshotStore(tmp_path))
+
+        with patch.object(CacheEntry, "build") as build:
+            assert cold.latest() == ("snap", "2025-01-12T14:30:22Z")
+
+        build.assert_not_called()
+        stats = cold.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (0, 0, 0)
+
+    def test_compiled_entries_are_bounded(self, tmp_path, graph_payload):
+        cache = GraphCache(max_bytes=1, store=DiskSnapshotStore(tmp_path))
+        cache.set("a", graph_payload, "2025-01-12T14:30:22Z")
+        cache.set("b", graph_payload, "2025-01-12T14:30:22Z")
+
+        assert list(cache._cache) == ["b"]
+        assert cache.size() == 2
+        assert cache.get("a") is not None
+        assert list(cache._cache) == ["a"]
+
+    def test_retention_deletes_from_disk_and_cache(self, tmp_path, graph_payload):
+        removed = []
+        cache = GraphCache(store=DiskSnapshotStore(tmp_path, max_snapshots=2))
+        cache.on_remove(removed.append)
+        for key in ("a", "b", "c"):
+            cache.set(key, graph_payload, "2025-01-12T14:30:22Z")
+
+        assert cache.size() == 2
+        assert "a" not in cache
+        assert "a" not in cache._cache
+        assert "a" in removed
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["b.snap", "c.snap"]
+
+    def test_delete(self, tmp_path, graph_payload):
+        cache = GraphCache(store=DiskSnapshotStore(tmp_path))
+        cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        assert cache.delete("snap")
+        assert cache.get("snap") is None
+        assert not cache.delete("snap")
+        assert cache.size() == 0
+
+
+class TestCycleDetectorRegistry:
+    def test_detector_reused_per_entry(self, graph_payload):
+        cache = GraphCache()
+        registry = CycleDetectorRegistry(cache)
+        cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        detector = registry.get("snap")
+        assert registry.get("snap") is detector
+
+        cache.set("snap", graph_payload, "2025-01-12T14:31:00Z")
+        assert registry.get("snap") is not detector
+
+    def test_evicted_snapshot_has_no_detector(self, graph_payload):
+        cache = GraphCache(max_bytes=1)
+        registry = CycleDetectorRegistry(cache)
+        cache.set("a", graph_payload, "2025-01-12T14:30:22Z")
+        registry.get("a")
+
+        cache.set("b", graph_payload, "2025-01-12T14:30:22Z")
+
+        assert registry.get("a") is None
+        assert registry.get("b") is not None
+        assert list(registry._detectors) == ["b"]
+
+    def test_detector_counts_against_entry(self, graph_payload):
+        cache = GraphCache()
+        registry = CycleDetectorRegistry(cache)
+        entry = cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        detector = registry.get("snap")
+
+        assert cache.stats().bytes == entry.nbytes() + detector.nbytes()
+
+    def test_disk_backed_registry_drops_evicted_detectors(
+        self, tmp_path, graph_payload
+    ):
+        cache = GraphCache(max_bytes=1, store=DiskSnapshotStore(tmp_path))
+        registry = CycleDetectorRegistry(cache)
+        for key in ("a", "b", "c"):
+            cache.set(key, graph_payload, "2025-01-12T14:30:22Z")
+            registry.get(key)
+
+        # a and b are still on disk but no longer compiled
+        assert "a" in cache
+        assert list(registry._detectors) == ["c"]
+
+
+class TestResultCache:
+    def test_result_tied_to_entry(self, graph_payload):
+        cache = GraphCache()
+        results = ResultCache(cache)
+        entry = cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+        results.put(("snap", "bfs", "{}"), entry, b'{"hits":1}')
+
+        assert results.get(("snap", "bfs", "{}"), entry) == b'{"hits":1}'
+        assert results.get(("snap", "dfs", "{}"), entry) is None
+
+        other = CacheEntry.build(graph_payload, "2025-01-12T14:30:22Z")
+        assert results.get(("snap", "bfs", "{}"), other) is None
+        assert results.stats().entries == 0
+
+    def test_invalidated_on_overwrite_and_eviction(self, graph_payload):
+        entry_bytes = GraphCache().set("x", graph_payload, "ts").nbytes()
+        cache = GraphCache(max_bytes=2 * entry_bytes)
+        results = ResultCache(cache)
+        for key in ("a", "b"):
+            entry = cache.set(key, graph_payload, "2025-01-12T14:30:22Z")
+            results.put((key, "bfs", "{}"), entry, b"{}")
+        assert results.stats().entries == 2
+
+        cache.set("b", graph_payload, "2025-01-12T14:31:00Z")
+        assert results.stats().entries == 1
+
+        cache.set("c", graph_payload, "2025-01-12T14:31:00Z")
+        assert results.stats().entries == 0
+
+    def test_byte_budget_and_stats(self, graph_payload):
+        cache = GraphCache()
+        entry = cache.set("snap", graph_payload, "2025-01-12T14:30:22Z")
+        body = CacheStats().model_dump_json().encode()
+        size = len(body)
+        results = ResultCache(cache, max_bytes=2 * size)
+        for name in ("bfs", "dfs", "mst"):
+            results.put(("snap", name, "{}"), entry, body)
+
+        assert results.get(("snap", "bfs", "{}"), entry) is None
+        assert results.get(("snap", "mst", "{}"), entry) is not None
+
+        stats = results.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+        assert (stats.entries, stats.bytes, stats.max_bytes) == (2, 2 * size, 2 * size)
+
+
+class TestCachedAlgorithmRequests:
+    def test_snapshot_requests_skip_graph_construction(self, graph_payload):
+        client = TestClient(app)
+        graph_cache.set("compiled-snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        with patch(
+            "src.algorithms.graph.Graph.from_graph_payload"
+        ) as from_payload, patch(
+            "src.algorithms.graph.Graph.to_undirected"
+        ) as to_undirected:
+            bfs = client.post(
+                "/algorithms/bfs",
+                json={"snapshot_id": "compiled-snap", "start_node": "A"},
+            )
+            prim = client.post(
+                "/algorithms/mst/prim", json={"snapshot_id": "compiled-snap"}
+            )
+
+        assert bfs.status_code == 200
+        assert bfs.json()["order"] == ["A", "B", "C"]
+        assert prim.status_code == 200
+        assert prim.json()["total_cost"] == 3.0
+        from_payload.assert_not_called()
+        to_undirected.assert_not_called()
+
+    def test_repeated_mst_requests_sort_edges_once(self, graph_payload):
+        client = TestClient(app)
+        entry = graph_cache.set("mst-snap", graph_payload, "2025-01-12T14:30:22Z")
+
+        with patch.object(
+            mst, "_build_sorted_edges", wraps=mst._build_sorted_edges
+        ) as build:
+            responses = [
+                client.post(f"/algorithms/mst/{name}", json={"snapshot_id": "mst-snap"})
+                for name in ("kruskal", "boruvka", "kruskal")
+            ]
+
+        assert all(r.status_code == 200 for r in responses)
+        assert {r.json()["total_cost"] for r in responses} == {3.0}
+        build.assert_called_once_with(entry.undirected_graph)
+
+    def test_repeated_requests_are_memoized(self, graph_payload):
+        client = TestClient(app)
+        graph_cache.set("memo-snap", graph_payload, "2025-01-12T14:30:22Z")
+        request = {"snapshot_id": "memo-snap", "weight_mode": "cost"}
+
+        with patch.object(
+            all_pairs, "floyd_warshall", wraps=all_pairs.floyd_warshall
+        ) as floyd_warshall:
+            first = client.post("/algorithms/floyd-warshall", json=request)
+            second = client.post(
+                "/algorithms/floyd-warshall",
+                json={**request, "engine": "numpy", "workers": 4},
+            )
+            assert floyd_warshall.call_count == 1
+            assert second.json() == first.json()
+
+            client.post(
+                "/algorithms/floyd-warshall", json={**request, "weight_mode": "neglog"}
+            )
+            assert floyd_warshall.call_count == 2
+
+            graph_cache.set("memo-snap", graph_payload, "2025-01-12T14:31:00Z")
+            client.post("/algorithms/floyd-warshall", json=request)
+            assert floyd_warshall.call_count == 3
+
+    def test_unread_options_share_a_memo_entry(self, graph_payload):
+        client = TestClient(app)
+        graph_cache.set("knob-snap", graph_payload, "2025-01-12T14:30:22Z")
+        kruskal_requests = [
+            {},
+            {"heap": "indexed"},
+            {"engine": "dense"},
+        ]
+        dijkstra = {"source": "A", "target": "C", "method": "bidirectional"}
+        dijkstra_requests = [{}, {"landmarks": 0}, {"heap": "indexed"}]
+
+        with patch.object(
+            mst, "mst_kruskal", wraps=mst.mst_kruskal
+        ) as kruskal, patch.object(
+            point_to_point,
+            "bidirectional_dijkstra",
+            wraps=point_to_point.bidirectional_dijkstra,
+        ) as bidirectional:
+            for extra in kruskal_requests:
+                response = client.post(
+                    "/algorithms/mst/kruskal",
+                    json={"snapshot_id": "knob-snap", **extra},
+                )
+                assert response.status_code == 200
+            for extra in dijkstra_requests:
+                response = client.post(
+                    "/algorithms/dijkstra",
+                    json={"snapshot_id": "knob-snap", **dijkstra, **extra},
+                )
+                assert response.status_code == 200
+
+        assert kruskal.call_count == 1
+        assert bidirectional.call_count == 1
+
+    def test_each_request_looks_up_the_snapshot_once(self, graph_payload):
+        client = TestClient(app)
+        graph_cache.set("lookup-snap", graph_payload, "2025-01-12T14:30:22Z")
+        request = {"snapshot_id": "lookup-snap", "start_node": "A"}
+
+        for _ in range(2):
+            before = graph_cache.stats()
+            response = client.post("/algorithms/bfs", json=request)
+            after = graph_cache.stats()
+            assert response.status_code == 200
+            assert (after.hits - before.hits, after.misses - before.misses) == (1, 0)
+
+        before = graph_cache.stats()
+        missing = client.post(
+            "/algorithms/bfs", json={**request, "snapshot_id": "no-such-snap"}
+        )
+        after = graph_cache.stats()
+        assert missing.status_code == 404
+        assert (after.hits - before.hits, after.misses - before.misses) == (0, 1)
+
+    def test_hits_serve_the_stored_json(self, graph_payload):
+        client = TestClient(app)
+        graph_cache.set("json-snap", graph_payload, "2025-01-12T14:30:22Z")
+        request = {"snapshot_id": "json-snap", "start_node": "A"}
+        payload = graph_payload.model_dump(by_alias=True)
+        inline = client.post(
+            "/algorithms/bfs", json={"graph_payload": payload, "start_node": "A"}
+        ).json()
+
+        first = client.post("/algorithms/bfs", json=request)
+        bytes_before = result_cache.stats().bytes
+        second = client.post("/algorithms/bfs", json=request)
+
+        assert second.content == first.content
+        assert second.headers["content-type"] == "application/json"
+        assert result_cache.stats().bytes == bytes_before
+        assert {**first.json(), "snapshot_id": "local"} == inline
+
+    def test_inline_payload_requests_are_not_memoized(self, graph_payload):
+        client = TestClient(app)
+        request = {"graph_payload": graph_payload.model_dump(by_alias=True)}
+        hits = result_cache.stats().hits
+
+        with patch.object(mst, "mst_kruskal", wraps=mst.mst_kruskal) as kruskal:
+            for _ in range(2):
+                response = client.post("/algorithms/mst/kruskal", json=request)
+                assert response.status_code == 200
+
+        assert kruskal.call_count == 2
+        assert result_cache.stats().hits == hits
+
+
+class TestSingleFlight:
+    @staticmethod
+    def slow_handler(calls, release):
+        @memoized("single_flight_test")
+        async def handler(request, entry=None):
+            calls.append(request.snapshot_id)
+            await release.wait()
+            if request.snapshot_id == "failing-snap":
+                raise ValueError("boom")
+            return MSTResponse(
+                snapshot_id=request.snapshot_id,
+                algorithm="single_flight_test",
+                edges=[],
+                total_cost=float(len(calls)),
+                is_forest=False,
+                num_components=1,
+            )
+
+        return handler
+
+    def test_concurrent_requests_share_one_computation(self, graph_payload):
+        graph_cache.set("flight-snap", graph_payload, "2025-01-12T14:30:22Z")
+        calls = []
+
+        async def scenario():
+            release = asyncio.Event()
+            handler = self.slow_handler(calls, release)
+            request = MSTRequest(snapshot_id="flight-snap")
+            pending = [asyncio.ensure_future(handler(request)) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            responses = await asyncio.gather(*pending)
+            return responses, await handler(request)
+
+        responses, later = asyncio.run(scenario())
+
+        assert calls == ["flight-snap"]
+        assert all(response.body == responses[0].body for response in responses)
+        assert later.body == responses[0].body
+
+    def test_errors_are_shared_and_not_cached(self, graph_payload):
+        graph_cache.set("failing-snap", graph_payload, "2025-01-12T14:30:22Z")
+        calls = []
+
+        async def scenario():
+            release = asyncio.Event()
+            handler = self.slow_handler(calls, release)
+            request = MSTRequest(snapshot_id="failing-snap")
+            pending = [asyncio.ensure_future(handler(request)) for _ in range(2)]
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(*pending, return_exceptions=True)
+
+        errors = asyncio.run(scenario())
+
+        assert calls == ["failing-snap"]
+        assert all(isinstance(error, ValueError) for error in errors)
+
+        asyncio.run(scenario())
+        assert calls == ["failing-snap"] * 2
+
+    def test_overwritten_snapshot_starts_a_new_computation(self, graph_payload):
+        graph_cache.set("flight-overwrite", graph_payload, "2025-01-12T14:30:22Z")
+        calls = []
+
+        async def scenario():
+            release = asyncio.Event()
+            handler = self.slow_handler(calls, release)
+            request = MSTRequest(snapshot_id="flight-overwrite")
+            first = asyncio.ensure_future(handler(request))
+            await asyncio.sleep(0)
+            graph_cache.set("flight-overwrite", graph_payload, "2025-01-12T14:31:00Z")
+            second = asyncio.ensure_future(handler(request))
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(first, second)
+
+        first, second = asyncio.run(scenario())
+
+        assert calls == ["flight-overwrite"] * 2
+
+    def test_result_for_overwritten_entry_is_not_stored(self, graph_payload):
+        graph_cache.set("flight-stale", graph_payload, "2025-01-12T14:30:22Z")
+        calls = []
+
+        async def scenario():
+            release = asyncio.Event()
+            handler = self.slow_handler(calls, release)
+            pending = asyncio.ensure_future(
+                handler(MSTRequest(snapshot_id="flight-stale"))
+            )
+            await asyncio.sleep(0)
+            graph_cache.set("flight-stale", graph_payload, "2025-01-12T14:31:00Z")
+            entries = result_cache.stats().entries
+            release.set()
+            await pending
+            return entries
+
+        entries = asyncio.run(scenario())
+
+        assert calls == ["flight-stale"]
+        assert result_cache.stats().entries == entries
@@ -1,9 +1,13 @@
 """Tests for graph builder and weight calculations."""
 
 import math
+
+import numpy as np
 import pytest
 
+from src.algorithms.graph import Graph
 from src.graph.builder import GraphBuilder
+from src.graph.columns import EdgeColumns
 from src.graph.weights import WeightCalculator
 from src.models import CostModel
 
@@ -53,6 +57,38 @@ class TestWeightCalculator:
         assert weight_cost == 15
         assert abs(weight_neglog - (-math.log(0.91862))) < 1e-5
 
+    def test_calculate_all_weights_batch(self):
+        raw_values = np.array([0.92, 1.5, 0.6])
+        base_costs = np.array([10.0, 12.0, 8.0])
+        extra_costs = np.array([5.0, 4.0, 6.0])
+
+        totals, effective, costs, neglogs = WeightCalculator.calculate_all_weights_batch(
+            raw_values, base_costs, extra_costs
+        )
+
+        for i in range(3):
+            expected = WeightCalculator.calculate_all_weights(
+                raw_values[i], base_costs[i], extra_costs[i]
+            )
+            assert totals[i] == expected[0]
+            assert effective[i] == expected[1]
+            assert costs[i] == expected[2]
+            assert neglogs[i] == pytest.approx(expected[3], rel=1e-15)
+
+    def test_calculate_all_weights_batch_names_first_invalid(self):
+        raw_values = np.array([1.0, 1.0, -2.0, 1.0])
+        base_costs = np.array([10.0, 10.0, 10.0, 20000.0])
+        extra_costs = np.zeros(4)
+
+        with pytest.raises(ValueError, match=r"got -2.0 \(edge 2\)"):
+            WeightCalculator.calculate_all_weights_batch(
+                raw_values, base_costs, extra_costs, describe=lambda i: f"edge {i}"
+            )
+        with pytest.raises(ValueError, match=r"non-positive \(index 1\)"):
+            WeightCalculator.calculate_all_weights_batch(
+                raw_values[[0, 3]], base_costs[[0, 3]], extra_costs[[0, 3]]
+            )
+
 
 class TestGraphBuilder:
     def test_build_pairs(self, sample_node_values):
@@ -154,3 +190,62 @@ class TestGraphBuilder:
         assert len(graph.edges) == 1
         assert graph.edges[0].source == "A"
         assert graph.edges[0].target == "B"
+
+    def test_pairs_skip_valued_node_outside_nodes(self, sample_node_values):
+        builder = GraphBuilder(CostModel(base_cost=10, extra_cost=5))
+
+        # C has a value but is not a graph node, so its pairs are dropped
+        graph = builder.build_graph(
+            node_values=sample_node_values,
+            nodes=["A", "B"],
+            pairs=[("A", "B"), ("B", "C"), ("C", "A")],
+        )
+
+        assert [node.id for node in graph.nodes] == ["A", "B"]
+        assert [(e.source, e.target) for e in graph.edges] == [("A", "B")]
+
+        with pytest.raises(ValueError, match="No valid node pairs found"):
+            builder.build_graph(sample_node_values, ["A", "B"], [("B", "C")])
+
+    def test_build_columns_matches_build_graph(self, sample_node_values, sample_nodes):
+        builder = GraphBuilder(CostModel(base_cost=10, extra_cost=5))
+
+        columns = builder.build_columns(sample_node_values, sample_nodes)
+        payload = builder.build_graph(sample_node_values, sample_nodes)
+
+        assert columns.nodes == [node.id for node in payload.nodes]
+        assert len(columns) == payload.metadata.edge_count == 90
+        assert columns.edge_tuples() == [
+            (e.source, e.target, e.weight_cost, e.weight_neglog) for e in payload.edges
+        ]
+
+    def test_columns_round_trip(self, sample_node_values, sample_pairs):
+        builder = GraphBuilder(CostModel(base_cost=10, extra_cost=5))
+        payload = builder.build_graph(sample_node_values, ["A", "B", "C", "D"], sample_pairs)
+
+        columns = EdgeColumns.from_payload(payload)
+
+        assert columns.to_payload().model_dump(by_alias=True) == payload.model_dump(
+            by_alias=True
+        )
+        graph = Graph.from_graph_payload(payload.model_dump(by_alias=True))
+        assert columns.to_graph().get_all_edges() == graph.get_all_edges()
+        with pytest.raises(ValueError):
+            columns.weight_cost[0] = 0.0
+
+    def test_columns_reject_unknown_node(self, sample_node_values):
+        builder = GraphBuilder(CostModel(base_cost=10, extra_cost=5))
+        payload = builder.build_graph(sample_node_values, ["A", "B"], [("A", "B")])
+        payload.nodes.pop()
+
+        with pytest.raises(ValueError, match="Unknown node in edge: B"):
+            EdgeColumns.from_payload(payload)
+
+    def test_build_columns_error_names_pair(self, sample_node_values):
+        builder = GraphBuilder(CostModel(base_cost=6000, extra_cost=0))
+
+        # A -> B (raw 0.92) stays under 10000 per-10k units; A -> J (raw 1.82) does not
+        with pytest.raises(ValueError, match="non-positive \\(pair A -> J\\)"):
+            builder.build_columns(
+                sample_node_values, ["A", "B", "J"], [("A", "B"), ("A", "J")]
+            )
@@ -54,7 +54,7 @@ export const GenerationResponseSchema = z.object({
   edge_count: z.number(),
   dataset_type: z.string(),
   scenario_id: z.string().optional().nullable(),
-  graph_payload: GraphPayloadSchema,
+  graph_payload: GraphPayloadSchema.nullable().optional(),
 });
 
 export const BFSRequestSchema = z.object({
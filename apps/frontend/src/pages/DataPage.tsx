@@ -33,6 +33,9 @@ export function DataPage() {
       setCreating(true);
       setError(null);
       const response = await generateSnapshot(apiBaseUrl, config);
+      if (!response.graph_payload) {
+        throw new Error('Generated snapshot has no graph_payload');
+      }
       await saveSnapshot({
         id: response.snapshot_id,
         created_at: response.timestamp,